@@ -7,6 +7,7 @@ from typing import Any
 from django.conf import settings
 from django.db import DatabaseError
 from django.db.models import Max, Min, Q
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 
 from crawler.client import TelegramAPIClient
@@ -15,6 +16,7 @@ from crawler.media_handler import MediaHandler
 from crawler.reference_resolver import ReferenceResolver
 from webapp.models import (
     Channel,
+    ChannelEdgeDaily,
     Message,
     MessageReaction,
     MessageReply,
@@ -151,6 +153,21 @@ class ChannelCrawler:
         self.api_client = api_client
         self.media_handler = media_handler
         self.reference_resolver = reference_resolver
+        # Channel pk → local days whose ChannelEdgeDaily rows are stale (None = every day).
+        self._stale_edge_days: dict[int, set[datetime.date | None] | None] = {}
+
+    def _mark_edges_stale(self, channel_pk: int, days: set[datetime.date | None] | None = None) -> None:
+        """Queue ChannelEdgeDaily rows of *channel_pk* for recomputation; ``days=None`` means all of them."""
+        if days is None or channel_pk in self._stale_edge_days and self._stale_edge_days[channel_pk] is None:
+            self._stale_edge_days[channel_pk] = None
+        else:
+            self._stale_edge_days.setdefault(channel_pk, set()).update(days)
+
+    def flush_channel_edges(self) -> None:
+        """Recompute the ChannelEdgeDaily rows queued by the message-writing methods."""
+        while self._stale_edge_days:
+            channel_pk, days = self._stale_edge_days.popitem()
+            ChannelEdgeDaily.objects.refresh(channel_pk, days)
 
     def set_more_channel_details(self, channel: Channel, telegram_channel: Any) -> None:
         if isinstance(telegram_channel, User):
@@ -455,6 +472,7 @@ class ChannelCrawler:
             image_count += hole_image_count
 
         self._resolve_pending_forwards(status_callback)
+        self.flush_channel_edges()
         channel.are_messages_crawled = True
         channel.is_lost = False
         channel.is_private = False
@@ -553,6 +571,7 @@ class ChannelCrawler:
         message.save()
         _save_reactions(message.pk, telegram_message)
         _save_poll(message.pk, telegram_message)
+        self._mark_edges_stale(channel.pk, {timezone.localdate(message.date) if message.date else None})
         return True, downloaded_images
 
     def _resolve_pending_forwards(self, status_callback: Callable[[str], None] | None = None) -> None:
@@ -579,7 +598,12 @@ class ChannelCrawler:
             try:
                 telegram_channel = self.api_client.client.get_entity(channel_id)
                 resolved = Channel.from_telegram_object(telegram_channel, force_update=True)
-                Message.objects.filter(pending_forward_telegram_id=channel_id).update(
+                pending_qs = Message.objects.filter(pending_forward_telegram_id=channel_id)
+                for message_channel_pk, day in (
+                    pending_qs.annotate(day=TruncDate("date")).values_list("channel_id", "day").distinct()
+                ):
+                    self._mark_edges_stale(message_channel_pk, {day})
+                pending_qs.update(
                     forwarded_from=resolved,
                     pending_forward_telegram_id=None,
                 )
@@ -665,6 +689,7 @@ class ChannelCrawler:
         updated = 0
         service_cleaned = 0
         newly_lost_inline = 0
+        recovered_inline = 0
         visited_ids: set[int] = set()
         limit_hit = False
         for telegram_message in self.api_client.client.iter_messages(
@@ -718,6 +743,7 @@ class ChannelCrawler:
                     update_kwargs.pop("replies", None)
                 if msg_row["is_lost"]:
                     update_kwargs["is_lost"] = False
+                    recovered_inline += 1
                 # Monotonic stats guard: restricted-channel responses sometimes
                 # return zero counters even when the post is still up. Refuse to
                 # downgrade views/forwards/replies — keep the last-known-good
@@ -750,6 +776,8 @@ class ChannelCrawler:
             notes.append(f"{total_lost} marked lost")
         suffix = f" ({', '.join(notes)})" if notes else ""
         update_status(f"refreshing message stats … {updated}/{total_in_db}{suffix}")
+        if service_cleaned or total_lost or recovered_inline:
+            self._mark_edges_stale(channel.pk)
         return updated
 
     def retry_lost_messages(
@@ -814,6 +842,8 @@ class ChannelCrawler:
                 Message.objects.filter(pk=msg_pk).update(is_lost=False, _updated=now)
                 recovered += 1
             update_status(f"retrying lost messages … {recovered + still_lost}/{total}")
+        if recovered:
+            self._mark_edges_stale(channel.pk)
         return recovered, still_lost
 
     def get_recommended_channels(self, channel: Channel) -> tuple[int, int]:
@@ -957,6 +987,13 @@ class ChannelCrawler:
         return total_upserted
 
     def get_missing_references(self, status_callback=None, force_retry: bool = False, channel_qs=None) -> None:
+        pending_qs = Message.objects.exclude(missing_references="")
+        if channel_qs is not None:
+            pending_qs = pending_qs.filter(channel__in=channel_qs)
+        pending_channel_pks = set(pending_qs.values_list("channel_id", flat=True).distinct())
         self.reference_resolver.get_missing_references(
             status_callback=status_callback, force_retry=force_retry, channel_qs=channel_qs
         )
+        for channel_pk in pending_channel_pks:
+            self._mark_edges_stale(channel_pk)
+        self.flush_channel_edges()
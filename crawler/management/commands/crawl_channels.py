@@ -1229,6 +1229,9 @@ class Command(BaseCommand):
                             if retry_lost_messages:
                                 self._retry_lost_for_channel(channel, crawler, index, total_channels, printer)
 
+                            crawler.flush_channel_edges()
+
+                        crawler.flush_channel_edges()
                         printer.newline()
 
                         if retry_references:
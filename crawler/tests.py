@@ -9,7 +9,7 @@ from django.utils import timezone
 from crawler.channel_crawler import ChannelCrawler
 from crawler.hole_fixer import find_missing_message_ids, fix_message_holes, iter_hole_ranges
 from crawler.reference_resolver import ReferenceResolver
-from webapp.models import Channel, Message, Organization
+from webapp.models import Channel, ChannelEdgeDaily, Message, Organization
 
 from telethon import errors
 
@@ -1676,6 +1676,19 @@ class ChannelCrawlerPendingForwardsTests(TestCase):
         self.assertIsNone(self.msg.pending_forward_telegram_id)
         self.assertEqual(self.msg.forwarded_from, fwd_channel)
 
+    def test_get_message_queues_edge_rows_until_flush(self) -> None:
+        fwd_channel = Channel.objects.create(telegram_id=7777, organization=self.org)
+        tm = self._make_tg_message(msg_id=101, fwd_channel_id=fwd_channel.telegram_id)
+
+        self.crawler.get_message(self.source_channel, tm)
+        self.assertFalse(ChannelEdgeDaily.objects.exists())
+        self.crawler.flush_channel_edges()
+
+        forward = ChannelEdgeDaily.objects.get(kind=ChannelEdgeDaily.FORWARD)
+        self.assertEqual((forward.channel, forward.cited_channel, forward.count), (self.source_channel, fwd_channel, 1))
+        messages = ChannelEdgeDaily.objects.get(kind=ChannelEdgeDaily.MESSAGES, channel=self.source_channel)
+        self.assertEqual(messages.count, 2)  # setUp's message shares the undated bucket
+
     # -- _resolve_pending_forwards reads from DB --
 
     def test_resolve_pending_does_nothing_when_db_empty(self) -> None:
@@ -1726,6 +1739,16 @@ class ChannelCrawlerPendingForwardsTests(TestCase):
             self.assertEqual(m.forwarded_from.telegram_id, 4444)
             self.assertIsNone(m.pending_forward_telegram_id)
 
+    def test_resolve_pending_refreshes_forward_edge_rows(self) -> None:
+        self._set_pending(5555)
+        self.api_client.client.get_entity.return_value = _make_telegram_channel(telegram_id=5555, username="fwdchan")
+
+        self.crawler._resolve_pending_forwards()
+        self.crawler.flush_channel_edges()
+
+        forward = ChannelEdgeDaily.objects.get(kind=ChannelEdgeDaily.FORWARD)
+        self.assertEqual(forward.cited_channel.telegram_id, 5555)
+
     def test_resolve_pending_marks_private_channel(self) -> None:
         self._set_pending(3333)
         err = errors.rpcerrorlist.ChannelPrivateError.__new__(errors.rpcerrorlist.ChannelPrivateError)
@@ -0,0 +1,189 @@
+"""On-disk cache of the measures and partitions computed from an analysis graph.
+
+Reruns of ``structural_analysis`` that only change presentation options
+(palette, SEO, extra layouts, output formats) rebuild an identical graph, so
+its node measures and community partitions can be read back instead of being
+recomputed. Entries are content-addressed: the key hashes
+
+- the graph fingerprint — node ids, insertion order, edges and weights, taken
+  from the shared ``CSRGraph`` view;
+- the kind of result and its parameters (e.g. the ``apply_*`` function name
+  and its keyword arguments, or the community strategy and its resolution).
+
+Anything else that changes the graph (dates, edge weight strategy, channel
+scope, …) changes the fingerprint, so stale entries are never returned; they
+just age out. Each entry is one pickle file; reads refresh its mtime, and
+writes evict the least recently used files once the directory exceeds its
+size budget. Files are written to a temporary name and renamed into place, so
+concurrent timeline workers can share one directory.
+
+``LayoutStore`` is the opposite kind of cache: it keeps the last ForceAtlas2
+positions of each named export whatever the graph, keyed by node id, so the
+next run can start its layout from them (see ``layout.seed_from_reference``).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from network import core
+
+import networkx as nx
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Bump when an algorithm change makes previously cached values wrong.
+CACHE_FORMAT_VERSION = 1
+
+_SUFFIX = ".pkl"
+
+
+def _write_atomically(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` through a temporary file in the same directory and a rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def graph_fingerprint(graph: nx.DiGraph) -> str:
+    """SHA-256 of the node ids, node insertion order, edges and edge weights of ``graph``."""
+    view = core.csr_view(graph)
+    digest = hashlib.sha256(json.dumps(view.node_ids).encode())
+    for array in (view.insertion_rank, view.out_ptr, view.out_idx, view.weight):
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Pickled results for one graph, stored under ``directory`` within ``max_bytes``.
+
+    A cache with ``max_bytes <= 0`` is disabled: ``get`` always misses and
+    ``put`` does nothing. I/O errors are logged and treated as misses, so a
+    broken cache directory never fails an export.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int, fingerprint: str) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def for_graph(cls, graph: nx.DiGraph, directory: str | Path, max_mb: int) -> "ResultCache":
+        """Cache bound to ``graph``; the fingerprint is only computed when the cache is enabled."""
+        if max_mb <= 0:
+            return cls(directory, 0, "")
+        return cls(directory, max_mb * 1024 * 1024, graph_fingerprint(graph))
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def _path(self, kind: str, params: Any) -> Path:
+        key = json.dumps([CACHE_FORMAT_VERSION, self.fingerprint, kind, params], sort_keys=True, default=str)
+        return self.directory / (hashlib.sha256(key.encode()).hexdigest() + _SUFFIX)
+
+    def get(self, kind: str, params: Any) -> Any | None:
+        """Return the cached value for ``(kind, params)``, or ``None`` on a miss."""
+        if not self.enabled:
+            return None
+        path = self._path(kind, params)
+        try:
+            with path.open("rb") as f:
+                value = pickle.load(f)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            logger.warning("Ignoring unreadable cache entry %s: %s", path.name, e)
+            return None
+        return value
+
+    def put(self, kind: str, params: Any, value: Any) -> None:
+        """Store ``value`` for ``(kind, params)`` and evict old entries beyond the size budget."""
+        if not self.enabled:
+            return
+        path = self._path(kind, params)
+        try:
+            _write_atomically(path, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        except OSError as e:
+            logger.warning("Could not write cache entry %s: %s", path.name, e)
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the directory fits in ``max_bytes``."""
+        entries = []
+        for path in self.directory.glob("*" + _SUFFIX):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _mtime, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+class LayoutStore:
+    """Last 2D and 3D ForceAtlas2 positions of each export name, as JSON under ``directory``.
+
+    Positions are keyed by node id (channel PK). Like ``ResultCache``, I/O and
+    decoding errors are logged and treated as "nothing stored".
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+
+    def _path(self, name: str) -> Path:
+        return self.directory / f"{name}.json"
+
+    def load(self, name: str) -> tuple[dict | None, dict | None]:
+        """Return the stored ``(positions, positions_3d)`` of ``name``; ``None`` where nothing is stored."""
+        path = self._path(name)
+        try:
+            with path.open() as f:
+                stored = json.load(f)
+        except FileNotFoundError:
+            return None, None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable layout %s: %s", path.name, e)
+            return None, None
+
+        def _positions(key: str) -> dict | None:
+            positions = stored.get(key)
+            return {node_id: tuple(pos) for node_id, pos in positions.items()} if positions else None
+
+        return _positions("positions"), _positions("positions_3d")
+
+    def save(self, name: str, positions: dict | None, positions_3d: dict | None) -> None:
+        """Store the positions of ``name``; a ``None`` layout keeps the one stored before."""
+        previous, previous_3d = self.load(name)
+        payload = {
+            "positions": _json_positions(positions if positions is not None else previous),
+            "positions_3d": _json_positions(positions_3d if positions_3d is not None else previous_3d),
+        }
+        try:
+            _write_atomically(self._path(name), json.dumps(payload).encode())
+        except OSError as e:
+            logger.warning("Could not write layout %s: %s", self._path(name).name, e)
+
+
+def _json_positions(positions: dict | None) -> dict | None:
+    if not positions:
+        return None
+    return {str(node_id): [float(x) for x in pos] for node_id, pos in positions.items()}
@@ -1,13 +1,12 @@
-import io
 import logging
-import sys
 from collections import Counter
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from django.db.models import Count
 from django.utils.text import slugify
 
+from network import core, parallel
 from webapp.models import Organization
 from webapp.utils.colors import (
     DEFAULT_FALLBACK_COLOR,
@@ -19,20 +18,25 @@ from webapp.utils.colors import (
     rgb_to_hex,
 )
 
-import igraph as ig
 import leidenalg
 import networkx as nx
 import numpy as np
+import scipy.sparse as sp
 from infomap import Infomap
 
-# markov_clustering writes to stderr at import time when matplotlib is absent
-_stderr, sys.stderr = sys.stderr, io.StringIO()
-import markov_clustering as mc  # noqa: E402
+logger = logging.getLogger(__name__)
 
-sys.stderr = _stderr
-del _stderr
+# MCL: entries below the threshold are dropped after every iteration (the
+# column maximum always survives), and each column keeps at most
+# ``_MCL_MAX_PER_COLUMN`` entries. Expansion runs ``_MCL_BLOCK_COLUMNS``
+# columns at a time, so memory grows with the retained entries, not n².
+_MCL_PRUNE_THRESHOLD = 0.001
+_MCL_MAX_PER_COLUMN = 500
+_MCL_BLOCK_COLUMNS = 1024
+_MCL_MAX_ITERATIONS = 100
 
-logger = logging.getLogger(__name__)
+# Memory Infomap: nodes with more in × out trigrams than this get one lumped state.
+_INFOMAP_MEMORY_MAX_TRIGRAMS = 10_000
 
 COMMUNITY_ALGORITHMS = {
     "LOUVAIN",
@@ -117,24 +121,6 @@ def _merge_isolated_nodes(graph: nx.DiGraph, community_map: CommunityMap) -> Com
 # ── Shared scaffolding for the per-algorithm detect_* functions ────────────────
 
 
-def _node_id_index(graph: nx.DiGraph) -> tuple[list[str], dict[str, int]]:
-    """Stable sorted ``node_ids`` plus ``{node_id: index}`` map. Used by every
-    igraph- or matrix-based detector to translate between str ids and 0..n-1 indices."""
-    node_ids = sorted(graph.nodes())
-    return node_ids, {node_id: index for index, node_id in enumerate(node_ids)}
-
-
-def _build_directed_igraph(
-    graph: nx.DiGraph, node_ids: list[str], node_id_map: dict[str, int]
-) -> tuple[ig.Graph, list[float]]:
-    """Build a directed igraph from a NetworkX DiGraph preserving edge weights."""
-    ig_graph = ig.Graph(n=len(node_ids), directed=True)
-    edges = [(node_id_map[s], node_id_map[t]) for s, t in graph.edges()]
-    weights = [graph.edges[s, t].get("weight", 1.0) for s, t in graph.edges()]
-    ig_graph.add_edges(edges)
-    return ig_graph, weights
-
-
 def _assign_from_partition(partition: Iterable, node_ids: list[str]) -> CommunityMap:
     """Build {node_id: community_index} from an iterable of communities-as-node-indices."""
     community_map: CommunityMap = {}
@@ -232,10 +218,13 @@ def detect_kcore(
 def detect_infomap(
     graph: nx.DiGraph, palette_name: str, *, reverse: bool = False
 ) -> tuple[CommunityMap, CommunityPalette]:
-    node_ids, node_id_map = _node_id_index(graph)
+    view = core.csr_view(graph)
+    node_ids = view.node_ids
     infomap = Infomap("--two-level --directed --silent")
-    for source, target, edge_data in graph.edges(data=True):
-        infomap.addLink(node_id_map[source], node_id_map[target], edge_data.get("weight", 1.0))
+    for source, target, weight in zip(
+        view.edge_sources.tolist(), view.out_idx.tolist(), view.weight.tolist(), strict=True
+    ):
+        infomap.addLink(source, target, weight)
 
     infomap.run()
     module_ids: dict[str, int] = {node_ids[node.node_id]: node.module_id for node in infomap.nodes}
@@ -274,8 +263,9 @@ def detect_strongcc(
 def detect_leiden(
     graph: nx.DiGraph, palette_name: str, *, reverse: bool = False
 ) -> tuple[CommunityMap, CommunityPalette]:
-    node_ids, node_id_map = _node_id_index(graph)
-    ig_graph, weights = _build_undirected_igraph(graph, node_ids, node_id_map)
+    view = core.csr_view(graph)
+    node_ids = view.node_ids
+    ig_graph, weights = view.to_igraph(directed=False)
     if weights:
         ig_graph.es["weight"] = weights
     partition = leidenalg.find_partition(
@@ -299,8 +289,9 @@ def detect_leiden_directed(
     a target that is widely cited.  Edge direction is preserved throughout
     the optimisation.
     """
-    node_ids, node_id_map = _node_id_index(graph)
-    ig_graph, weights = _build_directed_igraph(graph, node_ids, node_id_map)
+    view = core.csr_view(graph)
+    node_ids = view.node_ids
+    ig_graph, weights = view.to_igraph()
     if weights:
         ig_graph.es["weight"] = weights
     partition = leidenalg.find_partition(
@@ -312,20 +303,6 @@ def detect_leiden_directed(
     return _finalize_partition(graph, _assign_from_partition(partition, node_ids), palette_name, reverse=reverse)
 
 
-def _build_undirected_igraph(
-    graph: nx.DiGraph, node_ids: list[str], node_id_map: dict[str, int]
-) -> tuple[ig.Graph, list[float]]:
-    """Build an undirected igraph from a NetworkX DiGraph, symmetrising edges."""
-    undirected = graph.to_undirected(reciprocal=False)
-    ig_graph = ig.Graph(n=len(node_ids), directed=False)
-    edges, weights = [], []
-    for s, t in undirected.edges():
-        edges.append((node_id_map[s], node_id_map[t]))
-        weights.append(undirected.edges[s, t].get("weight", 1.0))
-    ig_graph.add_edges(edges)
-    return ig_graph, weights
-
-
 def detect_leiden_cpm(
     graph: nx.DiGraph, palette_name: str, resolution: float, *, reverse: bool = False
 ) -> tuple[CommunityMap, CommunityPalette]:
@@ -338,8 +315,9 @@ def detect_leiden_cpm(
 
     The graph is symmetrised to undirected before optimisation (same as LEIDEN).
     """
-    node_ids, node_id_map = _node_id_index(graph)
-    ig_graph, weights = _build_undirected_igraph(graph, node_ids, node_id_map)
+    view = core.csr_view(graph)
+    node_ids = view.node_ids
+    ig_graph, weights = view.to_igraph(directed=False)
     partition = leidenalg.find_partition(
         ig_graph,
         leidenalg.CPMVertexPartition,
@@ -350,6 +328,76 @@ def detect_leiden_cpm(
     return _finalize_partition(graph, _assign_from_partition(partition, node_ids), palette_name, reverse=reverse)
 
 
+def _mcl_normalize_prune(
+    block: sp.csc_array, prune_threshold: float, max_per_column: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Column-normalise ``block`` and prune it; returns the surviving ``(data, rows, cols)``.
+
+    A column keeps its ``max_per_column`` largest entries that are at least
+    ``prune_threshold``, and always its maximum (lowest row on ties).
+    """
+    block.sum_duplicates()
+    cols = np.repeat(np.arange(block.shape[1]), np.diff(block.indptr))
+    rows, data = block.indices, block.data
+    sums = np.bincount(cols, weights=data, minlength=block.shape[1])
+    data = data / sums[cols]
+    order = np.lexsort((rows, -data, cols))
+    sorted_cols = cols[order]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = sorted_cols[1:] != sorted_cols[:-1]
+    group_start = np.maximum.accumulate(np.where(first, np.arange(len(order)), 0))
+    rank = np.arange(len(order)) - group_start
+    keep = (rank < max_per_column) & ((data[order] >= prune_threshold) | (rank == 0))
+    kept = order[keep]
+    return data[kept], rows[kept], cols[kept]
+
+
+def _mcl(
+    matrix: sp.csr_array,
+    inflation: float,
+    *,
+    prune_threshold: float = _MCL_PRUNE_THRESHOLD,
+    max_per_column: int = _MCL_MAX_PER_COLUMN,
+) -> list[tuple[int, ...]]:
+    """Sparse MCL on a non-negative square matrix; returns the clusters as sorted node-index tuples.
+
+    Mirrors ``markov_clustering.run_mcl`` with its defaults (self-loops of 1,
+    expansion 2, convergence to ``rtol=1e-5, atol=1e-8``) and the same
+    attractor-based cluster extraction, but never densifies the matrix:
+    expansion is computed block by block, and each block is inflated,
+    normalised and pruned before the next one is expanded.
+    """
+    n = matrix.shape[0]
+    current = sp.csc_array(matrix, dtype=np.float64, copy=True)
+    current.setdiag(1.0)
+    data, rows, cols = _mcl_normalize_prune(current, 0.0, n)
+    current = sp.csc_array((data, (rows, cols)), shape=(n, n))
+    for _ in range(_MCL_MAX_ITERATIONS):
+        parts = []
+        for start in range(0, n, _MCL_BLOCK_COLUMNS):
+            block = sp.csc_array(current @ current[:, start : start + _MCL_BLOCK_COLUMNS])
+            block.data **= inflation
+            data, rows, cols = _mcl_normalize_prune(block, prune_threshold, max_per_column)
+            parts.append((data, rows, cols + start))
+        previous = current
+        current = sp.csc_array(
+            (
+                np.concatenate([p[0] for p in parts]),
+                (np.concatenate([p[1] for p in parts]), np.concatenate([p[2] for p in parts])),
+            ),
+            shape=(n, n),
+        )
+        diff = abs(current - previous) - 1e-5 * abs(previous)
+        if diff.nnz == 0 or diff.data.max() <= 1e-8:
+            break
+
+    final = sp.csr_array(current)
+    final.eliminate_zeros()
+    attractors = np.flatnonzero(final.diagonal())
+    clusters = {tuple(final.indices[final.indptr[a] : final.indptr[a + 1]].tolist()) for a in attractors}
+    return sorted(clusters)
+
+
 def detect_mcl(
     graph: nx.DiGraph, palette_name: str, inflation: float, *, reverse: bool = False
 ) -> tuple[CommunityMap, CommunityPalette]:
@@ -358,20 +406,12 @@ def detect_mcl(
     Works natively on the directed weighted graph: alternates matrix expansion
     (random-walk diffusion) and inflation (contrast enhancement) until
     convergence.  The ``inflation`` parameter controls granularity: higher
-    values produce more, smaller communities.
+    values produce more, smaller communities.  The matrix stays sparse
+    throughout (see ``_mcl``), so memory grows with the edges rather than n².
     """
-    node_ids, node_id_map = _node_id_index(graph)
-    n = len(node_ids)
-    matrix = np.zeros((n, n), dtype=float)
-    for source, target, edge_data in graph.edges(data=True):
-        matrix[node_id_map[source], node_id_map[target]] = edge_data.get("weight", 1.0)
-
-    # Give isolated nodes a self-loop so the stochastic matrix stays well-defined.
-    for i in range(n):
-        if matrix[i].sum() == 0 and matrix[:, i].sum() == 0:
-            matrix[i, i] = 1.0
-
-    clusters = mc.get_clusters(mc.run_mcl(matrix, inflation=inflation))
+    view = core.csr_view(graph)
+    node_ids = view.node_ids
+    clusters = _mcl(view.to_scipy(), inflation)
     community_map = _assign_from_partition(clusters, node_ids)
 
     # Nodes not placed in any cluster (edge cases in sparse graphs) → singletons.
@@ -385,8 +425,55 @@ def detect_mcl(
     return _finalize_partition(graph, community_map, palette_name, reverse=reverse, merge_isolated=False)
 
 
+def _memory_state_network(
+    view: core.CSRGraph, max_trigrams: int | None
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Second-order state network of ``view`` as arrays.
+
+    Returns ``(state_ids, state_nodes, link_sources, link_targets, link_weights)``.
+    The state "arrived at B through edge e" has id ``e`` (the CSR edge id);
+    channels without incoming edges get an entry state ``m + n + B``. Every
+    state of B links to the state of each out-edge B→C with weight w(B→C).
+
+    A node B whose ``in × out`` trigram count exceeds ``max_trigrams`` keeps a
+    single lumped state ``m + B`` for all its incoming edges. Transitions out
+    of B do not depend on the arrival edge, so the lumped state carries the
+    same flow with ``in + out`` links instead of ``in × out``; B just cannot be
+    split across modules by where the walker came from.
+    """
+    n, m = view.n, view.m
+    in_degree, out_degree = view.in_degree(), view.out_degree()
+    hub = np.zeros(n, dtype=bool)
+    if max_trigrams is not None:
+        hub = (in_degree * out_degree > max_trigrams) & (in_degree > 1)
+    targets = view.out_idx
+    edge_state = np.where(hub[targets], m + targets, np.arange(m))
+    entry = np.flatnonzero((in_degree == 0) & (out_degree > 0))
+
+    # Incoming states per intermediate node B: (B, state) pairs.
+    in_mid = np.repeat(np.arange(n), in_degree)
+    regular = ~hub[in_mid] & (out_degree[in_mid] > 0)
+    hubs = np.flatnonzero(hub & (out_degree > 0))
+    mid = np.concatenate((in_mid[regular], hubs, entry))
+    state_in = np.concatenate((view.in_eid[regular], m + hubs, m + n + entry))
+
+    # One link per (incoming state of B, out-edge of B).
+    fan_out = out_degree[mid]
+    starts = view.out_ptr[mid]
+    offsets = np.repeat(np.cumsum(fan_out) - fan_out - starts, fan_out)
+    out_edges = np.arange(int(fan_out.sum()), dtype=np.int64) - offsets
+
+    state_ids, first = np.unique(np.concatenate((edge_state, m + n + entry)), return_index=True)
+    state_nodes = np.concatenate((targets, entry))[first]
+    return state_ids, state_nodes, np.repeat(state_in, fan_out), edge_state[out_edges], view.weight[out_edges]
+
+
 def detect_infomap_memory(
-    graph: nx.DiGraph, palette_name: str, *, reverse: bool = False
+    graph: nx.DiGraph,
+    palette_name: str,
+    *,
+    reverse: bool = False,
+    max_trigrams: int | None = _INFOMAP_MEMORY_MAX_TRIGRAMS,
 ) -> tuple[CommunityMap, CommunityPalette]:
     """Second-order (memory) Infomap — Rosvall et al., Nature Communications 2014.
 
@@ -395,43 +482,19 @@ def detect_infomap_memory(
     then follows the outgoing edges of B weighted by their actual citation
     frequencies.  This captures sequential forwarding patterns that first-order
     Infomap treats as independent.  Channels with no incoming edges receive a
-    virtual entry state so they participate in the flow.
+    virtual entry state so they participate in the flow.  Hubs with more than
+    ``max_trigrams`` in × out combinations keep one memoryless state (see
+    ``_memory_state_network``); ``None`` disables the cap.
     """
     community_map: CommunityMap = {}
-    node_ids, node_id_map = _node_id_index(graph)
-    n = len(node_ids)
+    view = core.csr_view(graph)
+    node_ids = view.node_ids
 
     infomap = Infomap("--two-level --directed --silent --recorded-teleportation", seed=123)
-
-    # State node for edge A→B: state_id = idx_A * n + idx_B, physical node = idx_B.
-    for src, tgt in graph.edges():
-        infomap.add_state_node(node_id_map[src] * n + node_id_map[tgt], node_id_map[tgt])
-
-    # Virtual entry state for source nodes (no incoming edges, would be unreachable).
-    _virtual_base = n * n
-    for node_id in node_ids:
-        node_idx = node_id_map[node_id]
-        if graph.in_degree(node_id) == 0 and graph.out_degree(node_id) > 0:
-            infomap.add_state_node(_virtual_base + node_idx, node_idx)
-
-    # Trigram links: state(A→B) → state(B→C) with weight w(B→C).
-    for mid in node_ids:
-        mid_idx = node_id_map[mid]
-        predecessors = list(graph.predecessors(mid))
-        successors = list(graph.successors(mid))
-        if not successors:
-            continue
-        # Incoming state IDs: edge-states plus virtual entry if source node.
-        if predecessors:
-            in_states = [node_id_map[src] * n + mid_idx for src in predecessors]
-        else:
-            in_states = [_virtual_base + mid_idx]
-        for tgt in successors:
-            tgt_idx = node_id_map[tgt]
-            weight = graph.edges[mid, tgt].get("weight", 1.0)
-            state_out = mid_idx * n + tgt_idx
-            for state_in in in_states:
-                infomap.add_link(state_in, state_out, weight)
+    state_ids, state_nodes, link_sources, link_targets, link_weights = _memory_state_network(view, max_trigrams)
+    infomap.add_state_nodes(zip(state_ids.tolist(), state_nodes.tolist(), strict=True))
+    if len(link_sources):
+        infomap.add_links(np.column_stack((link_sources, link_targets, link_weights)))
 
     infomap.run()
 
@@ -466,8 +529,9 @@ def detect_walktrap(
 
     The graph is symmetrised to undirected before clustering (same as LEIDEN).
     """
-    node_ids, node_id_map = _node_id_index(graph)
-    ig_graph, weights = _build_undirected_igraph(graph, node_ids, node_id_map)
+    view = core.csr_view(graph)
+    node_ids = view.node_ids
+    ig_graph, weights = view.to_igraph(directed=False)
     if weights:
         ig_graph.es["weight"] = weights
     partition = ig_graph.community_walktrap(weights="weight" if weights else None, steps=4).as_clustering()
@@ -519,6 +583,38 @@ def detect(
     raise ValueError(f"Unknown community strategy: {strategy!r}. Choose from {sorted(VALID_STRATEGIES)}.")
 
 
+def _detect_on_shared_graph(
+    strategy: str, palette_name: str, kwargs: dict[str, Any]
+) -> tuple[CommunityMap, CommunityPalette]:
+    return detect(strategy, palette_name, parallel.shared_value(), {}, **kwargs)
+
+
+def detect_all(
+    strategies: list[str],
+    palette_name: str,
+    graph: nx.DiGraph,
+    channel_dict: dict[str, Any],
+    *,
+    jobs: int = 1,
+    **kwargs: Any,
+) -> Iterator[tuple[CommunityMap, CommunityPalette]]:
+    """Run ``detect`` for every strategy and yield the results in ``strategies`` order.
+
+    With ``jobs > 1`` the graph-only algorithms (``COMMUNITY_ALGORITHMS``) run
+    concurrently in a process pool that receives the graph once per worker;
+    ORGANIZATION, which reads channel organisations, runs in this process.
+    Every detector is seeded or deterministic, so the partitions and their
+    order are the same for any ``jobs``. ``kwargs`` are passed to ``detect``.
+    """
+    pooled = [(strategy, palette_name, kwargs) for strategy in strategies if strategy in COMMUNITY_ALGORITHMS]
+    results = parallel.ordered_map(_detect_on_shared_graph, pooled, jobs, shared=graph)
+    for strategy in strategies:
+        if strategy in COMMUNITY_ALGORITHMS:
+            yield next(results)
+        else:
+            yield detect(strategy, palette_name, graph, channel_dict, **kwargs)
+
+
 def apply_to_graph(
     graph: nx.DiGraph,
     channel_dict: dict[str, Any],
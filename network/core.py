@@ -0,0 +1,179 @@
+"""Compact integer-indexed view of an analysis graph.
+
+The ``network`` package hands ``nx.DiGraph`` objects keyed by channel-PK
+strings from stage to stage. Algorithms that run on arrays (igraph, Infomap,
+SciPy) used to re-derive their own index maps and edge lists from it on every
+call. ``CSRGraph`` holds that representation once:
+
+- nodes are the contiguous ints ``0..n-1``, in sorted string-id order
+  (``node_ids[i]`` is the channel id of node ``i``);
+- out-edges are stored in CSR form (``out_ptr`` / ``out_idx``), sorted by
+  source then target, with ``weight`` aligned to ``out_idx``. The position of
+  an edge in these arrays is its edge id;
+- in-edges are the same edges in CSC order (``in_ptr`` / ``in_idx``), with
+  ``in_eid`` mapping each in-edge back to its edge id.
+
+``csr_view(graph)`` returns the view of a NetworkX graph, building it on first
+use and caching it for the lifetime of the graph object; ``build_graph``
+primes the cache so every later stage shares one instance. The cache is
+dropped when nodes or edges are added or removed, and copies of the graph get
+their own view. Edge attributes edited in place are not tracked: call
+``CSRGraph.from_networkx`` directly on graphs whose weights change.
+"""
+
+import weakref
+from dataclasses import dataclass
+from functools import cached_property
+
+import igraph as ig
+import networkx as nx
+import numpy as np
+import scipy.sparse as sp
+
+_views: "weakref.WeakKeyDictionary[nx.DiGraph, CSRGraph]" = weakref.WeakKeyDictionary()
+
+
+@dataclass(frozen=True, eq=False)
+class CSRGraph:
+    node_ids: list[str]
+    out_ptr: np.ndarray
+    out_idx: np.ndarray
+    weight: np.ndarray
+    in_ptr: np.ndarray
+    in_idx: np.ndarray
+    in_eid: np.ndarray
+    # Position of each node in the source graph's insertion order; used to
+    # resolve reciprocal edges exactly like ``nx.DiGraph.to_undirected``.
+    insertion_rank: np.ndarray
+
+    @classmethod
+    def from_networkx(cls, graph: nx.DiGraph, weight: str = "weight") -> "CSRGraph":
+        """Build the view of ``graph``; edges without ``weight`` count as ``1.0``."""
+        node_ids = sorted(graph.nodes())
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        n = len(node_ids)
+        m = graph.number_of_edges()
+        src = np.empty(m, dtype=np.int64)
+        dst = np.empty(m, dtype=np.int64)
+        w = np.empty(m, dtype=np.float64)
+        for k, (u, v, value) in enumerate(graph.edges(data=weight, default=1.0)):
+            src[k] = index[u]
+            dst[k] = index[v]
+            w[k] = value
+        insertion_rank = np.empty(n, dtype=np.int64)
+        for rank, node_id in enumerate(graph.nodes()):
+            insertion_rank[index[node_id]] = rank
+        return cls.from_edges(node_ids, src, dst, w, insertion_rank)
+
+    @classmethod
+    def from_edges(
+        cls, node_ids: list[str], src: np.ndarray, dst: np.ndarray, weight: np.ndarray, insertion_rank: np.ndarray
+    ) -> "CSRGraph":
+        """Build the view of the edges ``src[k] → dst[k]`` (int ids, any order) with weights ``weight[k]``."""
+        n = len(node_ids)
+        order = np.lexsort((dst, src))
+        src, dst, w = src[order], dst[order], weight[order]
+        out_ptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=out_ptr[1:])
+        in_eid = np.lexsort((src, dst))
+        in_ptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(dst, minlength=n), out=in_ptr[1:])
+        return cls(
+            node_ids=node_ids,
+            out_ptr=out_ptr,
+            out_idx=dst,
+            weight=w,
+            in_ptr=in_ptr,
+            in_idx=src[in_eid],
+            in_eid=in_eid,
+            insertion_rank=insertion_rank,
+        )
+
+    @property
+    def n(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def m(self) -> int:
+        return len(self.out_idx)
+
+    @cached_property
+    def index(self) -> dict[str, int]:
+        """``{node_id: int id}`` — the inverse of ``node_ids``."""
+        return {node_id: i for i, node_id in enumerate(self.node_ids)}
+
+    @cached_property
+    def edge_sources(self) -> np.ndarray:
+        """Source node of every edge, aligned with ``out_idx`` and ``weight``."""
+        return np.repeat(np.arange(self.n, dtype=np.int64), np.diff(self.out_ptr))
+
+    def out_degree(self) -> np.ndarray:
+        return np.diff(self.out_ptr)
+
+    def in_degree(self) -> np.ndarray:
+        return np.diff(self.in_ptr)
+
+    def successors(self, i: int) -> np.ndarray:
+        return self.out_idx[self.out_ptr[i] : self.out_ptr[i + 1]]
+
+    def predecessors(self, i: int) -> np.ndarray:
+        return self.in_idx[self.in_ptr[i] : self.in_ptr[i + 1]]
+
+    # ── Adapters ──────────────────────────────────────────────────────────────
+
+    def to_scipy(self, weighted: bool = True) -> sp.csr_array:
+        """Adjacency matrix ``A[i, j] = w(i→j)``, sharing the index and weight arrays."""
+        data = self.weight if weighted else np.ones(self.m)
+        return sp.csr_array((data, self.out_idx, self.out_ptr), shape=(self.n, self.n))
+
+    def undirected_edges(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Symmetrised edges as ``(u, v, weight)`` arrays with ``u <= v``.
+
+        A reciprocal pair collapses to one edge carrying the weight of the
+        direction whose source was inserted last — the same choice as
+        ``nx.DiGraph.to_undirected()``, so detectors keep their results.
+        """
+        src, dst = self.edge_sources, self.out_idx
+        lo, hi = np.minimum(src, dst), np.maximum(src, dst)
+        # Among duplicates of (lo, hi), keep the edge with the latest-inserted source.
+        order = np.lexsort((self.insertion_rank[src], hi, lo))
+        lo, hi, w = lo[order], hi[order], self.weight[order]
+        last = np.ones(len(lo), dtype=bool)
+        last[:-1] = (lo[1:] != lo[:-1]) | (hi[1:] != hi[:-1])
+        return lo[last], hi[last], w[last]
+
+    def to_igraph(self, directed: bool = True) -> tuple[ig.Graph, list[float]]:
+        """igraph copy of the topology plus the matching edge-weight list.
+
+        igraph keeps its own edge storage, so this is one vectorised copy of
+        the CSR arrays rather than a per-edge walk of the NetworkX graph.
+        """
+        if directed:
+            src, dst, w = self.edge_sources, self.out_idx, self.weight
+        else:
+            src, dst, w = self.undirected_edges()
+        ig_graph = ig.Graph(n=self.n, edges=np.column_stack((src, dst)).tolist(), directed=directed)
+        return ig_graph, w.tolist()
+
+    def to_networkx(self, weight: str = "weight") -> nx.DiGraph:
+        """``nx.DiGraph`` with the original string ids and the weights under ``weight``."""
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self.node_ids)
+        ids = self.node_ids
+        graph.add_weighted_edges_from(
+            (
+                (ids[u], ids[v], w)
+                for u, v, w in zip(self.edge_sources.tolist(), self.out_idx.tolist(), self.weight.tolist(), strict=True)
+            ),
+            weight=weight,
+        )
+        return graph
+
+
+def csr_view(graph: nx.DiGraph) -> CSRGraph:
+    """Return the cached ``CSRGraph`` of ``graph``, building it if needed."""
+    view = _views.get(graph)
+    if view is None or view.n != graph.number_of_nodes() or view.m != graph.number_of_edges():
+        view = CSRGraph.from_networkx(graph)
+        _views[graph] = view
+    return view
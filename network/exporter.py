@@ -438,8 +438,14 @@ def write_meta_json(
     total_edges: int = 0,
     community_distribution_threshold: int = 10,
     has_consensus_matrix: bool = False,
+    betweenness_sampling: "dict[str, float | int] | None" = None,
 ) -> None:
-    """Write data/meta.json with export metadata consumed by table preambles."""
+    """Write data/meta.json with export metadata consumed by table preambles.
+
+    ``betweenness_sampling`` is ``measures.betweenness_sampling_report`` for a
+    sampled betweenness estimate (pivot count and error bound), ``None`` when
+    betweenness is exact or not computed.
+    """
     _weight_labels = {
         "NONE": "unweighted (all edges equal)",
         "TOTAL": "raw forward + mention count",
@@ -464,6 +470,7 @@ def write_meta_json(
         "total_edges": total_edges,
         "community_distribution_threshold": community_distribution_threshold,
         "has_consensus_matrix": has_consensus_matrix,
+        "betweenness_sampling": betweenness_sampling,
     }
     data_dir = os.path.join(graph_dir, "data")
     with open(os.path.join(data_dir, "meta.json"), "w") as f:
@@ -494,10 +501,14 @@ def write_summary_json(
         "startdate",
         "enddate",
         "fa2_iterations",
+        "layout_seed",
+        "layout_algorithm",
+        "warm_start_layout",
         "layouts_2d",
         "layouts_3d",
         "recency_weights",
         "spreading_runs",
+        "betweenness_samples",
         "diffusion_window",
         "community_distribution_threshold",
         "leiden_coarse_resolution",
@@ -521,8 +532,11 @@ def write_summary_json(
         "robustness_strategies",
         "robustness_runs",
         "robustness_null",
+        "robustness_null_model",
         "robustness_seed",
         "robustness_sample",
+        "robustness_curve_tolerance",
+        "robustness_dyn_batch",
     )
     opts: dict = {}
     for key in _OPTION_KEYS:
@@ -4,10 +4,12 @@ import math
 from typing import Any
 
 from django.conf import settings
-from django.db.models import Count, Exists, F, OuterRef, Prefetch, Q, QuerySet
+from django.db.models import F, Prefetch, Q, QuerySet, Sum
+from django.db.models.functions import ExtractYear
+from django.utils import timezone
 
-from network.utils import channel_cutoff_q, make_date_q
-from webapp.models import Channel, Message, ProfilePicture
+from network import core
+from webapp.models import Channel, ChannelEdgeDaily, ProfilePicture
 from webapp.utils.channel_types import channel_type_filter
 from webapp.utils.colors import hex_to_rgb
 
@@ -60,14 +62,167 @@ VALID_EDGE_WEIGHT_STRATEGIES = {"NONE", "TOTAL", "PARTIAL_MESSAGES", "PARTIAL_RE
 
 
 def _recency_decay(date: datetime.datetime | datetime.date | None, today: datetime.date, n: int) -> float:
-    """Return 1.0 for messages within the last N days, then exp(-(age-N)/N) beyond that."""
+    """Return 1.0 for messages within the last N days, then exp(-(age-N)/N) beyond that.
+
+    Ages are counted in local (``TIME_ZONE``) calendar days, the days
+    ``ChannelEdgeDaily`` buckets by; pass ``today`` as ``timezone.localdate()``.
+    """
     if date is None or n <= 0:
         return 1.0
-    d = date.date() if isinstance(date, datetime.datetime) else date
+    if isinstance(date, datetime.datetime):
+        d = timezone.localdate(date) if timezone.is_aware(date) else date.date()
+    else:
+        d = date
     excess = (today - d).days - n
     return math.exp(-excess / n) if excess > 0 else 1.0
 
 
+def _edge_window_q(start_date: datetime.date | None, end_date: datetime.date | None) -> Q:
+    """Q restricting ``ChannelEdgeDaily`` rows to the date window and the channel cutoffs.
+
+    Mirrors ``make_date_q`` and ``channel_cutoff_q`` on ``Message``: ``day`` is
+    the local calendar day those ``date__date`` lookups compare against.
+    """
+    q = Q(channel__out_of_target_after__isnull=True) | Q(day__lte=F("channel__out_of_target_after"))
+    if start_date:
+        q &= Q(day__gte=start_date)
+    if end_date:
+        q &= Q(day__lte=end_date)
+    return q
+
+
+type EdgeCounts = dict[str, dict]
+"""``ChannelEdgeDaily`` sums for one window: kind → {channel pk or (channel pk, cited pk): total}."""
+
+_PAIR_KINDS = frozenset({ChannelEdgeDaily.FORWARD, ChannelEdgeDaily.MENTION})
+
+
+def _edge_kinds(edge_weight_strategy: str, include_mentions: bool) -> list[str]:
+    """Return the ``ChannelEdgeDaily`` kinds ``build_graph`` needs for these options."""
+    kinds = [ChannelEdgeDaily.MESSAGES, ChannelEdgeDaily.FORWARD]
+    if include_mentions:
+        kinds.append(ChannelEdgeDaily.MENTION)
+    if edge_weight_strategy == "PARTIAL_REFERENCES":
+        kinds.append(ChannelEdgeDaily.CITING if include_mentions else ChannelEdgeDaily.FORWARDING)
+    return kinds
+
+
+def _edge_sums(
+    channel_ids: list[int],
+    window_q: Q,
+    kinds: list[str],
+    recency_weights: int | None = None,
+    today: datetime.date | None = None,
+    by_year: bool = False,
+) -> dict:
+    """Sum ``ChannelEdgeDaily.count`` for ``kinds`` within ``window_q`` in a single query.
+
+    Returns an ``EdgeCounts`` mapping. Per-channel kinds are keyed by channel
+    pk; ``FORWARD`` / ``MENTION`` by ``(channel pk, cited channel pk)`` and
+    restricted to cited channels in ``channel_ids``. With ``recency_weights``
+    the database returns one row per key and day, and ``_recency_decay`` is
+    applied once per row. With ``by_year`` the result is split into one
+    ``EdgeCounts`` per calendar year (``None`` for undated messages).
+    """
+    channel_kinds = [kind for kind in kinds if kind not in _PAIR_KINDS]
+    pair_kinds = [kind for kind in kinds if kind in _PAIR_KINDS]
+    qs = ChannelEdgeDaily.objects.filter(window_q, channel_id__in=channel_ids).filter(
+        Q(kind__in=channel_kinds) | Q(kind__in=pair_kinds, cited_channel_id__in=channel_ids)
+    )
+    group_fields = ["kind", "channel_id", "cited_channel_id"]
+    if recency_weights is not None:
+        group_fields.append("day")
+    elif by_year:
+        qs = qs.annotate(year=ExtractYear("day"))
+        group_fields.append("year")
+    sums: dict = {}
+    for kind, channel_id, cited_id, *extra, total in (
+        qs.values(*group_fields).annotate(total=Sum("count")).values_list(*group_fields, "total")
+    ):
+        year = None
+        if recency_weights is not None:
+            day = extra[0]
+            total = total * _recency_decay(day, today, recency_weights)
+            year = day.year if day is not None else None
+        elif by_year:
+            year = extra[0]
+        counts = sums.setdefault(year, {}) if by_year else sums
+        kind_sums = counts.setdefault(kind, {})
+        key = channel_id if cited_id is None else (channel_id, cited_id)
+        kind_sums[key] = kind_sums.get(key, 0) + total
+    return sums
+
+
+def merge_edge_counts(counts_by_year: dict[int | None, EdgeCounts]) -> EdgeCounts:
+    """Sum per-year ``EdgeCounts`` back into the counts of the whole, unwindowed range."""
+    merged: EdgeCounts = {}
+    for counts in counts_by_year.values():
+        for kind, kind_sums in counts.items():
+            merged_sums = merged.setdefault(kind, {})
+            for key, total in kind_sums.items():
+                merged_sums[key] = merged_sums.get(key, 0) + total
+    return merged
+
+
+def _channel_queryset(
+    draw_dead_leaves: bool,
+    channel_types: list[str] | None,
+    channel_groups: list[str] | None,
+    include_lost: bool,
+    include_private: bool,
+) -> QuerySet[Channel]:
+    """Return the channels that become graph nodes (before any date filtering)."""
+    qs_filter = Q(organization__is_in_target=True)
+    if draw_dead_leaves:
+        # Dead-leaf criterion: an out-of-target channel cited (forwarded or
+        # mentioned) at least once by some in-target channel. The cited count
+        # lives in in_degree when REVERSED_EDGES=True, out_degree otherwise.
+        qs_filter |= Q(in_degree__gt=0) if settings.REVERSED_EDGES else Q(out_degree__gt=0)
+    channel_qs: QuerySet[Channel] = Channel.objects.filter(qs_filter, channel_type_filter(channel_types))
+    if not include_private:
+        channel_qs = channel_qs.exclude(is_private=True)
+    if not include_lost:
+        channel_qs = channel_qs.exclude(is_lost=True)
+    if channel_groups:
+        channel_qs = channel_qs.filter(groups__key__in=channel_groups).distinct()
+    return channel_qs
+
+
+def yearly_edge_counts(
+    draw_dead_leaves: bool = False,
+    recency_weights: int | None = None,
+    channel_types: list[str] | None = None,
+    channel_groups: list[str] | None = None,
+    edge_weight_strategy: str = "PARTIAL_REFERENCES",
+    include_mentions: bool = True,
+    include_lost: bool = False,
+    include_private: bool = False,
+) -> dict[int | None, EdgeCounts]:
+    """Aggregate every year's ``EdgeCounts`` in one grouped query.
+
+    Takes the same selection options as ``build_graph``. Pass
+    ``counts[year]`` as ``build_graph(edge_counts=...)`` together with that
+    year's ``start_date`` / ``end_date`` to build the per-year graphs without
+    touching the edge table again, and ``merge_edge_counts(counts)`` for the
+    unwindowed graph.
+    """
+    channel_ids = list(
+        _channel_queryset(draw_dead_leaves, channel_types, channel_groups, include_lost, include_private).values_list(
+            "pk", flat=True
+        )
+    )
+    decay: dict[str, Any] = {}
+    if recency_weights is not None:
+        decay = {"recency_weights": recency_weights, "today": timezone.localdate()}
+    return _edge_sums(
+        channel_ids,
+        _edge_window_q(None, None),
+        _edge_kinds(edge_weight_strategy, include_mentions),
+        by_year=True,
+        **decay,
+    )
+
+
 def _filter_inactive_channels(
     channel_dict: dict[str, dict[str, Any]],
     graph: nx.DiGraph,
@@ -138,12 +293,16 @@ def build_graph(
     include_lost: bool = False,
     include_private: bool = False,
     dead_leaves_color: str | None = None,
+    edge_counts: EdgeCounts | None = None,
 ) -> tuple[nx.DiGraph, dict[str, dict[str, Any]], list[list[str | float]], QuerySet[Channel]]:
     """Build a directed NetworkX graph from channels in the DB.
 
     Returns (graph, channel_dict, edge_list, channel_qs).
     Raises ValueError if no edges are found between channels.
 
+    ``edge_counts`` takes counts precomputed by ``yearly_edge_counts`` for the
+    same selection options and date window; the edge table is then not queried.
+
     A *dead-leaf* node is an out-of-target channel that at least one in-target
     channel has forwarded from or mentioned via a ``t.me/`` link. Inclusion is
     gated by ``draw_dead_leaves``: ``Channel.refresh_cited_degree()`` counts
@@ -151,26 +310,17 @@ def build_graph(
     ``in_degree`` (when ``REVERSED_EDGES=True``) or ``out_degree`` (otherwise),
     so a non-zero degree on that side is exactly the dead-leaf criterion.
     """
-    qs_filter = Q(organization__is_in_target=True)
-    if draw_dead_leaves:
-        # Dead-leaf criterion: an out-of-target channel cited (forwarded or
-        # mentioned) at least once by some in-target channel. The cited count
-        # lives in in_degree when REVERSED_EDGES=True, out_degree otherwise.
-        qs_filter |= Q(in_degree__gt=0) if settings.REVERSED_EDGES else Q(out_degree__gt=0)
-    channel_qs: QuerySet[Channel] = Channel.objects.filter(qs_filter, channel_type_filter(channel_types))
-    if not include_private:
-        channel_qs = channel_qs.exclude(is_private=True)
-    if not include_lost:
-        channel_qs = channel_qs.exclude(is_lost=True)
-    channel_qs = channel_qs.select_related("organization").prefetch_related(
-        Prefetch(
-            "profilepicture_set",
-            queryset=ProfilePicture.objects.order_by("-date")[:1],
-            to_attr="_prefetched_profile_pics",
+    channel_qs = (
+        _channel_queryset(draw_dead_leaves, channel_types, channel_groups, include_lost, include_private)
+        .select_related("organization")
+        .prefetch_related(
+            Prefetch(
+                "profilepicture_set",
+                queryset=ProfilePicture.objects.order_by("-date")[:1],
+                to_attr="_prefetched_profile_pics",
+            )
         )
     )
-    if channel_groups:
-        channel_qs = channel_qs.filter(groups__key__in=channel_groups).distinct()
 
     _skip = frozenset({"activity_period", "messages_count"})
     graph: nx.DiGraph = nx.DiGraph()
@@ -183,125 +333,34 @@ def build_graph(
         graph.add_node(str(channel.pk), data=channel_dict[str(channel.pk)]["data"])
 
     channel_ids = [int(channel_id) for channel_id in channel_dict]
-    date_q = make_date_q(start_date, end_date)
-    cutoff_q = channel_cutoff_q()
-    ref_cutoff_q = channel_cutoff_q("message__channel", "message__date")
-    references_through = Message.references.through
-
-    if recency_weights is not None:
-        today = datetime.date.today()
-
-        messages_per_channel: dict[int, float] = {}
-        for ch_id, date in (
-            Message.objects.alive()
-            .filter(date_q, cutoff_q, channel_id__in=channel_ids)
-            .values_list("channel_id", "date")
-        ):
-            messages_per_channel[ch_id] = messages_per_channel.get(ch_id, 0.0) + _recency_decay(
-                date, today, recency_weights
-            )
-
-        if start_date or end_date:
-            channel_ids, channel_qs = _filter_inactive_channels(channel_dict, graph, channel_qs, messages_per_channel)
-
-        forwarded_counts: dict[tuple[int, int], float] = {}
-        for ch_id, fwd_id, date in (
-            Message.objects.alive()
-            .filter(date_q, cutoff_q, channel_id__in=channel_ids, forwarded_from_id__in=channel_ids)
-            .values_list("channel_id", "forwarded_from_id", "date")
-        ):
-            key = (ch_id, fwd_id)
-            forwarded_counts[key] = forwarded_counts.get(key, 0.0) + _recency_decay(date, today, recency_weights)
-
-        reference_counts: dict[tuple[int, int], float] = {}
-        if include_mentions:
-            for src_ch_id, ref_ch_id, msg_date in (
-                references_through.objects.filter(
-                    make_date_q(start_date, end_date, field="message__date"),
-                    ref_cutoff_q,
-                    message__is_lost=False,
-                    channel_id__in=channel_ids,
-                    message__channel_id__in=channel_ids,
-                )
-                .exclude(message__forwarded_from=F("channel"))
-                .values_list("message__channel_id", "channel_id", "message__date")
-            ):
-                key = (src_ch_id, ref_ch_id)
-                reference_counts[key] = reference_counts.get(key, 0.0) + _recency_decay(
-                    msg_date, today, recency_weights
-                )
-
-        referencing_counts: dict[int, float] = {}
-        if edge_weight_strategy == "PARTIAL_REFERENCES":
-            has_reference_subq = references_through.objects.filter(message=OuterRef("pk"))
-            ref_filter = (
-                Q(forwarded_from_id__isnull=False) | Q(Exists(has_reference_subq))
-                if include_mentions
-                else Q(forwarded_from_id__isnull=False)
-            )
-            for ch_id, date in (
-                Message.objects.alive()
-                .filter(date_q, cutoff_q, channel_id__in=channel_ids)
-                .filter(ref_filter)
-                .values_list("channel_id", "date")
-            ):
-                referencing_counts[ch_id] = referencing_counts.get(ch_id, 0.0) + _recency_decay(
-                    date, today, recency_weights
-                )
+    if edge_counts is None:
+        decay: dict[str, Any] = {}
+        if recency_weights is not None:
+            decay = {"recency_weights": recency_weights, "today": timezone.localdate()}
+        edge_counts = _edge_sums(
+            channel_ids,
+            _edge_window_q(start_date, end_date),
+            _edge_kinds(edge_weight_strategy, include_mentions),
+            **decay,
+        )
 
-    else:
-        messages_per_channel = {
-            item["channel_id"]: item["total"]
-            for item in Message.objects.alive()
-            .filter(date_q, cutoff_q, channel_id__in=channel_ids)
-            .values("channel_id")
-            .annotate(total=Count("id"))
-        }
+    messages_per_channel = edge_counts.get(ChannelEdgeDaily.MESSAGES, {})
 
-        if start_date or end_date:
-            channel_ids, channel_qs = _filter_inactive_channels(channel_dict, graph, channel_qs, messages_per_channel)
+    if start_date or end_date:
+        channel_ids, channel_qs = _filter_inactive_channels(channel_dict, graph, channel_qs, messages_per_channel)
 
-        forwarded_counts = {
-            (item["channel_id"], item["forwarded_from_id"]): item["total"]
-            for item in Message.objects.alive()
-            .filter(date_q, cutoff_q, channel_id__in=channel_ids, forwarded_from_id__in=channel_ids)
-            .values("channel_id", "forwarded_from_id")
-            .annotate(total=Count("id"))
+    active_ids = set(channel_ids)
+    forwarded_counts, reference_counts = (
+        {
+            (ch_id, cited_id): total
+            for (ch_id, cited_id), total in edge_counts.get(kind, {}).items()
+            if ch_id in active_ids and cited_id in active_ids
         }
-
-        reference_counts = (
-            {
-                (item["message__channel_id"], item["channel_id"]): item["total"]
-                for item in references_through.objects.filter(
-                    make_date_q(start_date, end_date, field="message__date"),
-                    message__is_lost=False,
-                    channel_id__in=channel_ids,
-                    message__channel_id__in=channel_ids,
-                )
-                .exclude(message__forwarded_from=F("channel"))
-                .values("message__channel_id", "channel_id")
-                .annotate(total=Count("id"))
-            }
-            if include_mentions
-            else {}
-        )
-
-        referencing_counts = {}
-        if edge_weight_strategy == "PARTIAL_REFERENCES":
-            has_reference_subq = references_through.objects.filter(message=OuterRef("pk"))
-            ref_filter = (
-                Q(forwarded_from_id__isnull=False) | Q(Exists(has_reference_subq))
-                if include_mentions
-                else Q(forwarded_from_id__isnull=False)
-            )
-            referencing_counts = {
-                item["channel_id"]: item["total"]
-                for item in Message.objects.alive()
-                .filter(date_q, cutoff_q, channel_id__in=channel_ids)
-                .filter(ref_filter)
-                .values("channel_id")
-                .annotate(total=Count("id"))
-            }
+        for kind in (ChannelEdgeDaily.FORWARD, ChannelEdgeDaily.MENTION)
+    )
+    referencing_counts = edge_counts.get(
+        ChannelEdgeDaily.CITING if include_mentions else ChannelEdgeDaily.FORWARDING, {}
+    )
 
     pk_to_str: dict[int, str] = {data["channel"].pk: cid for cid, data in channel_dict.items()}
     edge_list = _build_edge_list(
@@ -345,4 +404,6 @@ def build_graph(
             del channel_dict[cid]
         channel_qs = channel_qs.filter(pk__in=[int(cid) for cid in channel_dict])
 
+    # Build the shared integer-indexed view once; later stages reuse it via csr_view.
+    core.csr_view(graph)
     return graph, channel_dict, edge_list, channel_qs
@@ -1,7 +1,12 @@
 import warnings
 
+from network import core
+
 import networkx as nx
 import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.csgraph as csgraph
+import scipy.sparse.linalg as spla
 from fa2 import ForceAtlas2
 
 try:
@@ -14,11 +19,51 @@ except ImportError:
 LAYOUT_HORIZONTAL = "HORIZONTAL"
 LAYOUT_VERTICAL = "VERTICAL"
 
-EXTRA_LAYOUT_CHOICES_2D = {"FA2", "CIRCULAR", "KAMADA_KAWAI", "COMMUNITY_SHELL", "TSNE", "UMAP", "HYPERBOLIC"}
-EXTRA_LAYOUT_CHOICES_3D = {"FA2", "SPECTRAL", "SPRING", "KAMADA_KAWAI", "TSNE", "UMAP"}
+EXTRA_LAYOUT_CHOICES_2D = {
+    "FA2",
+    "MULTILEVEL",
+    "CIRCULAR",
+    "KAMADA_KAWAI",
+    "COMMUNITY_SHELL",
+    "TSNE",
+    "UMAP",
+    "HYPERBOLIC",
+}
+EXTRA_LAYOUT_CHOICES_3D = {"FA2", "MULTILEVEL", "SPECTRAL", "SPRING", "KAMADA_KAWAI", "TSNE", "UMAP"}
 
 FA2_ITERATIONS_DEFAULT = "7x"
 FA2_ITERATIONS_FLOOR = 100
+# Share of the FA2 budget used when the layout is seeded from a previous run's positions.
+WARM_START_ITERATION_FRACTION = 0.25
+# Below this share of already-placed nodes a warm start is not worth it: start from scratch.
+WARM_START_MIN_KNOWN_SHARE = 0.5
+
+# Initial placements for ForceAtlas2 (``--layout-seed``). AUTO keeps Kamada-Kawai
+# on small graphs, where it is cheap, and switches to pivot MDS above the threshold.
+LAYOUT_SEED_AUTO = "AUTO"
+LAYOUT_SEED_KAMADA_KAWAI = "KAMADA_KAWAI"
+LAYOUT_SEED_SPECTRAL = "SPECTRAL"
+LAYOUT_SEED_PIVOT_MDS = "PIVOT_MDS"
+LAYOUT_SEED_CHOICES = (LAYOUT_SEED_AUTO, LAYOUT_SEED_KAMADA_KAWAI, LAYOUT_SEED_SPECTRAL, LAYOUT_SEED_PIVOT_MDS)
+LAYOUT_SEED_KK_MAX_NODES = 500
+LAYOUT_SEED_LABELS = {
+    LAYOUT_SEED_KAMADA_KAWAI: "Kamada-Kawai",
+    LAYOUT_SEED_SPECTRAL: "Spectral seed",
+    LAYOUT_SEED_PIVOT_MDS: "Pivot MDS",
+}
+
+# Algorithm of the primary 2D and 3D layouts (``--layout-algorithm``). MULTILEVEL
+# replaces the full ForceAtlas2 pass with the coarsen–refine variant.
+LAYOUT_ALGORITHM_FA2 = "FA2"
+LAYOUT_ALGORITHM_MULTILEVEL = "MULTILEVEL"
+LAYOUT_ALGORITHM_CHOICES = (LAYOUT_ALGORITHM_FA2, LAYOUT_ALGORITHM_MULTILEVEL)
+LAYOUT_ALGORITHM_LABELS = {
+    LAYOUT_ALGORITHM_FA2: "ForceAtlas2",
+    LAYOUT_ALGORITHM_MULTILEVEL: "Multilevel FA2",
+}
+# FA2 iterations of each multilevel refinement step; a multilevel layout seeded from
+# a reference layout treats the reference as its coarser level.
+MULTILEVEL_REFINE_ITERATIONS = 50
 
 
 def resolve_iterations(value: str | int | None, num_nodes: int) -> int:
@@ -48,15 +93,18 @@ def resolve_iterations(value: str | int | None, num_nodes: int) -> int:
 def _build_forceatlas2(dim: int = 2) -> ForceAtlas2:
     """Return a ForceAtlas2 instance with standard settings for 2D or 3D layout.
 
-    Barnes-Hut optimisation is enabled for 2D only; it is 2D-specific and
-    must be disabled for the 3D back-end.
+    Repulsion uses the Barnes-Hut approximation in both cases: fa2 splits
+    space into a ``2^dim``-ary tree, i.e. a quadtree in 2D and an octree in
+    3D, with the same opening angle ``theta = 1.2``. The tree is rebuilt from
+    the current positions each iteration, so runs from the same initial
+    positions are identical.
     """
     return ForceAtlas2(
         outboundAttractionDistribution=True,
         edgeWeightInfluence=1.0,
         linLogMode=True,
         jitterTolerance=1.0,
-        barnesHutOptimize=dim == 2,
+        barnesHutOptimize=True,
         barnesHutTheta=1.2,
         scalingRatio=2.0,
         strongGravityMode=False,
@@ -112,6 +160,56 @@ def align_to_reference(
     return dict(zip(positions.keys(), (tuple(row) for row in all_pts.tolist()), strict=True))
 
 
+def warm_start_iterations(iterations: int) -> int:
+    """Reduced FA2 budget for a run seeded from a previous layout (floored like ``resolve_iterations``)."""
+    return max(FA2_ITERATIONS_FLOOR, int(iterations * WARM_START_ITERATION_FRACTION))
+
+
+def warm_start_reference(graph: nx.DiGraph, stored: dict | None) -> dict | None:
+    """Return *stored* if it places enough of *graph*'s nodes to seed a warm start, else ``None``."""
+    if not stored or not graph.number_of_nodes():
+        return None
+    known = sum(1 for node in graph.nodes() if node in stored)
+    return stored if known >= WARM_START_MIN_KNOWN_SHARE * graph.number_of_nodes() else None
+
+
+def seed_from_reference(graph: nx.DiGraph, reference: dict, dim: int = 2, method: str = LAYOUT_SEED_AUTO) -> dict:
+    """Initial FA2 positions for *graph*, reusing *reference* for every node it contains.
+
+    The *method* seed (Kamada-Kawai unless overridden, see ``seed_positions``)
+    runs only on the subgraph of the nodes missing from *reference*. Each
+    such node is then placed around the centroid of its neighbours that
+    already have a position — or, when it has none, around
+    the centroid of the whole reference — offset by its scaled seed position so
+    new nodes do not start on top of each other.
+    """
+    nodes = list(graph.nodes())
+    new_nodes = [node for node in nodes if node not in reference]
+    if not new_nodes:
+        return {node: reference[node] for node in nodes}
+
+    known = np.array([reference[node] for node in nodes if node in reference], dtype=float).reshape(-1, dim)
+    centre = known.mean(axis=0) if len(known) else np.zeros(dim)
+    # Typical spacing between placed nodes; new clusters get room proportional to their size.
+    radius = float(np.abs(known - centre).max()) if len(known) else 1.0
+    spacing = (radius or 1.0) / np.sqrt(max(len(known), 1))
+    subgraph = graph.subgraph(new_nodes)
+    kk = seed_positions(subgraph, method, dim)
+
+    initial = {}
+    for node in nodes:
+        if node in reference:
+            initial[node] = reference[node]
+            continue
+        placed = [reference[v] for v in (*graph.predecessors(node), *graph.successors(node)) if v in reference]
+        if placed:
+            position = np.mean(placed, axis=0) + spacing * np.asarray(kk[node])
+        else:
+            position = centre + spacing * np.sqrt(len(new_nodes)) * np.asarray(kk[node])
+        initial[node] = tuple(float(x) for x in position)
+    return initial
+
+
 def kamada_kawai_positions(graph: nx.DiGraph) -> dict:
     """Return initial node positions via Kamada-Kawai."""
     return nx.kamada_kawai_layout(graph, weight="weight")
@@ -124,34 +222,87 @@ def forceatlas2_positions(graph: nx.DiGraph, initial_pos: dict, iterations: int
     )
 
 
-def compute_layout(graph: nx.DiGraph, iterations: int = 10) -> dict[str, tuple[float, float]]:
-    """Run Kamada-Kawai then ForceAtlas2 on *graph*; return positions keyed by node pk."""
-    return forceatlas2_positions(graph, kamada_kawai_positions(graph), iterations)
+def compute_layout(
+    graph: nx.DiGraph, iterations: int = 10, seed: str = LAYOUT_SEED_AUTO
+) -> dict[str, tuple[float, float]]:
+    """Seed *graph* (see ``seed_positions``) then run ForceAtlas2; return positions keyed by node pk."""
+    return forceatlas2_positions(graph, seed_positions(graph, seed), iterations)
 
 
 _EXTRA_LAYOUT_SCALE = 500.0
 
+# Below this many nodes a dense eigendecomposition is cheaper than a sparse solver.
+_SPARSE_EIGEN_MIN_NODES = 500
+_EIGEN_MAX_ITERATIONS = 200
+# UMAP switches from the all-pairs hop matrix to landmark distances above this many nodes.
+_UMAP_EXACT_MAX_NODES = 2000
+_UMAP_LANDMARKS = 100
+_PIVOT_MDS_PIVOTS = 50
+# Multilevel FA2: stop coarsening at this size or when a level shrinks the graph by less than 10 %.
+_MULTILEVEL_MIN_NODES = 50
+_MULTILEVEL_MIN_REDUCTION = 0.9
+_MULTILEVEL_COARSEST_ITERATIONS = 500
+_MULTILEVEL_LEVEL_ITERATIONS = MULTILEVEL_REFINE_ITERATIONS
+
 
 # ── Private helpers ──────────────────────────────────────────────────────────
 
 
+def _normalized_adjacency(view: core.CSRGraph) -> sp.csr_array:
+    """``D^-1/2 A D^-1/2`` of the undirected symmetrisation of ``view`` (isolated rows are zero)."""
+    lo, hi, w = view.undirected_edges()
+    off = lo != hi
+    rows = np.concatenate((lo, hi[off]))
+    cols = np.concatenate((hi, lo[off]))
+    data = np.concatenate((w, w[off]))
+    adjacency = sp.csr_array((data, (rows, cols)), shape=(view.n, view.n))
+    deg = np.asarray(adjacency.sum(axis=1)).ravel()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d_inv_sqrt = np.where(deg > 0, 1.0 / np.sqrt(deg), 0.0)
+    scaling = sp.diags_array(d_inv_sqrt)
+    return (scaling @ adjacency @ scaling).tocsr()
+
+
+def _smallest_laplacian_eigenvectors(norm_adj: sp.csr_array, count: int) -> np.ndarray:
+    """Eigenvectors of the ``count`` smallest eigenvalues of ``L = I − norm_adj``, in ascending order.
+
+    Small matrices use a dense ``eigh``. Larger ones ask ARPACK (``eigsh``)
+    for the largest eigenvalues of ``norm_adj``, which are the smallest of
+    ``L``; LOBPCG on ``L`` takes over if ARPACK does not converge. Both start
+    from a fixed random vector so reruns agree.
+    """
+    n = norm_adj.shape[0]
+    if n < _SPARSE_EIGEN_MIN_NODES or count >= n - 1:
+        _eigenvalues, eigenvectors = np.linalg.eigh(np.eye(n) - norm_adj.toarray())
+        return eigenvectors[:, :count]
+    rng = np.random.default_rng(42)
+    try:
+        eigenvalues, eigenvectors = spla.eigsh(norm_adj, k=count, which="LA", v0=rng.random(n))
+        order = np.argsort(-eigenvalues)
+    except spla.ArpackNoConvergence:
+        laplacian = sp.eye_array(n, format="csr") - norm_adj
+        eigenvalues, eigenvectors = spla.lobpcg(
+            laplacian, rng.standard_normal((n, count)), tol=1e-6, maxiter=_EIGEN_MAX_ITERATIONS, largest=False
+        )
+        order = np.argsort(eigenvalues)
+    return eigenvectors[:, order]
+
+
 def _laplacian_features(graph: nx.DiGraph, k: int = 10) -> tuple[list, np.ndarray]:
     """Return (nodes_list, feature_matrix) using the k smallest non-trivial
-    normalised Laplacian eigenvectors of the undirected symmetrisation."""
+    normalised Laplacian eigenvectors of the undirected symmetrisation.
+
+    The Laplacian stays sparse, so only the ``k + 1`` eigenvectors are ever
+    held densely (see ``_smallest_laplacian_eigenvectors``)."""
     nodes = list(graph.nodes())
     n = len(nodes)
     k = min(k, max(n - 2, 1))
-    G_und = graph.to_undirected()
-    A = nx.to_numpy_array(G_und, nodelist=nodes, weight="weight")
-    deg = A.sum(axis=1)
-    with np.errstate(divide="ignore", invalid="ignore"):
-        d_inv_sqrt = np.where(deg > 0, 1.0 / np.sqrt(deg), 0.0)
-    D_inv_sqrt = np.diag(d_inv_sqrt)
-    L_norm = np.eye(n) - D_inv_sqrt @ A @ D_inv_sqrt
-    eigenvalues, eigenvectors = np.linalg.eigh(L_norm)
+    view = core.csr_view(graph)
+    eigenvectors = _smallest_laplacian_eigenvectors(_normalized_adjacency(view), k + 1)
     # skip eigenvector 0 (constant, eigenvalue ≈ 0)
     features = eigenvectors[:, 1 : k + 1]
-    return nodes, features
+    # Rows follow the view's sorted ids; hand them back in graph order.
+    return nodes, features[[view.index[node] for node in nodes]]
 
 
 def _scale_embedding(arr: np.ndarray, scale: float = 500.0) -> np.ndarray:
@@ -162,6 +313,19 @@ def _scale_embedding(arr: np.ndarray, scale: float = 500.0) -> np.ndarray:
     return arr
 
 
+def _hop_adjacency(view: core.CSRGraph) -> sp.csr_array:
+    """Unweighted adjacency of the undirected symmetrisation of ``view``, for BFS."""
+    lo, hi, _w = view.undirected_edges()
+    return sp.csr_array((np.ones(len(lo)), (lo, hi)), shape=(view.n, view.n))
+
+
+def _hop_distances(adjacency: sp.csr_array, sources: np.ndarray | int) -> np.ndarray:
+    """BFS hop counts from ``sources`` (one row each); unreachable nodes get the graph order n."""
+    dist = csgraph.shortest_path(adjacency, directed=False, unweighted=True, indices=sources)
+    dist[np.isinf(dist)] = float(adjacency.shape[0])
+    return dist
+
+
 def _shortest_path_matrix(graph: nx.DiGraph) -> tuple[list, np.ndarray]:
     """Return (nodes_list, distance_matrix) of all-pairs shortest-path lengths.
 
@@ -170,16 +334,204 @@ def _shortest_path_matrix(graph: nx.DiGraph) -> tuple[list, np.ndarray]:
     maximally far apart rather than encountering inf.
     """
     nodes = list(graph.nodes())
-    n = len(nodes)
-    node_idx = {node: i for i, node in enumerate(nodes)}
-    G_und = graph.to_undirected()
-    dist = np.full((n, n), float(n), dtype=float)
-    np.fill_diagonal(dist, 0.0)
-    for source, lengths in nx.all_pairs_shortest_path_length(G_und):
-        i = node_idx[source]
-        for target, length in lengths.items():
-            dist[i, node_idx[target]] = float(length)
-    return nodes, dist
+    view = core.csr_view(graph)
+    order = np.array([view.index[node] for node in nodes], dtype=np.int64)
+    dist = _hop_distances(_hop_adjacency(view), order)
+    return nodes, dist[:, order]
+
+
+def _landmark_distances(graph: nx.DiGraph, k: int) -> tuple[list, np.ndarray]:
+    """Return (nodes_list, n × k matrix) of hop distances to ``k`` landmark nodes.
+
+    Landmarks are picked by max-min (farthest-point) selection, as the pivots
+    of pivot MDS (Brandes & Pich 2006): the highest-degree node first, then
+    repeatedly the node farthest from every landmark chosen so far, so other
+    components and the periphery are covered early. One BFS per landmark
+    gives O(k(n + m)) time and O(nk) memory instead of the O(n²) matrix.
+    Distances follow ``_shortest_path_matrix`` (undirected, unreachable = n).
+    """
+    nodes = list(graph.nodes())
+    view = core.csr_view(graph)
+    adjacency = _hop_adjacency(view)
+    k = min(k, view.n)
+    columns = np.empty((view.n, k), dtype=float)
+    nearest = np.full(view.n, np.inf)
+    landmark = int(np.argmax(view.in_degree() + view.out_degree()))
+    for j in range(k):
+        columns[:, j] = _hop_distances(adjacency, landmark)
+        np.minimum(nearest, columns[:, j], out=nearest)
+        landmark = int(np.argmax(nearest))
+    return nodes, columns[[view.index[node] for node in nodes]]
+
+
+def _umap_embedding(graph: nx.DiGraph, n_components: int) -> tuple[list, np.ndarray]:
+    """UMAP embedding of the hop-distance geometry of ``graph`` (at least 4 nodes).
+
+    Up to ``_UMAP_EXACT_MAX_NODES`` nodes UMAP reads the exact all-pairs matrix
+    (``metric="precomputed"``); above it each node is described by its
+    distances to ``_UMAP_LANDMARKS`` landmarks, used as Euclidean features.
+    """
+    n = graph.number_of_nodes()
+    if n <= _UMAP_EXACT_MAX_NODES:
+        nodes, data = _shortest_path_matrix(graph)
+        metric = "precomputed"
+    else:
+        nodes, data = _landmark_distances(graph, _UMAP_LANDMARKS)
+        metric = "euclidean"
+    n_neighbors = min(15, n - 1)
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", category=UserWarning, module="umap")
+        embedding = _umap_lib.UMAP(
+            n_components=n_components, random_state=42, n_neighbors=n_neighbors, metric=metric
+        ).fit_transform(data)
+    return nodes, _scale_embedding(embedding)
+
+
+# ── ForceAtlas2 seeds ────────────────────────────────────────────────────────
+
+
+def resolve_layout_seed(method: str | None, num_nodes: int) -> str:
+    """Resolve ``AUTO`` (or an empty value) to Kamada-Kawai or pivot MDS depending on the graph size."""
+    method = (method or LAYOUT_SEED_AUTO).upper()
+    if method not in LAYOUT_SEED_CHOICES:
+        raise ValueError(f"Unknown layout seed {method!r}; expected one of {', '.join(LAYOUT_SEED_CHOICES)}.")
+    if method == LAYOUT_SEED_AUTO:
+        return LAYOUT_SEED_KAMADA_KAWAI if num_nodes <= LAYOUT_SEED_KK_MAX_NODES else LAYOUT_SEED_PIVOT_MDS
+    return method
+
+
+def _pivot_mds_coordinates(graph: nx.DiGraph, dim: int) -> tuple[list, np.ndarray]:
+    """Pivot MDS (Brandes & Pich 2006) on hop distances to ``_PIVOT_MDS_PIVOTS`` landmarks.
+
+    The n × k distance matrix is double-centred and projected on the top
+    eigenvectors of its k × k Gram matrix, approximating classical MDS on all
+    pairs at O(k(n + m)) cost. Unreachable pairs count as one hop more than
+    the longest finite distance, so components sit side by side.
+    """
+    nodes, dist = _landmark_distances(graph, _PIVOT_MDS_PIVOTS)
+    unreachable = dist >= len(nodes)
+    if unreachable.any():
+        dist[unreachable] = dist[~unreachable].max() + 1.0
+    squared = dist**2
+    centred = -0.5 * (squared - squared.mean(axis=0) - squared.mean(axis=1, keepdims=True) + squared.mean())
+    _values, vectors = np.linalg.eigh(centred.T @ centred)
+    return nodes, centred @ vectors[:, ::-1][:, :dim]
+
+
+def seed_positions(graph: nx.DiGraph, method: str = LAYOUT_SEED_AUTO, dim: int = 2) -> dict:
+    """Initial ForceAtlas2 positions of *graph* in *dim* dimensions.
+
+    ``KAMADA_KAWAI`` needs all-pairs distances and O(n²) memory, so ``AUTO``
+    only uses it up to ``LAYOUT_SEED_KK_MAX_NODES`` nodes and pivot MDS above.
+    ``SPECTRAL`` uses the smallest non-trivial normalised Laplacian
+    eigenvectors. Spectral and pivot-MDS coordinates are scaled to the
+    Kamada-Kawai range [-1, 1], and nodes they place on the same point (e.g.
+    leaves of one hub) are separated by a tiny fixed-seed jitter, since FA2
+    cannot pull coincident nodes apart.
+    """
+    nodes = list(graph.nodes())
+    method = resolve_layout_seed(method, len(nodes))
+    if method == LAYOUT_SEED_KAMADA_KAWAI or len(nodes) <= dim + 1:
+        return kamada_kawai_positions(graph) if dim == 2 else kamada_kawai_positions_3d(graph)
+    if method == LAYOUT_SEED_SPECTRAL:
+        nodes, coords = _laplacian_features(graph, k=dim)
+    else:
+        nodes, coords = _pivot_mds_coordinates(graph, dim)
+    coords = _scale_embedding(coords, 1.0)
+    coords = coords + np.random.default_rng(42).uniform(-1e-3, 1e-3, coords.shape)
+    return {node: tuple(float(x) for x in coords[i]) for i, node in enumerate(nodes)}
+
+
+# ── Multilevel ForceAtlas2 ───────────────────────────────────────────────────
+
+
+def _fa2_adjacency(view: core.CSRGraph) -> sp.csr_array:
+    """Symmetric 0/1 adjacency of ``view`` without self-loops — the graph FA2 sees via ``to_undirected()``."""
+    lo, hi, _w = view.undirected_edges()
+    keep = lo != hi
+    lo, hi = lo[keep], hi[keep]
+    ones = np.ones(2 * len(lo))
+    return sp.csr_array((ones, (np.concatenate((lo, hi)), np.concatenate((hi, lo)))), shape=(view.n, view.n))
+
+
+def _coarsen(adjacency: sp.csr_array) -> tuple[np.ndarray, int]:
+    """Group the nodes of ``adjacency`` for the next coarser level; return ``(group of each node, group count)``.
+
+    Nodes are visited from the lowest degree up and paired with the free
+    neighbour of highest ``weight / degree`` (heavy-edge matching that
+    prefers light partners). A node whose neighbours are all taken joins the
+    group of its heaviest neighbour, so the leaves of a hub collapse into the
+    hub in one level instead of one pair at a time. Isolated nodes stay alone.
+    """
+    n = adjacency.shape[0]
+    indptr, indices, data = adjacency.indptr, adjacency.indices, adjacency.data
+    degree = np.diff(indptr)
+    group = np.full(n, -1, dtype=np.int64)
+    count = 0
+    left_over = []
+    for u in np.argsort(degree, kind="stable").tolist():
+        if group[u] >= 0:
+            continue
+        neighbours = indices[indptr[u] : indptr[u + 1]]
+        free = group[neighbours] < 0
+        if free.any():
+            candidates = neighbours[free]
+            v = candidates[np.argmax(data[indptr[u] : indptr[u + 1]][free] / degree[candidates])]
+            group[u] = group[v] = count
+        elif len(neighbours):
+            left_over.append(u)
+            continue
+        else:
+            group[u] = count
+        count += 1
+    for u in left_over:
+        start, end = indptr[u], indptr[u + 1]
+        group[u] = group[indices[start + np.argmax(data[start:end])]]
+    return group, count
+
+
+def _multilevel_layout(graph: nx.DiGraph, dim: int) -> dict:
+    """Coarsen–refine ForceAtlas2 (Walshaw 2003; Hu 2005) of *graph* in *dim* dimensions.
+
+    ``_coarsen`` is applied until the graph has ``_MULTILEVEL_MIN_NODES``
+    nodes or stops shrinking; coarse edges carry the number of fine edges
+    they merge. The coarsest graph is seeded with ``seed_positions`` and laid
+    out with ``_MULTILEVEL_COARSEST_ITERATIONS`` FA2 iterations. Each finer
+    level starts its nodes at their group's position, spread by a fixed-seed
+    jitter of a tenth of the mean coarse edge length, and runs
+    ``_MULTILEVEL_LEVEL_ITERATIONS`` iterations. The finest level uses the
+    unweighted undirected graph, like ``forceatlas2_positions``.
+    """
+    if graph.number_of_nodes() == 0:
+        return {}
+    view = core.csr_view(graph)
+    levels = [_fa2_adjacency(view)]
+    groups = []
+    while levels[-1].shape[0] > _MULTILEVEL_MIN_NODES:
+        group, count = _coarsen(levels[-1])
+        if count > _MULTILEVEL_MIN_REDUCTION * levels[-1].shape[0]:
+            break
+        projection = sp.csr_array((np.ones(len(group)), (np.arange(len(group)), group)), shape=(len(group), count))
+        coarse = (projection.T @ levels[-1] @ projection).tocsr()
+        coarse.setdiag(0)
+        coarse.eliminate_zeros()
+        groups.append(group)
+        levels.append(coarse)
+
+    coarsest = nx.from_scipy_sparse_array(levels[-1], create_using=nx.DiGraph)
+    seed = seed_positions(coarsest, LAYOUT_SEED_AUTO, dim)
+    coords = np.array([seed[i] for i in range(levels[-1].shape[0])], dtype=np.float64)
+    fa2 = _build_forceatlas2(dim=dim)
+    if levels[-1].nnz:
+        coords = np.array(fa2.forceatlas2(levels[-1], pos=coords, iterations=_MULTILEVEL_COARSEST_ITERATIONS))
+    rng = np.random.default_rng(42)
+    for level in range(len(groups) - 1, -1, -1):
+        rows, cols = levels[level + 1].nonzero()
+        spread = 0.1 * np.linalg.norm(coords[rows] - coords[cols], axis=1).mean() if len(rows) else 0.1
+        coords = coords[groups[level]] + rng.uniform(-spread, spread, (len(groups[level]), dim))
+        if levels[level].nnz:
+            coords = np.array(fa2.forceatlas2(levels[level], pos=coords, iterations=_MULTILEVEL_LEVEL_ITERATIONS))
+    return {node: tuple(float(x) for x in coords[view.index[node]]) for node in graph.nodes()}
 
 
 # ── 2D extra layouts ─────────────────────────────────────────────────────────
@@ -242,27 +594,20 @@ def tsne_positions_2d(graph: nx.DiGraph) -> dict[str, tuple[float, float]]:
 
 
 def umap_positions_2d(graph: nx.DiGraph) -> dict[str, tuple[float, float]]:
-    """2D UMAP embedding on the all-pairs shortest-path distance matrix.
+    """2D UMAP embedding on shortest-path (hop) distances.
 
-    McInnes et al. 2018.  Using precomputed graph distances (not Laplacian
+    McInnes et al. 2018.  Using graph distances (not Laplacian
     eigenvectors) gives a perspective complementary to t-SNE: UMAP sees raw
     topological distances, so nodes that are many hops apart are pushed far
     apart globally — not just locally separated by cluster membership.
-    Falls back to t-SNE when umap-learn is unavailable.
+    Large graphs use landmark distances (see ``_umap_embedding``).  Falls
+    back to t-SNE when umap-learn is unavailable.
     """
     if not HAS_UMAP:
         return tsne_positions_2d(graph)
-    nodes, dist = _shortest_path_matrix(graph)
-    n = len(nodes)
-    if n < 4:
+    if graph.number_of_nodes() < 4:
         return kamada_kawai_positions(graph)
-    n_neighbors = min(15, n - 1)
-    with warnings.catch_warnings():
-        warnings.filterwarnings("ignore", category=UserWarning, module="umap")
-        embedding = _umap_lib.UMAP(
-            n_components=2, random_state=42, n_neighbors=n_neighbors, metric="precomputed"
-        ).fit_transform(dist)
-    embedding = _scale_embedding(embedding)
+    nodes, embedding = _umap_embedding(graph, 2)
     return {node: (float(embedding[i, 0]), float(embedding[i, 1])) for i, node in enumerate(nodes)}
 
 
@@ -297,6 +642,11 @@ def hyperbolic_positions(graph: nx.DiGraph) -> dict[str, tuple[float, float]]:
     return result
 
 
+def multilevel_positions_2d(graph: nx.DiGraph) -> dict[str, tuple[float, float]]:
+    """Multilevel ForceAtlas2 in 2D: lay out a coarsened graph, then refine level by level."""
+    return _multilevel_layout(graph, dim=2)
+
+
 # ── 3D extra layouts ─────────────────────────────────────────────────────────
 
 
@@ -336,28 +686,27 @@ def tsne_positions_3d(graph: nx.DiGraph) -> dict[str, tuple[float, float, float]
 
 
 def umap_positions_3d(graph: nx.DiGraph) -> dict[str, tuple[float, float, float]]:
-    """3D UMAP embedding on the all-pairs shortest-path distance matrix.
+    """3D UMAP embedding on shortest-path (hop) distances.
 
-    McInnes et al. 2018.  Falls back to 3D t-SNE when umap-learn is unavailable.
+    McInnes et al. 2018.  Large graphs use landmark distances (see
+    ``_umap_embedding``).  Falls back to 3D t-SNE when umap-learn is
+    unavailable.
     """
     if not HAS_UMAP:
         return tsne_positions_3d(graph)
-    nodes, dist = _shortest_path_matrix(graph)
-    n = len(nodes)
-    if n < 4:
+    if graph.number_of_nodes() < 4:
         return kamada_kawai_positions_3d(graph)
-    n_neighbors = min(15, n - 1)
-    with warnings.catch_warnings():
-        warnings.filterwarnings("ignore", category=UserWarning, module="umap")
-        embedding = _umap_lib.UMAP(
-            n_components=3, random_state=42, n_neighbors=n_neighbors, metric="precomputed"
-        ).fit_transform(dist)
-    embedding = _scale_embedding(embedding)
+    nodes, embedding = _umap_embedding(graph, 3)
     return {
         node: (float(embedding[i, 0]), float(embedding[i, 1]), float(embedding[i, 2])) for i, node in enumerate(nodes)
     }
 
 
+def multilevel_positions_3d(graph: nx.DiGraph) -> dict[str, tuple[float, float, float]]:
+    """Multilevel ForceAtlas2 in 3D: lay out a coarsened graph, then refine level by level."""
+    return _multilevel_layout(graph, dim=3)
+
+
 # ── Primary 3D pipeline ──────────────────────────────────────────────────────
 
 
@@ -377,14 +726,16 @@ def forceatlas2_positions_3d(
 ) -> dict[str, tuple[float, float, float]]:
     """Run ForceAtlas2 in 3D on *graph* starting from *initial_pos*.
 
-    Barnes-Hut optimisation is disabled because it is 2D-only; the vectorised
-    O(n²) back-end is used instead.
+    Repulsion is approximated with an octree (Barnes-Hut), O(n log n) per
+    iteration instead of the exact O(n²) pairwise sum.
     """
     return _build_forceatlas2(dim=3).forceatlas2_networkx_layout(
         graph.to_undirected(), pos=initial_pos, iterations=iterations
     )
 
 
-def compute_layout_3d(graph: nx.DiGraph, iterations: int = 10) -> dict[str, tuple[float, float, float]]:
-    """Run Kamada-Kawai then ForceAtlas2 in 3D on *graph*; return 3D positions keyed by node id."""
-    return forceatlas2_positions_3d(graph, kamada_kawai_positions_3d(graph), iterations)
+def compute_layout_3d(
+    graph: nx.DiGraph, iterations: int = 10, seed: str = LAYOUT_SEED_AUTO
+) -> dict[str, tuple[float, float, float]]:
+    """Seed *graph* in 3D (see ``seed_positions``) then run ForceAtlas2; return 3D positions keyed by node id."""
+    return forceatlas2_positions_3d(graph, seed_positions(graph, seed, dim=3), iterations)
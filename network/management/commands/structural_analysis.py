@@ -1,5 +1,6 @@
 import argparse
 import datetime
+import io
 import os
 import re
 import shutil
@@ -10,22 +11,22 @@ from typing import Any
 
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
-from django.db.models import Max, Min
 
 from network import (
+    cache,
     community,
     community_stats,
     exporter,
     graph_builder,
     layout,
     measures,
+    parallel,
     robustness,
     tables,
     vacancy_analysis,
 )
 from network.graph_builder import VALID_EDGE_WEIGHT_STRATEGIES
 from network.utils import GraphData
-from webapp.models import Message
 from webapp.utils.channel_types import VALID_CHANNEL_TYPES
 from webapp.utils.colors import is_known_palette
 
@@ -42,6 +43,7 @@ def _parse_csv(value: str) -> list[str]:
 # `network.layout.EXTRA_LAYOUT_CHOICES_2D` / `_3D`, instead of three places.
 
 _EXTRA_LAYOUT_FUNCS_2D: dict[str, Any] = {
+    "MULTILEVEL": layout.multilevel_positions_2d,
     "CIRCULAR": layout.circular_positions,
     "KAMADA_KAWAI": layout.kamada_kawai_positions,
     "TSNE": layout.tsne_positions_2d,
@@ -51,6 +53,7 @@ _EXTRA_LAYOUT_FUNCS_2D: dict[str, Any] = {
 }
 
 _EXTRA_LAYOUT_FUNCS_3D: dict[str, Any] = {
+    "MULTILEVEL": layout.multilevel_positions_3d,
     "SPECTRAL": layout.spectral_positions,
     "SPRING": layout.spring_positions,
     "KAMADA_KAWAI": layout.kamada_kawai_positions_3d,
@@ -66,14 +69,21 @@ def _compute_extra_layouts(
     dim: int = 2,
     strategy_results: dict | None = None,
     on_progress: "callable[[str], None] | None" = None,
+    primary: tuple[str, dict] | None = None,
 ) -> dict[str, dict]:
     """Compute every extra layout in ``names`` (excluding FA2, which is the
-    primary layout) and return ``{lower_case_name: positions}``."""
+    primary layout) and return ``{lower_case_name: positions}``.
+
+    ``primary`` is the ``(algorithm, positions)`` of the primary layout; an
+    extra layout with the same algorithm reuses its positions."""
     funcs = _EXTRA_LAYOUT_FUNCS_2D if dim == 2 else _EXTRA_LAYOUT_FUNCS_3D
     out: dict[str, dict] = {}
     for name in names:
         if name == "FA2":
             continue
+        if primary is not None and name == primary[0]:
+            out[name.lower()] = primary[1]
+            continue
         if on_progress is not None:
             on_progress(name)
         if dim == 2 and name == "COMMUNITY_SHELL":
@@ -125,6 +135,8 @@ class ResolvedOptions:
     # (e.g. "7x" = 7 × channel count). Resolved against the graph node count
     # inside _compute_layout via layout.resolve_iterations().
     fa2_iterations: str | int
+    layout_seed: str
+    layout_algorithm: str
     extra_layout_names: list[str]
     extra_layout_names_3d: list[str]
 
@@ -153,6 +165,7 @@ class ResolvedOptions:
 
     # Tunable measure / strategy parameters
     spreading_runs: int
+    betweenness_samples: int
     diffusion_window: int
     leiden_coarse_resolution: float
     leiden_fine_resolution: float
@@ -175,8 +188,16 @@ class ResolvedOptions:
     robustness_strategies: list[str] = field(default_factory=list)
     robustness_runs: int = 100
     robustness_null: int = 20
+    robustness_null_model: str = "WEIGHTS"
     robustness_seed: int = 42
     robustness_sample: int = 500
+    robustness_curve_tolerance: float = 0.0
+    robustness_dyn_batch: float = 1
+
+    # Parallelism and caching
+    jobs: int = 1
+    cache_size_mb: int = 0
+    warm_start_layout: bool = False
 
     # Export naming
     export_name: str = ""
@@ -200,6 +221,8 @@ class ResolvedOptions:
             "seo": self.seo,
             "vertical_layout": self.vertical_layout,
             "fa2_iterations": self.fa2_iterations,
+            "layout_seed": self.layout_seed,
+            "layout_algorithm": self.layout_algorithm,
             "draw_dead_leaves": self.draw_dead_leaves,
             "dead_leaves_color": self.dead_leaves_color,
             "community_palette": self.community_palette,
@@ -210,6 +233,7 @@ class ResolvedOptions:
             "include_private": self.include_private,
             "timeline_step": self.timeline_step,
             "spreading_runs": self.spreading_runs,
+            "betweenness_samples": self.betweenness_samples,
             "diffusion_window": self.diffusion_window,
             "leiden_coarse_resolution": self.leiden_coarse_resolution,
             "leiden_fine_resolution": self.leiden_fine_resolution,
@@ -224,9 +248,15 @@ class ResolvedOptions:
             "robustness_strategies": ",".join(self.robustness_strategies) if self.robustness_strategies else "",
             "robustness_runs": self.robustness_runs,
             "robustness_null": self.robustness_null,
+            "robustness_null_model": self.robustness_null_model,
             "robustness_seed": self.robustness_seed,
             "robustness_sample": self.robustness_sample,
+            "robustness_curve_tolerance": self.robustness_curve_tolerance,
+            "robustness_dyn_batch": self.robustness_dyn_batch,
             "recency_weights": self.recency_weights,
+            "jobs": self.jobs,
+            "cache_size_mb": self.cache_size_mb,
+            "warm_start_layout": self.warm_start_layout,
         }
 
 
@@ -318,6 +348,43 @@ class Command(BaseCommand):
                 "Floored at 100 iterations regardless. Default: 7x."
             ),
         )
+        parser.add_argument(
+            "--layout-seed",
+            dest="layout_seed",
+            type=str.upper,
+            choices=layout.LAYOUT_SEED_CHOICES,
+            default=None,
+            help=(
+                "Initial placement from which ForceAtlas2 starts: KAMADA_KAWAI (O(n²) memory), SPECTRAL "
+                "(sparse Laplacian eigenvectors) or PIVOT_MDS (classical MDS on hop distances to 50 pivots). "
+                f"AUTO uses Kamada-Kawai up to {layout.LAYOUT_SEED_KK_MAX_NODES} channels and pivot MDS above. "
+                "Default: AUTO."
+            ),
+        )
+        parser.add_argument(
+            "--layout-algorithm",
+            dest="layout_algorithm",
+            type=str.upper,
+            choices=layout.LAYOUT_ALGORITHM_CHOICES,
+            default=None,
+            help=(
+                "Algorithm of the primary 2D and 3D layouts: FA2 (ForceAtlas2 for --fa2-iterations) or MULTILEVEL "
+                "(coarsen-refine ForceAtlas2, seconds instead of minutes on large graphs). With MULTILEVEL, "
+                "FA2 in --2dlayouts / --3dlayouts stands for the MULTILEVEL layout. Default: FA2."
+            ),
+        )
+        parser.add_argument(
+            "--warm-start-layout",
+            dest="warm_start_layout",
+            action=argparse.BooleanOptionalAction,
+            default=None,
+            help=(
+                "Start the 2D and 3D ForceAtlas2 layouts from the positions stored by the previous run with the "
+                "same --name (tmp/layout-cache), computing Kamada-Kawai only for new channels and running a "
+                "quarter of the FA2 iterations. Falls back to a full layout when fewer than half of the channels "
+                "have a stored position. Only applies when --name is given. Default: on."
+            ),
+        )
         parser.add_argument(
             "--vertical-layout",
             dest="vertical_layout",
@@ -337,7 +404,8 @@ class Command(BaseCommand):
                 "Comma-separated list of 2D layout algorithms to compute. "
                 "When omitted, ForceAtlas2 (FA2) is computed as the only layout. "
                 "The browser graph viewer offers a dropdown to switch between them at viewing time. "
-                "Available: FA2, CIRCULAR, KAMADA_KAWAI, COMMUNITY_SHELL, TSNE, UMAP, HYPERBOLIC, ALL. Requires --2dgraph."
+                "Available: FA2, MULTILEVEL, CIRCULAR, KAMADA_KAWAI, COMMUNITY_SHELL, TSNE, UMAP, HYPERBOLIC, ALL. "
+                "Requires --2dgraph."
             ),
         )
         parser.add_argument(
@@ -349,7 +417,7 @@ class Command(BaseCommand):
                 "Comma-separated list of 3D layout algorithms to compute. "
                 "When omitted, ForceAtlas2 (FA2) is computed as the only layout. "
                 "The 3D graph viewer offers a dropdown to switch between them at viewing time. "
-                "Available: FA2, SPECTRAL, SPRING, KAMADA_KAWAI, TSNE, UMAP, ALL. Requires --3dgraph."
+                "Available: FA2, MULTILEVEL, SPECTRAL, SPRING, KAMADA_KAWAI, TSNE, UMAP, ALL. Requires --3dgraph."
             ),
         )
         parser.add_argument(
@@ -440,6 +508,42 @@ class Command(BaseCommand):
             metavar="N",
             help="Number of Monte Carlo SIR simulations per node for the SPREADING measure. Default: 200.",
         )
+        parser.add_argument(
+            "--betweenness-samples",
+            dest="betweenness_samples",
+            type=int,
+            default=None,
+            metavar="K",
+            help=(
+                "Estimate betweenness (BETWEENNESS, BRIDGING and the betweenness robustness strategies) from K "
+                "sampled source pivots instead of all nodes; the error bound is reported in meta.json. "
+                "0 = exact. Default: 0."
+            ),
+        )
+        parser.add_argument(
+            "--jobs",
+            dest="jobs",
+            type=int,
+            default=None,
+            metavar="N",
+            help=(
+                "Worker processes for the graph measures, the SPREADING simulations, the community strategies, "
+                "the robustness attack curves and the per-year timeline exports. Results and output order do "
+                "not depend on N. 1 = serial. Default: 1."
+            ),
+        )
+        parser.add_argument(
+            "--cache-size-mb",
+            dest="cache_size_mb",
+            type=int,
+            default=None,
+            metavar="MB",
+            help=(
+                "Size budget of the on-disk cache of graph measures and community partitions (tmp/structural-cache). "
+                "Reruns on an unchanged graph reuse the cached results; the least recently used entries are "
+                "evicted beyond the budget. 0 = disabled. Default: 1024."
+            ),
+        )
         parser.add_argument(
             "--diffusion-window",
             dest="diffusion_window",
@@ -704,10 +808,23 @@ class Command(BaseCommand):
             default=None,
             metavar="K",
             help=(
-                "Number of weight-rewiring null-model simulations per strategy. "
+                "Number of null-model simulations per strategy (see --robustness-null-model). "
                 "0 disables the null model (no z-scores computed). Default: 20."
             ),
         )
+        parser.add_argument(
+            "--robustness-null-model",
+            dest="robustness_null_model",
+            type=str.upper,
+            choices=robustness.NULL_MODEL_CHOICES,
+            default=None,
+            help=(
+                "Null model the observed R values are compared against. WEIGHTS shuffles the edge weights over "
+                "the observed topology; STRENGTH rewires the edges at fixed in- and out-degrees (Maslov-Sneppen "
+                "swaps) and reassigns the weights so each channel keeps approximately its in- and out-strength. "
+                "Default: WEIGHTS."
+            ),
+        )
         parser.add_argument(
             "--robustness-strategies",
             dest="robustness_strategies",
@@ -742,6 +859,30 @@ class Command(BaseCommand):
             metavar="N",
             help=("Source-sample size for the R_reach metric on graphs larger than this many nodes. Default: 500."),
         )
+        parser.add_argument(
+            "--robustness-curve-tolerance",
+            dest="robustness_curve_tolerance",
+            type=float,
+            default=None,
+            metavar="ε",
+            help=(
+                "0 computes the SCC and REACH attack curves after every removal. A positive value evaluates them "
+                "on an adaptive grid of removal steps, refined around the critical threshold, until every R_scc "
+                "and R_reach is bounded within ε; the bounds are written to robustness.json. Default: 0."
+            ),
+        )
+        parser.add_argument(
+            "--robustness-dyn-batch",
+            dest="robustness_dyn_batch",
+            type=float,
+            default=None,
+            metavar="K",
+            help=(
+                "Number of channels the dynamic (_dyn) strategies remove between two re-rankings of the residual "
+                "graph; a value below 1 is a fraction of the channels (0.01 = re-rank after every 1%%). "
+                "Default: 1 (re-rank after every removal)."
+            ),
+        )
         parser.add_argument(
             "--name",
             dest="name",
@@ -825,31 +966,65 @@ class Command(BaseCommand):
         edge_list: list,
         communities_strategy: list[str],
         options: dict,
+        result_cache: "cache.ResultCache | None" = None,
     ) -> dict[str, tuple]:
-        """Run all community detection strategies and apply results to the graph."""
+        """Run all community detection strategies and apply results to the graph.
+
+        Partitions of the graph-only algorithms are looked up in ``result_cache``
+        first; the palette is always rebuilt, so palette options never miss. The
+        others run through ``community.detect_all`` on ``options["jobs"]``
+        processes, and every result is applied in the declared strategy order.
+        """
         strategy_results: dict[str, tuple] = {}
+        # Detector parameters that change the partition, per strategy.
+        strategy_params: dict[str, dict[str, float]] = {
+            "LEIDEN_CPM_COARSE": {"resolution": options["leiden_coarse_resolution"]},
+            "LEIDEN_CPM_FINE": {"resolution": options["leiden_fine_resolution"]},
+            "MCL": {"inflation": options["mcl_inflation"]},
+        }
+        cache_params = {strategy: [strategy, strategy_params.get(strategy, {})] for strategy in communities_strategy}
+        cached_maps: dict[str, dict] = {}
+        if result_cache is not None:
+            for strategy in communities_strategy:
+                if strategy in community.COMMUNITY_ALGORITHMS:
+                    hit = result_cache.get("partition", cache_params[strategy])
+                    if hit is not None:
+                        cached_maps[strategy] = hit
+        # The remaining strategies run up front (concurrently when jobs > 1) and
+        # are collected below in declared order.
+        detected = community.detect_all(
+            [strategy for strategy in communities_strategy if strategy not in cached_maps],
+            options["community_palette"],
+            graph,
+            channel_dict,
+            jobs=options.get("jobs", 1),
+            reverse=options["community_palette_reversed"],
+            leiden_coarse_resolution=options["leiden_coarse_resolution"],
+            leiden_fine_resolution=options["leiden_fine_resolution"],
+            mcl_inflation=options["mcl_inflation"],
+        )
         self.stdout.write("Calculate communities")
         self.stdout.flush()
         for strategy in communities_strategy:
             self.stdout.write(f"- {strategy.lower()} … ", ending="")
             self.stdout.flush()
-            try:
-                community_map, community_palette = community.detect(
-                    strategy,
-                    options["community_palette"],
-                    graph,
-                    channel_dict,
-                    reverse=options["community_palette_reversed"],
-                    leiden_coarse_resolution=options["leiden_coarse_resolution"],
-                    leiden_fine_resolution=options["leiden_fine_resolution"],
-                    mcl_inflation=options["mcl_inflation"],
+            from_cache = strategy in cached_maps
+            if from_cache:
+                community_map = cached_maps[strategy]
+                community_palette = community.build_community_palette(
+                    community_map, options["community_palette"], reverse=options["community_palette_reversed"]
                 )
-            except ValueError as e:
-                raise CommandError(str(e)) from e
+            else:
+                try:
+                    community_map, community_palette = next(detected)
+                except ValueError as e:
+                    raise CommandError(str(e)) from e
+                if result_cache is not None and strategy in community.COMMUNITY_ALGORITHMS:
+                    result_cache.put("partition", cache_params[strategy], community_map)
             community.apply_to_graph(graph, channel_dict, community_map, community_palette, strategy)
             strategy_results[strategy] = (community_map, community_palette)
             n_communities = len(set(community_map.values()))
-            self.stdout.write(f"{n_communities} communities")
+            self.stdout.write(f"{n_communities} communities" + (" (cached)" if from_cache else ""))
             self.stdout.flush()
         community.apply_edge_colors(graph, edge_list, channel_dict)
         return strategy_results
@@ -863,6 +1038,9 @@ class Command(BaseCommand):
         target_layout: str,
         reference_positions: "dict | None" = None,
         reference_positions_3d: "dict | None" = None,
+        warm_start: bool = False,
+        seed: str = layout.LAYOUT_SEED_AUTO,
+        algorithm: str = layout.LAYOUT_ALGORITHM_FA2,
     ) -> tuple[dict, dict | None]:
         """Compute 2D (and optionally 3D) ForceAtlas2 positions.
 
@@ -871,6 +1049,18 @@ class Command(BaseCommand):
         Kamada-Kawai run and seeds FA2 from the reference instead, running KK
         only for nodes absent from the reference.  For 2D the orientation is
         also corrected via discrete 90°-rotation alignment.
+
+        With *warm_start* the references are instead the positions stored by
+        the previous run of the same export: FA2 then only runs a reduced
+        share of its iterations, and the usual aspect-ratio rotation still
+        applies after the alignment.
+
+        *seed* selects the initial placement of the nodes without a reference
+        position (see ``layout.seed_positions``).
+
+        With *algorithm* ``MULTILEVEL`` the full FA2 pass is skipped: a layout
+        without a reference is the multilevel layout, and one seeded from a
+        reference only runs ``layout.MULTILEVEL_REFINE_ITERATIONS`` iterations.
         """
         positions_3d: dict | None = None
         if not (do_graph or do_3dgraph):
@@ -879,35 +1069,59 @@ class Command(BaseCommand):
         # Resolve "Nx" multiplier form to a concrete iteration count using the
         # current graph's node count (floored at 100).
         fa2_iterations = layout.resolve_iterations(fa2_iterations, graph.number_of_nodes())
+        source = "previous layout" if warm_start else "reference layout"
 
-        self.stdout.write("\nSet spatial distribution of nodes")
+        def _seed_label(num_nodes: int) -> str:
+            return layout.LAYOUT_SEED_LABELS[layout.resolve_layout_seed(seed, num_nodes)]
 
-        if reference_positions is not None:
-            # Seed FA2 from the full-range layout so each year starts from the
-            # same orientation.  KK is only computed for nodes absent from the
-            # reference (channels that first appear in this specific year).
-            new_nodes = [n for n in graph.nodes() if n not in reference_positions]
-            if new_nodes:
-                self.stdout.write(f"- Kamada-Kawai ({len(new_nodes)} new nodes) … ", ending="")
+        def _initial_positions(reference: "dict | None", dim: int) -> dict:
+            suffix = "" if dim == 2 else " 3D"
+            if reference is None:
+                self.stdout.write(f"- {_seed_label(graph.number_of_nodes())}{suffix} … ", ending="")
                 self.stdout.flush()
-                kk_pos = layout.kamada_kawai_positions(graph)
-                initial_pos = {n: reference_positions.get(n, kk_pos[n]) for n in graph.nodes()}
-                self.stdout.write("done")
+                initial = layout.seed_positions(graph, seed, dim)
             else:
-                self.stdout.write("- seeding from reference layout … ", ending="")
+                # Seed FA2 from the reference so the layout keeps its orientation.
+                # The seed is only computed for nodes absent from the reference
+                # (channels that first appear in this year or since the previous run).
+                new_nodes = sum(1 for n in graph.nodes() if n not in reference)
+                if new_nodes:
+                    self.stdout.write(f"- {_seed_label(new_nodes)}{suffix} ({new_nodes} new nodes) … ", ending="")
+                else:
+                    self.stdout.write(f"- seeding{suffix} from {source} … ", ending="")
                 self.stdout.flush()
-                initial_pos = {n: reference_positions[n] for n in graph.nodes()}
-                self.stdout.write("done")
-        else:
-            self.stdout.write("- Kamada-Kawai … ", ending="")
+                initial = layout.seed_from_reference(graph, reference, dim=dim, method=seed)
+            self.stdout.write("done")
+            return initial
+
+        multilevel = algorithm == layout.LAYOUT_ALGORITHM_MULTILEVEL
+
+        def _iterations(reference: "dict | None") -> tuple[int, str]:
+            if multilevel:
+                return layout.MULTILEVEL_REFINE_ITERATIONS, ", multilevel refinement"
+            if warm_start and reference is not None:
+                return layout.warm_start_iterations(fa2_iterations), ", warm start"
+            return fa2_iterations, ""
+
+        def _multilevel(dim: int) -> dict:
+            suffix = "" if dim == 2 else " 3D"
+            self.stdout.write(f"- multilevel ForceAtlas2{suffix} … ", ending="")
             self.stdout.flush()
-            initial_pos = layout.kamada_kawai_positions(graph)
+            placed = layout.multilevel_positions_2d(graph) if dim == 2 else layout.multilevel_positions_3d(graph)
             self.stdout.write("done")
+            return placed
 
-        self.stdout.write(f"- ForceAtlas2 ({fa2_iterations} iterations) … ", ending="")
-        self.stdout.flush()
-        positions = layout.forceatlas2_positions(graph, initial_pos, fa2_iterations)
-        self.stdout.write("done")
+        self.stdout.write("\nSet spatial distribution of nodes")
+
+        if multilevel and reference_positions is None:
+            positions = _multilevel(2)
+        else:
+            initial_pos = _initial_positions(reference_positions, 2)
+            iterations, note = _iterations(reference_positions)
+            self.stdout.write(f"- ForceAtlas2 ({iterations} iterations{note}) … ", ending="")
+            self.stdout.flush()
+            positions = layout.forceatlas2_positions(graph, initial_pos, iterations)
+            self.stdout.write("done")
 
         if reference_positions is not None:
             # Align orientation to the reference using the best of the four
@@ -915,7 +1129,7 @@ class Command(BaseCommand):
             self.stdout.write("- aligning orientation … ", ending="")
             positions = layout.align_to_reference(positions, reference_positions)
             self.stdout.write("done")
-        else:
+        if reference_positions is None or warm_start:
             # Full-range export: apply the existing aspect-ratio heuristic.
             xs, ys = zip(*positions.values(), strict=False)
             width = max(xs) - min(xs)
@@ -928,28 +1142,14 @@ class Command(BaseCommand):
                 positions = layout.rotate_positions(positions)
                 self.stdout.write("done")
 
-        if do_3dgraph:
-            if reference_positions_3d is not None:
-                new_nodes_3d = [n for n in graph.nodes() if n not in reference_positions_3d]
-                if new_nodes_3d:
-                    self.stdout.write(f"- Kamada-Kawai 3D ({len(new_nodes_3d)} new nodes) … ", ending="")
-                    self.stdout.flush()
-                    kk_pos_3d = layout.kamada_kawai_positions_3d(graph)
-                    initial_pos_3d = {n: reference_positions_3d.get(n, kk_pos_3d[n]) for n in graph.nodes()}
-                    self.stdout.write("done")
-                else:
-                    self.stdout.write("- seeding 3D from reference layout … ", ending="")
-                    self.stdout.flush()
-                    initial_pos_3d = {n: reference_positions_3d[n] for n in graph.nodes()}
-                    self.stdout.write("done")
-            else:
-                self.stdout.write("- Kamada-Kawai 3D … ", ending="")
-                self.stdout.flush()
-                initial_pos_3d = layout.kamada_kawai_positions_3d(graph)
-                self.stdout.write("done")
-            self.stdout.write(f"- ForceAtlas2 3D ({fa2_iterations} iterations) … ", ending="")
+        if do_3dgraph and multilevel and reference_positions_3d is None:
+            positions_3d = _multilevel(3)
+        elif do_3dgraph:
+            initial_pos_3d = _initial_positions(reference_positions_3d, 3)
+            iterations, note = _iterations(reference_positions_3d)
+            self.stdout.write(f"- ForceAtlas2 3D ({iterations} iterations{note}) … ", ending="")
             self.stdout.flush()
-            positions_3d = layout.forceatlas2_positions_3d(graph, initial_pos_3d, fa2_iterations)
+            positions_3d = layout.forceatlas2_positions_3d(graph, initial_pos_3d, iterations)
             self.stdout.write("done")
 
         return positions, positions_3d
@@ -967,8 +1167,18 @@ class Command(BaseCommand):
         do_3dgraph: bool,
         spreading_runs: int,
         diffusion_window: int,
+        jobs: int = 1,
+        betweenness_samples: int = 0,
+        result_cache: "cache.ResultCache | None" = None,
     ) -> list[tuple[str, str]]:
-        """Compute all network measures and return (key, label) pairs for each active measure."""
+        """Compute all network measures and return (key, label) pairs for each active measure.
+
+        The measures that only read the graph are handed to ``measures.run_measure_steps``
+        up front (a process pool when ``jobs > 1``) while the database-backed ones run
+        here. Results are consumed in the fixed step order, so the progress output and
+        the label order do not depend on ``jobs``. Graph-only results found in
+        ``result_cache`` are reused instead of being computed, and new ones are stored.
+        """
         self.stdout.write("\nCalculations on the graph")
         self.stdout.write("- largest component … ", ending="")
         self.stdout.flush()
@@ -980,11 +1190,6 @@ class Command(BaseCommand):
             graph_data, graph, channel_dict, start_date=start_date, end_date=end_date
         )
 
-        # Pre-compute betweenness once when both BETWEENNESS and BRIDGING are active.
-        _cached_betweenness: dict | None = None
-        if "BETWEENNESS" in selected_measures and bridging_token is not None:
-            _cached_betweenness = measures.compute_betweenness(graph)
-
         _orm_steps = [
             (
                 "AMPLIFICATION",
@@ -1007,34 +1212,88 @@ class Command(BaseCommand):
                     gd, g, channel_dict, start_date=start_date, end_date=end_date, window_days=diffusion_window
                 ),
             ),
-            (
-                "SPREADING",
-                "spreading efficiency (SIR)",
-                lambda gd, g: measures.apply_spreading_efficiency(gd, g, runs=spreading_runs),
-            ),
         ]
-        for key, label, fn in [*measures.MEASURE_STEPS, *_orm_steps]:
-            if key in selected_measures:
+        steps = [
+            *measures.MEASURE_STEPS,
+            *_orm_steps,
+            ("SPREADING", "spreading efficiency (SIR)", "apply_spreading_efficiency"),
+        ]
+        step_kwargs: dict[str, dict[str, Any]] = {
+            "BETWEENNESS": {"samples": betweenness_samples or None},
+            "SPREADING": {"runs": spreading_runs},
+        }
+        # Steps that distribute their own work over ``jobs`` processes run here
+        # rather than as a single task of the measure pool.
+        inline_kwargs: dict[str, dict[str, Any]] = {"SPREADING": {"jobs": jobs}}
+
+        # Betweenness is scheduled once when either BETWEENNESS or BRIDGING needs it.
+        needs_betweenness = "BETWEENNESS" in selected_measures or bridging_token is not None
+        graph_steps = [
+            (key, fn)
+            for key, _label, fn in steps
+            if isinstance(fn, str) and (key in selected_measures or (key == "BETWEENNESS" and needs_betweenness))
+        ]
+        if selected_measures & {"HITSHUB", "HITSAUTH"}:
+            graph_steps.append(("HITS", "apply_hits"))
+        graph_step_keys = {key for key, _fn in graph_steps}
+
+        # Graph-only results are keyed on the graph fingerprint; hits skip the computation.
+        cache_params = {key: [fn, step_kwargs.get(key, {})] for key, fn in graph_steps}
+        cached: dict[str, measures.StepResult] = {}
+        if result_cache is not None:
+            for key, params in cache_params.items():
+                hit = result_cache.get("measure", params)
+                if hit is not None:
+                    cached[key] = hit
+        scheduled = [
+            (fn, step_kwargs.get(key, {})) for key, fn in graph_steps if key not in cached and key not in inline_kwargs
+        ]
+        step_results = measures.run_measure_steps(graph, graph_data, scheduled, jobs)
+
+        def _graph_step_result(key: str, fn: str) -> measures.StepResult:
+            if key in cached:
+                return cached[key]
+            if key in inline_kwargs:
+                # Collect what is left of the measure pool first, so that it has shut
+                # down before this step starts its own ``jobs`` processes.
+                nonlocal step_results
+                step_results = iter(list(step_results))
+                kwargs = {**step_kwargs.get(key, {}), **inline_kwargs[key]}
+                result = next(measures.run_measure_steps(graph, graph_data, [(fn, kwargs)]))
+            else:
+                result = next(step_results)
+            if result_cache is not None:
+                result_cache.put("measure", cache_params[key], result)
+            return result
+
+        _cached_betweenness: dict | None = None
+        for key, label, fn in steps:
+            selected = key in selected_measures
+            if not selected and key not in graph_step_keys:
+                continue
+            if selected:
                 self.stdout.write(f"- {label} … ", ending="")
                 self.stdout.flush()
-                if key == "BETWEENNESS" and _cached_betweenness is not None:
-                    step_labels = measures.apply_betweenness_centrality(
-                        graph_data, graph, betweenness=_cached_betweenness
-                    )
-                elif isinstance(fn, str):
-                    step_labels = getattr(measures, fn)(graph_data, graph)
-                else:
-                    step_labels = fn(graph_data, graph)
-                measures_labels += step_labels
-                self.stdout.write("done")
+            if key in graph_step_keys:
+                step_labels, values = _graph_step_result(key, fn)
+                if key == "BETWEENNESS":
+                    _cached_betweenness = {node_id: v["betweenness"] for node_id, v in values.items()}
+                if not selected:
+                    continue
+                measures.merge_node_values(graph_data, values)
+            else:
+                step_labels = fn(graph_data, graph)
+            measures_labels += step_labels
+            self.stdout.write("cached" if key in cached else "done")
 
-        if selected_measures & {"HITSHUB", "HITSAUTH"}:
+        if "HITS" in graph_step_keys:
             self.stdout.write("- HITS … ", ending="")
             self.stdout.flush()
-            hits_labels = measures.apply_hits(graph_data, graph)
+            hits_labels, values = _graph_step_result("HITS", "apply_hits")
+            measures.merge_node_values(graph_data, values)
             _hits_key_map = {"hits_hub": "HITSHUB", "hits_authority": "HITSAUTH"}
             measures_labels += [(k, lbl) for k, lbl in hits_labels if _hits_key_map[k] in selected_measures]
-            self.stdout.write("done")
+            self.stdout.write("cached" if "HITS" in cached else "done")
 
         if bridging_token is not None:
             strategy_key = measures.bridging_strategy(bridging_token).lower()
@@ -1080,10 +1339,17 @@ class Command(BaseCommand):
         robustness_strategies: list[str] | None = None,
         robustness_runs: int = 100,
         robustness_null: int = 20,
+        robustness_null_model: str = "WEIGHTS",
         robustness_seed: int = 42,
         robustness_sample: int = 500,
+        robustness_curve_tolerance: float = 0.0,
+        robustness_dyn_batch: float = 1,
+        edge_counts: graph_builder.EdgeCounts | None = None,
     ) -> dict | None:
-        """Run the full export pipeline for a single calendar year and write per-year files."""
+        """Run the full export pipeline for a single calendar year and write per-year files.
+
+        ``edge_counts`` is the year's slice of ``graph_builder.yearly_edge_counts``.
+        """
         start_date = datetime.date(year, 1, 1)
         end_date = datetime.date(year, 12, 31)
 
@@ -1104,6 +1370,7 @@ class Command(BaseCommand):
                 include_self_references=options["include_self_references"],
                 include_lost=options["include_lost"],
                 include_private=options["include_private"],
+                edge_counts=edge_counts,
             )
         except ValueError as e:
             self.stdout.write(self.style.WARNING(f"skipped ({e})"))
@@ -1116,7 +1383,10 @@ class Command(BaseCommand):
         n_nodes, n_edges = len(graph.nodes), len(graph.edges)
         self.stdout.write(f"{n_nodes} nodes, {n_edges} edges")
 
-        strategy_results = self._compute_communities(graph, channel_dict, edge_list, communities_strategy, options)
+        result_cache = cache.ResultCache.for_graph(graph, settings.SA_CACHE_DIR, options.get("cache_size_mb", 0))
+        strategy_results = self._compute_communities(
+            graph, channel_dict, edge_list, communities_strategy, options, result_cache
+        )
         positions, positions_3d = self._compute_layout(
             graph,
             do_graph,
@@ -1125,12 +1395,16 @@ class Command(BaseCommand):
             target_layout,
             reference_positions,
             reference_positions_3d,
+            seed=options.get("layout_seed", layout.LAYOUT_SEED_AUTO),
+            algorithm=options.get("layout_algorithm", layout.LAYOUT_ALGORITHM_FA2),
         )
+        primary_layout = options.get("layout_algorithm", layout.LAYOUT_ALGORITHM_FA2)
 
         year_extra_positions: dict[str, dict] = {}
         year_extra_positions_3d: dict[str, dict] = {}
         if do_graph and extra_layout_names:
             _extra_layout_funcs_2d = {
+                "MULTILEVEL": layout.multilevel_positions_2d,
                 "CIRCULAR": layout.circular_positions,
                 "KAMADA_KAWAI": layout.kamada_kawai_positions,
                 "COMMUNITY_SHELL": lambda g: layout.community_shell_positions(g, strategy_results),
@@ -1141,9 +1415,13 @@ class Command(BaseCommand):
             for name in extra_layout_names:
                 if name == "FA2":
                     continue
+                if name == primary_layout:
+                    year_extra_positions[name.lower()] = positions
+                    continue
                 year_extra_positions[name.lower()] = _extra_layout_funcs_2d[name](graph)
         if do_3dgraph and extra_layout_names_3d:
             _extra_layout_funcs_3d = {
+                "MULTILEVEL": layout.multilevel_positions_3d,
                 "SPECTRAL": layout.spectral_positions,
                 "SPRING": layout.spring_positions,
                 "KAMADA_KAWAI": layout.kamada_kawai_positions_3d,
@@ -1153,6 +1431,9 @@ class Command(BaseCommand):
             for name in extra_layout_names_3d:
                 if name == "FA2":
                     continue
+                if name == primary_layout:
+                    year_extra_positions_3d[name.lower()] = positions_3d
+                    continue
                 year_extra_positions_3d[name.lower()] = _extra_layout_funcs_3d[name](graph)
 
         self.stdout.write("\nBuild graph data … ", ending="")
@@ -1171,6 +1452,9 @@ class Command(BaseCommand):
             do_3dgraph,
             options["spreading_runs"],
             options["diffusion_window"],
+            options.get("jobs", 1),
+            options.get("betweenness_samples", 0),
+            result_cache,
         )
 
         communities_data = community.build_communities_payload(communities_strategy, strategy_results)
@@ -1200,6 +1484,11 @@ class Command(BaseCommand):
                 total_edges=n_edges,
                 community_distribution_threshold=options["community_distribution_threshold"],
                 has_consensus_matrix=False,
+                betweenness_sampling=(
+                    measures.betweenness_sampling_report(n_nodes, options.get("betweenness_samples", 0))
+                    if "BETWEENNESS" in selected_measures or bridging_token is not None
+                    else None
+                ),
             )
             if need_metrics:
                 community_table_data = community_stats.compute_community_metrics(
@@ -1232,9 +1521,14 @@ class Command(BaseCommand):
                         strategies=list(robustness_strategies) if robustness_strategies else None,
                         n_random_runs=robustness_runs,
                         n_null=robustness_null,
+                        null_model=robustness_null_model,
                         seed=robustness_seed,
                         reach_sample=robustness_sample,
+                        betweenness_samples=options.get("betweenness_samples") or None,
+                        curve_tolerance=robustness_curve_tolerance,
+                        dyn_batch=robustness_dyn_batch,
                     ),
+                    jobs=options.get("jobs", 1),
                 )
                 exporter.write_robustness_json(rob_payload, graph_dir=tmp_dir)
 
@@ -1344,8 +1638,40 @@ class Command(BaseCommand):
             extra_layout_names_3d = sorted(layout.EXTRA_LAYOUT_CHOICES_3D)
         extra_layout_names_3d = [n for n in extra_layout_names_3d if n in layout.EXTRA_LAYOUT_CHOICES_3D]
 
+        betweenness_samples = _o("betweenness_samples", settings.SA_BETWEENNESS_SAMPLES)
+        if betweenness_samples < 0:
+            raise CommandError("--betweenness-samples must be 0 (exact) or a positive number of pivots.")
+
+        layout_seed = str(_o("layout_seed", settings.SA_LAYOUT_SEED)).upper()
+        if layout_seed not in layout.LAYOUT_SEED_CHOICES:
+            raise CommandError(
+                f"Unknown layout seed {layout_seed!r}. Choose one of: {', '.join(layout.LAYOUT_SEED_CHOICES)}."
+            )
+        layout_algorithm = str(_o("layout_algorithm", settings.SA_LAYOUT_ALGORITHM)).upper()
+        if layout_algorithm not in layout.LAYOUT_ALGORITHM_CHOICES:
+            raise CommandError(
+                f"Unknown layout algorithm {layout_algorithm!r}. "
+                f"Choose one of: {', '.join(layout.LAYOUT_ALGORITHM_CHOICES)}."
+            )
+        if layout_algorithm != layout.LAYOUT_ALGORITHM_FA2:
+            # No FA2 layout is computed: its dropdown entry becomes the primary layout's own.
+            extra_layout_names = list(dict.fromkeys(layout_algorithm if n == "FA2" else n for n in extra_layout_names))
+            extra_layout_names_3d = list(
+                dict.fromkeys(layout_algorithm if n == "FA2" else n for n in extra_layout_names_3d)
+            )
+
+        robustness_null_model = str(_o("robustness_null_model", settings.SA_ROBUSTNESS_NULL_MODEL)).upper()
+        if robustness_null_model not in robustness.NULL_MODEL_CHOICES:
+            raise CommandError(
+                f"Unknown robustness null model {robustness_null_model!r}. "
+                f"Choose one of: {', '.join(robustness.NULL_MODEL_CHOICES)}."
+            )
+
         vertical = _o("vertical_layout", settings.SA_VERTICAL_LAYOUT)
         export_name = re.sub(r"[^\w\-]", "-", (options.get("name") or "").strip()).strip("-")
+        # Unnamed runs get a fresh timestamp name, so a layout stored under it could
+        # never be read back: warm starts only apply to runs with an explicit --name.
+        named_export = bool(export_name)
         if not export_name:
             export_name = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
 
@@ -1379,6 +1705,8 @@ class Command(BaseCommand):
             vertical_layout=vertical,
             target_layout=layout.LAYOUT_VERTICAL if vertical else layout.LAYOUT_HORIZONTAL,
             fa2_iterations=_o("fa2_iterations", settings.SA_FA2_ITERATIONS),
+            layout_seed=layout_seed,
+            layout_algorithm=layout_algorithm,
             extra_layout_names=extra_layout_names,
             extra_layout_names_3d=extra_layout_names_3d,
             start_date=self._parse_date(options["startdate"], "--startdate"),
@@ -1401,6 +1729,7 @@ class Command(BaseCommand):
             selected_network_groups=frozenset(network_stat_groups),
             bridging_token=bridging_token,
             spreading_runs=_o("spreading_runs", settings.SA_SPREADING_RUNS),
+            betweenness_samples=betweenness_samples,
             diffusion_window=_o("diffusion_window", settings.SA_DIFFUSION_WINDOW),
             leiden_coarse_resolution=_o("leiden_coarse_resolution", settings.SA_LEIDEN_COARSE_RESOLUTION),
             leiden_fine_resolution=_o("leiden_fine_resolution", settings.SA_LEIDEN_FINE_RESOLUTION),
@@ -1419,8 +1748,14 @@ class Command(BaseCommand):
             robustness_strategies=robustness_strategies,
             robustness_runs=_o("robustness_runs", settings.SA_ROBUSTNESS_RUNS),
             robustness_null=_o("robustness_null", settings.SA_ROBUSTNESS_NULL),
+            robustness_null_model=robustness_null_model,
             robustness_seed=_o("robustness_seed", settings.SA_ROBUSTNESS_SEED),
             robustness_sample=_o("robustness_sample", settings.SA_ROBUSTNESS_SAMPLE),
+            robustness_curve_tolerance=_o("robustness_curve_tolerance", settings.SA_ROBUSTNESS_CURVE_TOLERANCE),
+            robustness_dyn_batch=_o("robustness_dyn_batch", settings.SA_ROBUSTNESS_DYN_BATCH),
+            jobs=max(1, _o("jobs", settings.SA_JOBS)),
+            cache_size_mb=max(0, _o("cache_size_mb", settings.SA_CACHE_SIZE_MB)),
+            warm_start_layout=named_export and _o("warm_start_layout", settings.SA_WARM_START_LAYOUT),
             export_name=export_name,
         )
 
@@ -1430,6 +1765,24 @@ class Command(BaseCommand):
         # take a plain dict) see the resolved values.
         options.update(opts.to_options_dict())
 
+        # One grouped pass over the edge table serves every timeline year and,
+        # when no date window is set, the full-range graph as well.
+        counts_by_year: dict[int | None, graph_builder.EdgeCounts] = {}
+        full_edge_counts: graph_builder.EdgeCounts | None = None
+        if opts.timeline_step == "year":
+            counts_by_year = graph_builder.yearly_edge_counts(
+                draw_dead_leaves=opts.draw_dead_leaves,
+                recency_weights=opts.recency_weights,
+                channel_types=opts.channel_types,
+                channel_groups=opts.channel_groups or None,
+                edge_weight_strategy=opts.edge_weight_strategy,
+                include_mentions=opts.include_mentions,
+                include_lost=opts.include_lost,
+                include_private=opts.include_private,
+            )
+            if opts.start_date is None and opts.end_date is None:
+                full_edge_counts = graph_builder.merge_edge_counts(counts_by_year)
+
         self.stdout.write("Create graph … ", ending="")
         self.stdout.flush()
         try:
@@ -1446,16 +1799,36 @@ class Command(BaseCommand):
                 include_self_references=opts.include_self_references,
                 include_lost=opts.include_lost,
                 include_private=opts.include_private,
+                edge_counts=full_edge_counts,
             )
         except ValueError as e:
             raise CommandError(str(e)) from e
         self.stdout.write(f"{len(graph.nodes)} nodes, {len(graph.edges)} edges")
         self.stdout.flush()
 
-        strategy_results = self._compute_communities(graph, channel_dict, edge_list, opts.communities_strategy, options)
+        result_cache = cache.ResultCache.for_graph(graph, settings.SA_CACHE_DIR, opts.cache_size_mb)
+        strategy_results = self._compute_communities(
+            graph, channel_dict, edge_list, opts.communities_strategy, options, result_cache
+        )
+        layout_store = cache.LayoutStore(settings.SA_LAYOUT_CACHE_DIR)
+        stored_positions: dict | None = None
+        stored_positions_3d: dict | None = None
+        if opts.warm_start_layout:
+            stored_positions, stored_positions_3d = layout_store.load(opts.export_name)
         positions, positions_3d = self._compute_layout(
-            graph, opts.do_graph, opts.do_3dgraph, opts.fa2_iterations, opts.target_layout
+            graph,
+            opts.do_graph,
+            opts.do_3dgraph,
+            opts.fa2_iterations,
+            opts.target_layout,
+            layout.warm_start_reference(graph, stored_positions),
+            layout.warm_start_reference(graph, stored_positions_3d),
+            warm_start=True,
+            seed=opts.layout_seed,
+            algorithm=opts.layout_algorithm,
         )
+        if opts.warm_start_layout:
+            layout_store.save(opts.export_name, positions or None, positions_3d)
 
         fa2_in_2d = opts.do_graph and "FA2" in opts.extra_layout_names
         fa2_in_3d = opts.do_3dgraph and "FA2" in opts.extra_layout_names_3d
@@ -1470,7 +1843,12 @@ class Command(BaseCommand):
             if non_fa2:
                 self.stdout.write("\nCompute extra 2D layouts")
                 extra_positions = _compute_extra_layouts(
-                    graph, non_fa2, dim=2, strategy_results=strategy_results, on_progress=_progress_2d
+                    graph,
+                    non_fa2,
+                    dim=2,
+                    strategy_results=strategy_results,
+                    on_progress=_progress_2d,
+                    primary=(opts.layout_algorithm, positions),
                 )
                 self.stdout.write("done")
 
@@ -1479,7 +1857,9 @@ class Command(BaseCommand):
             non_fa2_3d = [n for n in opts.extra_layout_names_3d if n != "FA2"]
             if non_fa2_3d:
                 self.stdout.write("\nCompute extra 3D layouts")
-                extra_positions_3d = _compute_extra_layouts(graph, non_fa2_3d, dim=3, on_progress=_progress_2d)
+                extra_positions_3d = _compute_extra_layouts(
+                    graph, non_fa2_3d, dim=3, on_progress=_progress_2d, primary=(opts.layout_algorithm, positions_3d)
+                )
                 self.stdout.write("done")
 
         self.stdout.write("\nBuild graph data … ", ending="")
@@ -1498,6 +1878,9 @@ class Command(BaseCommand):
             opts.do_3dgraph,
             opts.spreading_runs,
             opts.diffusion_window,
+            opts.jobs,
+            opts.betweenness_samples,
+            result_cache,
         )
 
         _final_target = str(Path(settings.BASE_DIR) / "exports" / opts.export_name)
@@ -1567,6 +1950,11 @@ class Command(BaseCommand):
             total_edges=len(graph.edges),
             community_distribution_threshold=opts.community_distribution_threshold,
             has_consensus_matrix=opts.do_consensus_matrix,
+            betweenness_sampling=(
+                measures.betweenness_sampling_report(len(graph.nodes), opts.betweenness_samples)
+                if "BETWEENNESS" in opts.selected_measures or opts.bridging_token is not None
+                else None
+            ),
         )
 
         need_community_metrics = opts.do_html or opts.do_xlsx or opts.do_consensus_matrix
@@ -1725,10 +2113,15 @@ class Command(BaseCommand):
                     strategies=list(opts.robustness_strategies) if opts.robustness_strategies else None,
                     n_random_runs=opts.robustness_runs,
                     n_null=opts.robustness_null,
+                    null_model=opts.robustness_null_model,
                     seed=opts.robustness_seed,
                     reach_sample=opts.robustness_sample,
+                    betweenness_samples=opts.betweenness_samples or None,
+                    curve_tolerance=opts.robustness_curve_tolerance,
+                    dyn_batch=opts.robustness_dyn_batch,
                 ),
                 progress=_rob_progress,
+                jobs=opts.jobs,
             )
             if not _rob_first[0]:
                 self.stdout.write("done")
@@ -1747,44 +2140,65 @@ class Command(BaseCommand):
 
         timeline_entries: list[dict] = []
         if opts.timeline_step == "year":
-            year_agg = Message.objects.aggregate(min_date=Min("date"), max_date=Max("date"))
-            min_date, max_date = year_agg["min_date"], year_agg["max_date"]
-            if min_date is None:
+            years = [yr for yr in counts_by_year if yr is not None]
+            if not years:
                 self.stdout.write(self.style.WARNING("\nTimeline: no messages found, skipping."))
             else:
-                self.stdout.write(f"\nTimeline export ({min_date.year}–{max_date.year})")
-                for yr in range(min_date.year, max_date.year + 1):
-                    entry = self._run_year_export(
-                        yr,
-                        root_target,
-                        options,
-                        opts.selected_measures,
-                        opts.bridging_token,
-                        opts.communities_strategy,
-                        strategies,
-                        opts.do_graph,
-                        opts.do_3dgraph,
-                        opts.do_xlsx,
-                        opts.channel_types,
-                        opts.channel_groups,
-                        opts.edge_weight_strategy,
-                        opts.fa2_iterations,
-                        opts.target_layout,
-                        opts.seo,
-                        project_title,
-                        opts.selected_network_groups,
-                        reference_positions=positions if opts.do_graph else None,
-                        reference_positions_3d=positions_3d if opts.do_3dgraph else None,
-                        extra_layout_names=opts.extra_layout_names or None,
-                        extra_layout_names_3d=opts.extra_layout_names_3d or None,
-                        do_robustness=opts.do_robustness,
-                        robustness_alpha=opts.robustness_alpha,
-                        robustness_strategies=opts.robustness_strategies,
-                        robustness_runs=opts.robustness_runs,
-                        robustness_null=opts.robustness_null,
-                        robustness_seed=opts.robustness_seed,
-                        robustness_sample=opts.robustness_sample,
+                self.stdout.write(f"\nTimeline export ({min(years)}–{max(years)})")
+                year_args = (
+                    opts.selected_measures,
+                    opts.bridging_token,
+                    opts.communities_strategy,
+                    strategies,
+                    opts.do_graph,
+                    opts.do_3dgraph,
+                    opts.do_xlsx,
+                    opts.channel_types,
+                    opts.channel_groups,
+                    opts.edge_weight_strategy,
+                    opts.fa2_iterations,
+                    opts.target_layout,
+                    opts.seo,
+                    project_title,
+                    opts.selected_network_groups,
+                )
+                year_kwargs = {
+                    "reference_positions": positions if opts.do_graph else None,
+                    "reference_positions_3d": positions_3d if opts.do_3dgraph else None,
+                    "extra_layout_names": opts.extra_layout_names or None,
+                    "extra_layout_names_3d": opts.extra_layout_names_3d or None,
+                    "do_robustness": opts.do_robustness,
+                    "robustness_alpha": opts.robustness_alpha,
+                    "robustness_strategies": opts.robustness_strategies,
+                    "robustness_runs": opts.robustness_runs,
+                    "robustness_null": opts.robustness_null,
+                    "robustness_null_model": opts.robustness_null_model,
+                    "robustness_seed": opts.robustness_seed,
+                    "robustness_sample": opts.robustness_sample,
+                    "robustness_curve_tolerance": opts.robustness_curve_tolerance,
+                    "robustness_dyn_batch": opts.robustness_dyn_batch,
+                }
+                year_range = range(min(years), max(years) + 1)
+                if opts.jobs > 1:
+                    # Workers buffer their progress lines; they are replayed in year order.
+                    # Each year then computes its measures serially inside its worker.
+                    year_options = {**opts.to_options_dict(), "jobs": 1}
+                    tasks = [
+                        (yr, root_target, year_options, year_args, counts_by_year.get(yr, {}), year_kwargs)
+                        for yr in year_range
+                    ]
+                    entries = []
+                    for entry, output in parallel.ordered_map(_run_year_export_in_worker, tasks, opts.jobs):
+                        self.stdout.write(output, ending="")
+                        entries.append(entry)
+                else:
+                    entries = (
+                        self._run_year_export(
+                            yr, root_target, options, *year_args, edge_counts=counts_by_year.get(yr, {}), **year_kwargs
+                        )
+                        for yr in year_range
                     )
+                for entry in entries:
                     if entry is not None:
                         timeline_entries.append(entry)
                 if timeline_entries:
@@ -1866,3 +2280,23 @@ class Command(BaseCommand):
 
         _atomic_publish(root_target, _final_target)
         self.stdout.write(self.style.SUCCESS("\nDone."))
+
+
+def _run_year_export_in_worker(
+    year: int,
+    root_target: str,
+    options: dict,
+    year_args: tuple,
+    edge_counts: graph_builder.EdgeCounts,
+    year_kwargs: dict,
+) -> tuple[dict | None, str]:
+    """Pool entry point for ``--jobs``: run one year export and return it with its buffered progress output.
+
+    The year is exported by a fresh ``Command`` in the worker process, with its
+    own database connection and temporary directory.
+    """
+    buffer = io.StringIO()
+    entry = Command(stdout=buffer)._run_year_export(
+        year, root_target, options, *year_args, edge_counts=edge_counts, **year_kwargs
+    )
+    return entry, buffer.getvalue()
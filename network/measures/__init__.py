@@ -13,6 +13,8 @@ from network.measures._centrality import (
     apply_local_clustering,
     apply_out_degree_centrality,
     apply_pagerank,
+    betweenness_error_bound,
+    betweenness_sampling_report,
     compute_betweenness,
 )
 from network.measures._content import apply_amplification_factor, apply_content_originality, apply_diffusion_lag
@@ -27,6 +29,7 @@ from network.measures._registry import (
     find_bridging_token,
     is_valid_measure,
 )
+from network.measures._scheduler import StepResult, merge_node_values, run_measure_steps
 from network.measures._spreading import apply_spreading_efficiency
 
 __all__ = [
@@ -34,6 +37,7 @@ __all__ = [
     "ALL_NETWORK_STAT_GROUPS",
     "ALL_STRATEGIES",
     "MEASURE_STEPS",
+    "StepResult",
     "VALID_MEASURES",
     "apply_amplification_factor",
     "apply_base_node_measures",
@@ -53,9 +57,13 @@ __all__ = [
     "apply_out_degree_centrality",
     "apply_pagerank",
     "apply_spreading_efficiency",
+    "betweenness_error_bound",
+    "betweenness_sampling_report",
     "bridging_strategy",
     "compute_betweenness",
     "find_bridging_token",
     "is_valid_measure",
+    "merge_node_values",
+    "run_measure_steps",
     "VALID_NETWORK_STAT_GROUPS",
 ]
@@ -1,5 +1,5 @@
 import logging
-from math import isnan, log
+from math import isnan, log, sqrt
 
 from network.utils import GraphData
 
@@ -31,24 +31,67 @@ def apply_hits(graph_data: GraphData, graph: nx.DiGraph) -> list[tuple[str, str]
     return [("hits_hub", "HITS Hub"), ("hits_authority", "HITS Authority")]
 
 
-def compute_betweenness(graph: nx.DiGraph) -> dict[str, float]:
-    """Compute betweenness centrality and return the raw values dict."""
+BETWEENNESS_ERROR_CONFIDENCE = 0.9
+
+
+def compute_betweenness(graph: nx.DiGraph, samples: int | None = None) -> dict[str, float]:
+    """Compute betweenness centrality and return the raw values dict.
+
+    With ``samples`` smaller than the node count the values are estimated from
+    that many source pivots drawn uniformly without replacement (Brandes & Pich
+    2007) instead of all ``n`` sources, cutting the cost from O(VE) to O(kE).
+    The pivots are drawn with a fixed seed, so repeated calls on the same graph
+    agree. ``betweenness_error_bound`` gives the resulting accuracy.
+    """
+    if samples and samples < graph.number_of_nodes():
+        return nx.betweenness_centrality(graph, k=samples, weight="weight", seed=0)
     return nx.betweenness_centrality(graph, weight="weight")
 
 
+def betweenness_error_bound(n: int, samples: int | None, confidence: float = BETWEENNESS_ERROR_CONFIDENCE) -> float:
+    """Additive error bound of ``compute_betweenness(graph, samples)`` on an ``n``-node graph.
+
+    Each pivot contributes a term in ``[0, n / (n - 1)]`` to the normalised
+    estimate, whose mean is the exact value. Hoeffding's inequality (valid for
+    sampling without replacement) plus a union bound over the ``n`` nodes gives:
+    with probability ``confidence`` every node is within
+
+        n / (n - 1) · sqrt(ln(2n / (1 - confidence)) / (2 · samples))
+
+    of its exact betweenness. Returns ``0.0`` when the computation is exact.
+    """
+    if not samples or samples >= n or n < 3:
+        return 0.0
+    return n / (n - 1) * sqrt(log(2 * n / (1 - confidence)) / (2 * samples))
+
+
+def betweenness_sampling_report(n: int, samples: int | None) -> dict[str, float | int] | None:
+    """``meta.json`` entry describing a sampled betweenness estimate; ``None`` when exact."""
+    if not samples or samples >= n:
+        return None
+    return {
+        "samples": samples,
+        "nodes": n,
+        "confidence": BETWEENNESS_ERROR_CONFIDENCE,
+        "error_bound": round(betweenness_error_bound(n, samples), 6),
+    }
+
+
 def apply_betweenness_centrality(
     graph_data: GraphData,
     graph: nx.DiGraph,
     betweenness: "dict[str, float] | None" = None,
+    samples: int | None = None,
 ) -> list[tuple[str, str]]:
     """Add betweenness centrality to each node.
 
     If ``betweenness`` is provided (pre-computed via ``compute_betweenness``),
     the nx call is skipped, allowing the caller to share one computation with
-    ``apply_bridging_centrality``.
+    ``apply_bridging_centrality``. Otherwise ``samples`` is passed on to
+    ``compute_betweenness``.
     """
     key = "betweenness"
-    values = betweenness if betweenness is not None else compute_betweenness(graph)
+    values = betweenness if betweenness is not None else compute_betweenness(graph, samples)
     for node in graph_data["nodes"]:
         node[key] = values.get(node["id"], 0.0)
     return [(key, "Betweenness Centrality")]
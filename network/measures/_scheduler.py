@@ -0,0 +1,52 @@
+"""Process-pool scheduling of the measures that only read the graph.
+
+Every ``apply_*`` function writes its values into the node dicts of a
+``GraphData``. To run them in worker processes, each step is applied to a
+scratch ``GraphData`` holding only the node ids; the worker sends back the
+labels and the per-node values, which ``merge_node_values`` copies into the
+real node dicts in the parent. The graph itself travels once per worker as
+the read-only ``shared`` object of ``network.parallel.ordered_map``.
+"""
+
+from collections.abc import Iterator
+from typing import Any
+
+from network import parallel
+from network.utils import GraphData
+
+type NodeValues = dict[str, dict[str, Any]]
+type StepResult = tuple[list[tuple[str, str]], NodeValues]
+
+
+def _apply_on_shared_graph(fn_name: str, node_ids: list[str], kwargs: dict[str, Any]) -> StepResult:
+    from network import measures
+
+    scratch: GraphData = {"nodes": [{"id": node_id} for node_id in node_ids]}
+    labels = getattr(measures, fn_name)(scratch, parallel.shared_value(), **kwargs)
+    values = {node.pop("id"): node for node in scratch["nodes"] if len(node) > 1}
+    return labels, values
+
+
+def run_measure_steps(
+    graph: Any,
+    graph_data: GraphData,
+    steps: list[tuple[str, dict[str, Any]]],
+    jobs: int = 1,
+) -> Iterator[StepResult]:
+    """Run ``(apply function name, kwargs)`` steps and yield their results in ``steps`` order.
+
+    The steps must only read ``graph`` and the node ids of ``graph_data``;
+    with ``jobs > 1`` they run concurrently in a process pool. Nothing is
+    written to ``graph_data`` — pass each result to ``merge_node_values``.
+    """
+    node_ids = [node["id"] for node in graph_data["nodes"]]
+    tasks = [(fn_name, node_ids, kwargs) for fn_name, kwargs in steps]
+    return parallel.ordered_map(_apply_on_shared_graph, tasks, jobs, shared=graph)
+
+
+def merge_node_values(graph_data: GraphData, values: NodeValues) -> None:
+    """Copy per-node values returned by ``run_measure_steps`` into ``graph_data``."""
+    for node in graph_data["nodes"]:
+        node_values = values.get(node["id"])
+        if node_values:
+            node.update(node_values)
@@ -1,5 +1,10 @@
+import itertools
 import logging
+from collections.abc import Hashable, Iterable, Mapping
+from dataclasses import dataclass
+from functools import cached_property
 
+from network import core, parallel
 from network.utils import GraphData
 
 import networkx as nx
@@ -8,50 +13,153 @@ import numpy as np
 logger = logging.getLogger(__name__)
 
 _SIR_GAMMA = 0.3  # recovery probability per step; mean infectious period ≈ 3 steps
+_SIR_SEED = 42  # root of the per-seed random streams
+_CHUNKS_PER_JOB = 4
 
 
-def _run_sir(
-    adj: dict[str, list[tuple[str, float]]],
-    seed: str,
-    rng: np.random.Generator,
-) -> int:
-    """Single SIR run seeded at *seed*. Returns the number of nodes ever infected, including the seed."""
-    susceptible = set(adj) - {seed}
-    infected = {seed}
-    ever_infected = 1
-
-    while infected:
-        infected_list = list(infected)
-
-        # Recovery: batch draw for all currently infected nodes
-        newly_recovered = {
-            n for n, r in zip(infected_list, rng.random(len(infected_list)) < _SIR_GAMMA, strict=True) if r
-        }
-
-        # Transmission: for each infected node, batch-draw against its out-edges
-        newly_infected: set[str] = set()
-        for node in infected_list:
-            neighbors = adj[node]
-            if not neighbors:
-                continue
-            succs = [s for s, _ in neighbors]
-            weights = np.array([w for _, w in neighbors])
-            hits = rng.random(len(succs)) < weights
-            for succ, hit in zip(succs, hits, strict=True):
-                if hit and succ in susceptible:
-                    newly_infected.add(succ)
-
-        susceptible -= newly_infected
-        infected = (infected | newly_infected) - newly_recovered
-        ever_infected += len(newly_infected)
-
-    return ever_infected
+@dataclass(frozen=True, eq=False)
+class SIRNetwork:
+    """Transmission network for batched discrete-time SIR simulations.
+
+    Nodes are the ints ``0..n-1`` (``node_ids[i]`` is the caller's id of node
+    ``i``); out-edges are stored in CSR form with ``prob`` holding the
+    per-step transmission probability of each edge (its weight, capped at 1).
+
+    ``run`` simulates every realisation for one seed at once. The state of all
+    runs lives in a flat boolean ``runs × n`` "ever infected" matrix; only the
+    currently infectious ``(run, node)`` pairs are expanded over their CSR
+    out-edges at each step, and the recovery and transmission draws for the
+    whole frontier are single vectorised ``rng.random`` calls. The same
+    generator state therefore always produces the same cascades.
+    """
+
+    node_ids: list[Hashable]
+    out_ptr: np.ndarray
+    out_idx: np.ndarray
+    prob: np.ndarray
+    gamma: float = _SIR_GAMMA
+
+    @classmethod
+    def from_graph(cls, graph: nx.DiGraph) -> "SIRNetwork":
+        """Network of ``graph`` with ``min(weight, 1)`` transmission probabilities (missing weight = 1)."""
+        view = core.csr_view(graph)
+        return cls(view.node_ids, view.out_ptr, view.out_idx, np.minimum(view.weight, 1.0))
+
+    @classmethod
+    def from_adjacency(
+        cls, adj: Mapping[Hashable, Iterable[tuple[Hashable, float]]], nodes: Iterable[Hashable]
+    ) -> "SIRNetwork":
+        """Network over ``nodes`` from ``{source: [(target, weight), …]}``; edges leaving ``nodes`` are dropped."""
+        node_ids = sorted(set(nodes))
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        edges = sorted(
+            (index[u], index[v], min(w, 1.0))
+            for u, targets in adj.items()
+            if u in index
+            for v, w in targets
+            if v in index
+        )
+        src = np.array([u for u, _, _ in edges], dtype=np.int64)
+        out_ptr = np.zeros(len(node_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=len(node_ids)), out=out_ptr[1:])
+        out_idx = np.array([v for _, v, _ in edges], dtype=np.int64)
+        prob = np.array([w for _, _, w in edges], dtype=np.float64)
+        return cls(node_ids, out_ptr, out_idx, prob)
+
+    @property
+    def n(self) -> int:
+        return len(self.node_ids)
+
+    @cached_property
+    def index(self) -> dict[Hashable, int]:
+        """``{node_id: int id}`` — the inverse of ``node_ids``."""
+        return {node_id: i for i, node_id in enumerate(self.node_ids)}
+
+    def run(self, seed: int, runs: int, rng: np.random.Generator) -> np.ndarray:
+        """Simulate ``runs`` SIR cascades seeded at node ``seed``.
+
+        Returns the flat indices ``run * n + node`` of every ``(run, node)``
+        pair ever infected, the seeds included. Within a step, nodes that
+        recover still transmit, and each newly reached node is infected once.
+        """
+        n = self.n
+        ever = np.zeros(runs * n, dtype=bool)
+        # Scratch slots used to drop duplicate targets without sorting.
+        slot = np.empty(runs * n, dtype=np.int64)
+        active = np.arange(runs, dtype=np.int64) * n + seed
+        ever[active] = True
+        reached = [active]
+        while active.size:
+            recovered = rng.random(active.size) < self.gamma
+            nodes = active % n
+            starts = self.out_ptr[nodes]
+            counts = self.out_ptr[nodes + 1] - starts
+            total = int(counts.sum())
+            new = active[:0]
+            if total:
+                # Edge id of every (infectious pair, out-edge) combination.
+                offsets = np.repeat(np.cumsum(counts) - counts - starts, counts)
+                edges = np.arange(total, dtype=np.int64) - offsets
+                hit = rng.random(total) < self.prob[edges]
+                targets = np.repeat(active - nodes, counts)[hit] + self.out_idx[edges[hit]]
+                fresh = targets[~ever[targets]]
+                slot[fresh] = np.arange(fresh.size)
+                new = fresh[slot[fresh] == np.arange(fresh.size)]
+                ever[new] = True
+                reached.append(new)
+            active = np.concatenate((active[~recovered], new))
+        return np.concatenate(reached)
+
+    def mean_outbreak(self, seed: int, runs: int, rng: np.random.Generator) -> float:
+        """Mean number of nodes ever infected per run, the seed included."""
+        return self.run(seed, runs, rng).size / runs
+
+    def infection_counts(self, seed: int, runs: int, rng: np.random.Generator) -> np.ndarray:
+        """Number of runs, out of ``runs``, in which each node was ever infected."""
+        return np.bincount(self.run(seed, runs, rng) % self.n, minlength=self.n)
+
+
+def _mean_outbreaks(seeds: list[int], streams: list[np.random.SeedSequence], runs: int) -> list[float]:
+    network: SIRNetwork = parallel.shared_value()
+    return [
+        network.mean_outbreak(seed, runs, np.random.default_rng(stream))
+        for seed, stream in zip(seeds, streams, strict=True)
+    ]
+
+
+def spreading_scores(
+    graph: nx.DiGraph, runs: int, seed: int | np.random.SeedSequence = 42, jobs: int = 1
+) -> dict[Hashable, float]:
+    """``{node: (mean outbreak size − 1) / (N − 1)}``, the SIR spreading efficiency of every node.
+
+    Every node gets its own random stream, spawned from ``seed`` in
+    ``graph.nodes()`` order, so a node's value depends only on the graph,
+    ``runs`` and ``seed``. With ``jobs > 1`` the seeds are split into
+    contiguous chunks and simulated in a process pool; the results are the
+    same for any ``jobs``.
+    """
+    n = graph.number_of_nodes()
+    if n <= 1:
+        return dict.fromkeys(graph.nodes(), 0.0)
+    network = SIRNetwork.from_graph(graph)
+    node_ids = list(graph.nodes())
+    seeds = [network.index[node_id] for node_id in node_ids]
+    sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    streams = sequence.spawn(n)
+    # A few chunks per worker balance seeds with very different outbreak sizes.
+    bounds = np.linspace(0, n, min(n, max(1, jobs) * _CHUNKS_PER_JOB) + 1).astype(int).tolist()
+    tasks = [(seeds[lo:hi], streams[lo:hi], runs) for lo, hi in itertools.pairwise(bounds)]
+    sizes = itertools.chain.from_iterable(parallel.ordered_map(_mean_outbreaks, tasks, jobs, shared=network))
+    norm = n - 1
+    # Subtract the seed itself from the spreading count
+    return {node_id: (size - 1) / norm for node_id, size in zip(node_ids, sizes, strict=True)}
 
 
 def apply_spreading_efficiency(
     graph_data: GraphData,
     graph: nx.DiGraph,
     runs: int = 200,
+    jobs: int = 1,
 ) -> list[tuple[str, str]]:
     """SIR spreading efficiency: mean fraction of nodes infected when each node seeds the process.
 
@@ -59,31 +167,12 @@ def apply_spreading_efficiency(
     SIR simulations.  Transmission probability along edge (i→j) equals the edge weight,
     clipped to [0, 1].  Recovery probability per step is ``_SIR_GAMMA``.  The result is
     normalised to [0, 1] by dividing by (N − 1), so 1.0 means the seed eventually infects
-    every other node on average.
+    every other node on average.  The simulations of different seeds are spread over
+    ``jobs`` processes without changing the results.
     """
     key = "spreading_efficiency"
-    n = graph.number_of_nodes()
-    if n <= 1:
-        for node in graph_data["nodes"]:
-            node[key] = 0.0
-        return [(key, "Spreading Efficiency")]
-
-    # Pre-build adjacency lists with weights clipped to [0, 1]
-    adj: dict[str, list[tuple[str, float]]] = {
-        node_id: [(succ, min(data.get("weight", 1.0), 1.0)) for succ, data in graph[node_id].items()]
-        for node_id in graph.nodes()
-    }
-
-    rng = np.random.default_rng(42)
-    results: dict[str, float] = {}
-    norm = n - 1
-
-    for node_id in graph.nodes():
-        total_infected = sum(_run_sir(adj, node_id, rng) for _ in range(runs))
-        # Subtract 1 per run to exclude the seed itself from the spreading count
-        results[node_id] = round((total_infected / runs - 1) / norm, 6)
-
+    results = spreading_scores(graph, runs, _SIR_SEED, jobs)
     for node in graph_data["nodes"]:
-        node[key] = results.get(node["id"], 0.0)
+        node[key] = round(results.get(node["id"], 0.0), 6)
 
     return [(key, "Spreading Efficiency")]
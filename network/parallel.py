@@ -0,0 +1,78 @@
+"""Process-pool helpers shared by the parallel stages of ``structural_analysis``.
+
+Workers are forked where the platform allows it, so they inherit the fully
+configured Django settings (including any runtime overrides) without a second
+``django.setup()``. Database connections are closed in the parent before the
+pool starts: every worker opens its own connection on first use instead of
+sharing the parent's socket. Where ``fork`` is unavailable the workers are
+spawned and run ``django.setup()`` themselves.
+
+Results always come back in submission order, whatever the completion order,
+so everything assembled from them is independent of the worker count.
+"""
+
+import multiprocessing
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from django.db import connections
+
+_START_METHOD = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+
+# Read-only object handed to every task of the running ``ordered_map`` call.
+_shared: Any = None
+
+
+def _init_worker(shared: Any, setup_django: bool) -> None:
+    global _shared
+    if setup_django:
+        import django
+
+        django.setup()
+    _shared = shared
+
+
+def shared_value() -> Any:
+    """Return the ``shared`` object of the ``ordered_map`` call the current task belongs to."""
+    return _shared
+
+
+def ordered_map[T](
+    fn: Callable[..., T], arg_tuples: Iterable[tuple[Any, ...]], jobs: int, shared: Any = None
+) -> Iterator[T]:
+    """Yield ``fn(*args)`` for each entry of ``arg_tuples``, in input order.
+
+    With ``jobs <= 1`` (or a single task) everything runs inline in the calling
+    process. Otherwise the calls are distributed over a pool of ``jobs``
+    processes; ``fn`` and its arguments must be picklable, i.e. ``fn`` is a
+    module-level function. Each result is yielded as soon as it and every
+    earlier one are available, so callers can stream progress in order.
+
+    ``shared`` is made available to the tasks through ``shared_value()``. It is
+    transferred once per worker rather than once per task (inherited as-is when
+    forking, pickled once when spawning), which is how large read-only inputs
+    such as the analysis graph should be passed. Tasks must not mutate it.
+    """
+    global _shared
+    tasks = list(arg_tuples)
+    if jobs <= 1 or len(tasks) <= 1:
+        previous, _shared = _shared, shared
+        try:
+            for args in tasks:
+                yield fn(*args)
+        finally:
+            _shared = previous
+        return
+
+    connections.close_all()
+    context = multiprocessing.get_context(_START_METHOD)
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(tasks)),
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(shared, _START_METHOD == "spawn"),
+    ) as pool:
+        futures = [pool.submit(fn, *args) for args in tasks]
+        for future in futures:
+            yield future.result()
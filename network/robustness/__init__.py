@@ -5,39 +5,69 @@ from network.robustness.attacks import (
     STATIC_STRATEGIES,
     STRATEGY_SPECS,
     parse_strategy,
+    ranks_from_view,
     removal_order,
     strategy_label,
 )
 from network.robustness.disparity_filter import compute_alpha_values, disparity_filter
 from network.robustness.metrics import (
+    CurveEstimate,
+    adaptive_attack_curve,
     attack_curve,
     critical_threshold,
+    critical_threshold_error,
     r_index,
+    r_index_error,
     weighted_global_efficiency,
 )
 from network.robustness.modular import modular_robustness_curves
-from network.robustness.null_model import null_distribution, rewire_weights, z_score
+from network.robustness.null_model import (
+    NULL_MODEL_CHOICES,
+    NULL_MODEL_LABELS,
+    NULL_MODEL_STRENGTH,
+    NULL_MODEL_WEIGHTS,
+    null_distribution,
+    null_view,
+    rewire_weights,
+    rewired_graph,
+    rewired_view,
+    strength_view,
+    z_score,
+)
 from network.robustness.runner import RobustnessConfig, run_robustness
 
 __all__ = [
     "ALL_STRATEGIES",
     "DEFAULT_STRATEGIES",
     "DYNAMIC_STRATEGIES",
+    "NULL_MODEL_CHOICES",
+    "NULL_MODEL_LABELS",
+    "NULL_MODEL_STRENGTH",
+    "NULL_MODEL_WEIGHTS",
     "STATIC_STRATEGIES",
     "STRATEGY_SPECS",
+    "CurveEstimate",
     "RobustnessConfig",
+    "adaptive_attack_curve",
     "attack_curve",
     "compute_alpha_values",
     "critical_threshold",
+    "critical_threshold_error",
     "disparity_filter",
     "modular_robustness_curves",
     "null_distribution",
+    "null_view",
     "parse_strategy",
+    "ranks_from_view",
     "r_index",
+    "r_index_error",
     "removal_order",
     "rewire_weights",
+    "rewired_graph",
+    "rewired_view",
     "run_robustness",
     "strategy_label",
+    "strength_view",
     "weighted_global_efficiency",
     "z_score",
 ]
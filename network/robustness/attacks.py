@@ -8,6 +8,15 @@ A *removal order* is a list of node IDs ordered from "first to remove" to
   that fixed order.  One centrality pass per attack.
 - **Dynamic** — recompute the ranking on the residual graph after every
   removal (``_dyn`` suffix).  Much more aggressive and much costlier.
+  ``dyn_batch`` trades exactness for speed by removing the top ``k``
+  channels of each ranking before re-ranking.  The strength, PageRank,
+  Katz and HITS variants run on the CSR matrix of the graph with a mask
+  of the channels still present, and each power iteration starts from the
+  previous scores instead of from scratch.
+
+The strategies with such an array scorer can also rank a graph given only
+as a :class:`~network.core.CSRGraph`, e.g. a null draw that shuffles the
+weights of the backbone, without building it as a NetworkX graph.
 
 Tie-breaking is deterministic (ascending node ID) so non-random strategies
 are reproducible without an ``rng``.  Most strategies sort *descending* by
@@ -29,17 +38,23 @@ References:
         https://doi.org/10.1103/PhysRevE.65.056109
 """
 
+import heapq
+import math
 import re
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import partial
 from math import isnan, log
 from typing import Any, Literal
 
+from network import core
 from network.measures import compute_betweenness
-from network.measures._spreading import _run_sir
+from network.measures._spreading import spreading_scores
 
 import networkx as nx
 import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
 
 # ── Spec registry ────────────────────────────────────────────────────────────
 
@@ -54,12 +69,19 @@ class StrategySpec:
     ``inverse``         when True, sort *ascending* — used for measures where
                         low values flag critical nodes (e.g. Burt's constraint)
     ``kind``            ``"random"``, ``"static"``, or ``"dynamic"``
+    ``warm_fn``         optional array version of ``score_fn``:
+                        ``(residual, previous) -> (scores, state)``, where
+                        the dynamic loop hands ``state`` back as
+                        ``previous`` at the next re-ranking (see
+                        :class:`_Residual`); static strategies use it to
+                        rank from a CSR view
     """
 
     label: str
     score_fn: Callable[[nx.DiGraph], dict[Any, float]] | None
     inverse: bool = False
     kind: Literal["random", "static", "dynamic"] = "static"
+    warm_fn: "Callable[[_Residual, np.ndarray | None], tuple[np.ndarray, np.ndarray | None]] | None" = None
 
 
 # ── Score functions ─────────────────────────────────────────────────────────
@@ -88,10 +110,14 @@ def _safe_katz(g: nx.DiGraph) -> dict[Any, float]:
     try:
         return nx.katz_centrality(g, weight="weight")
     except (nx.PowerIterationFailedConvergence, Exception):
-        try:
-            return nx.katz_centrality_numpy(g, weight="weight")
-        except Exception:
-            return _in_strength(g)
+        return _katz_direct(g)
+
+
+def _katz_direct(g: nx.DiGraph) -> dict[Any, float]:
+    try:
+        return nx.katz_centrality_numpy(g, weight="weight")
+    except Exception:
+        return _in_strength(g)
 
 
 def _hits_hub(g: nx.DiGraph) -> dict[Any, float]:
@@ -155,14 +181,17 @@ def _burt_constraint(g: nx.DiGraph) -> dict[Any, float]:
 _BRIDGING_RE = re.compile(r"^bridging(?:\((\w+)\))?$", re.IGNORECASE)
 
 
-def _bridging_with_partition(g: nx.DiGraph, partition: dict[Any, Any]) -> dict[Any, float]:
+def _bridging_with_partition(
+    g: nx.DiGraph, partition: dict[Any, Any], betweenness_samples: int | None = None
+) -> dict[Any, float]:
     """Bridging centrality = betweenness × Shannon entropy of the community
     distribution among the node's weighted neighbours.
 
     Mirrors the formula in :func:`network.measures._centrality.apply_bridging_centrality`
     but returns the raw {node: score} dict rather than mutating graph_data.
+    ``betweenness_samples`` selects the sampled betweenness estimate.
     """
-    betweenness = compute_betweenness(g)
+    betweenness = compute_betweenness(g, betweenness_samples)
     scores: dict[Any, float] = {}
     for node in g.nodes():
         bt = betweenness.get(node, 0.0)
@@ -186,36 +215,159 @@ def _bridging_with_partition(g: nx.DiGraph, partition: dict[Any, Any]) -> dict[A
     return scores
 
 
-def _spreading_scores(g: nx.DiGraph, *, runs: int = 200, rng: np.random.Generator | None = None) -> dict[Any, float]:
+def _spreading_scores(g: nx.DiGraph, *, runs: int = 200, seed: int | np.random.SeedSequence = 42) -> dict[Any, float]:
     """Per-node SIR spreading efficiency — mean fraction infected when each
-    node seeds the cascade.  Reuses :func:`network.measures._spreading._run_sir`.
+    node seeds the cascade.  Reuses the batched engine of
+    :func:`network.measures._spreading.spreading_scores`.
 
     Cost: O(runs × N × mean outbreak size) per call.  Used as an attack
     strategy, this runs once per ranking computation — heavy but feasible
     on moderately-sized backbones.
     """
-    if rng is None:
-        rng = np.random.default_rng(42)
-    n = g.number_of_nodes()
-    if n <= 1:
-        return dict.fromkeys(g.nodes(), 0.0)
-    adj: dict[Any, list[tuple[Any, float]]] = {
-        nid: [(s, min(d.get("weight", 1.0), 1.0)) for s, d in g[nid].items()] for nid in g.nodes()
-    }
-    norm = n - 1
-    scores: dict[Any, float] = {}
-    for nid in g.nodes():
-        total = sum(_run_sir(adj, nid, rng) for _ in range(runs))
-        scores[nid] = (total / runs - 1) / norm
-    return scores
+    return spreading_scores(g, runs, seed)
 
 
 # Wrapper so the spreading scorer matches the generic ``(g) -> dict`` shape
-# expected by the registry (rng/runs come from the runner via closure).
+# expected by the registry (seed/runs come from the runner via closure).
 def _spreading_default(g: nx.DiGraph) -> dict[Any, float]:
     return _spreading_scores(g)
 
 
+# ── Warm-started dynamic scorers ────────────────────────────────────────────
+# Array versions of the strength, PageRank, Katz and HITS scorers for the
+# dynamic loop and for ranking from a CSR view.  They use the parameters, stopping rules and fallbacks of the
+# NetworkX scorers above, restricted to the channels still present; each power
+# iteration starts from the vector of the previous re-ranking, which after a
+# few removals is already close to the new one.
+
+_PAGERANK_ALPHA = 0.85  # nx.pagerank defaults
+_PAGERANK_MAX_ITER = 100
+_PAGERANK_TOL = 1.0e-6
+_KATZ_ALPHA = 0.1  # nx.katz_centrality defaults
+_KATZ_MAX_ITER = 1000
+_KATZ_TOL = 1.0e-6
+_HITS_MAX_ITER = 100  # nx.hits defaults, as ARPACK parameters
+_HITS_TOL = 1.0e-8
+_HITS_UNIFORM_SHARE = 0.1
+
+
+@dataclass
+class _Residual:
+    """The graph of a dynamic attack with the channels removed so far masked out.
+
+    ``alive`` is ``1.0`` for the channels still present and ``0.0`` for the
+    removed ones, indexed like ``view``; ``matrix`` is the weighted adjacency
+    ``A[i, j] = w(i→j)`` of the full graph and ``transposed`` its transpose.
+    """
+
+    view: core.CSRGraph
+    matrix: sp.csr_array
+    transposed: sp.csr_array
+    alive: np.ndarray
+
+    @classmethod
+    def of(cls, view: core.CSRGraph) -> "_Residual":
+        matrix = view.to_scipy()
+        return cls(view, matrix, matrix.T.tocsr(), np.ones(view.n))
+
+    @property
+    def n(self) -> int:
+        return int(self.alive.sum())
+
+    def in_strength(self) -> np.ndarray:
+        return (self.transposed @ self.alive) * self.alive
+
+    def out_strength(self) -> np.ndarray:
+        return (self.matrix @ self.alive) * self.alive
+
+    def subgraph(self) -> nx.DiGraph:
+        """The residual graph as a NetworkX graph, for the fallback scorers."""
+        present = np.flatnonzero(self.alive)
+        sub = nx.from_scipy_sparse_array(self.matrix[present][:, present], create_using=nx.DiGraph)
+        ids = self.view.node_ids
+        return nx.relabel_nodes(sub, {k: ids[i] for k, i in enumerate(present.tolist())}, copy=False)
+
+    def from_scores(self, scores: dict[Any, float]) -> np.ndarray:
+        return np.array([scores.get(node_id, 0.0) for node_id in self.view.node_ids]) * self.alive
+
+
+def _start_vector(previous: np.ndarray | None, default: np.ndarray, alive: np.ndarray) -> np.ndarray:
+    """``previous`` restricted to the channels still present, or ``default`` when nothing of it is left."""
+    if previous is None:
+        return default
+    x = previous * alive
+    total = x.sum()
+    return x / total if total > 0 else default
+
+
+def _in_strength_warm(res: _Residual, previous: np.ndarray | None) -> tuple[np.ndarray, None]:
+    return res.in_strength(), None
+
+
+def _out_strength_warm(res: _Residual, previous: np.ndarray | None) -> tuple[np.ndarray, None]:
+    return res.out_strength(), None
+
+
+def _pagerank_warm(res: _Residual, previous: np.ndarray | None) -> tuple[np.ndarray, np.ndarray | None]:
+    alive, n = res.alive, res.n
+    strength = res.out_strength()
+    inverse = np.divide(1.0, strength, out=np.zeros_like(strength), where=strength > 0)
+    dangling = (strength == 0) & (alive > 0)
+    p = alive / n
+    x = _start_vector(previous, p, alive)
+    for _ in range(_PAGERANK_MAX_ITER):
+        last = x
+        x = _PAGERANK_ALPHA * ((res.transposed @ (x * inverse)) * alive + x[dangling].sum() * p)
+        x += (1 - _PAGERANK_ALPHA) * p
+        if np.abs(x - last).sum() < n * _PAGERANK_TOL:
+            return x, x
+    return res.in_strength(), None
+
+
+def _katz_warm(res: _Residual, previous: np.ndarray | None) -> tuple[np.ndarray, np.ndarray | None]:
+    # Scores are left unnormalised: the ranking is the same, and the previous
+    # vector is then a start at the right scale.
+    alive, n = res.alive, res.n
+    x = np.zeros_like(alive) if previous is None else previous * alive
+    with np.errstate(over="ignore", invalid="ignore"):
+        for _ in range(_KATZ_MAX_ITER):
+            last = x
+            x = (_KATZ_ALPHA * (res.transposed @ x) + 1.0) * alive
+            error = np.abs(x - last).sum()
+            if error < n * _KATZ_TOL:
+                return x, x
+            if not np.isfinite(error):
+                break
+    return res.from_scores(_katz_direct(res.subgraph())), None
+
+
+def _hits_warm(res: _Residual, previous: np.ndarray | None, *, hubs: bool) -> tuple[np.ndarray, np.ndarray | None]:
+    # nx.hits takes the leading singular vectors from ARPACK; the previous
+    # authority vector is its starting vector.
+    alive = res.alive
+    if not res.out_strength().any():
+        # nx.hits fails without edges, and the scorers fall back to the (zero) strengths.
+        return (res.out_strength() if hubs else res.in_strength()), None
+    present = np.flatnonzero(alive)
+    matrix = res.matrix[present][:, present]
+    # The previous vector can vanish on whole components; some uniform weight
+    # keeps every component reachable, or a smaller one could win by default.
+    uniform = alive / res.n
+    v0 = (_start_vector(previous, uniform, alive) + _HITS_UNIFORM_SHARE * uniform)[present]
+    try:
+        _, _, vt = spla.svds(matrix, k=1, v0=v0, maxiter=_HITS_MAX_ITER, tol=_HITS_TOL)
+    except Exception:
+        fallback = _hits_hub if hubs else _hits_authority
+        return res.from_scores(fallback(res.subgraph())), None
+    a = np.zeros_like(alive)
+    a[present] = vt.ravel().real
+    a /= a.sum()  # also fixes the arbitrary sign of the singular vector
+    if not hubs:
+        return a, a
+    h = res.matrix @ a
+    return h / h.sum(), a
+
+
 # ── Registry ────────────────────────────────────────────────────────────────
 
 
@@ -223,13 +375,13 @@ STRATEGY_SPECS: dict[str, StrategySpec] = {
     # Baseline
     "random": StrategySpec("Random failure", None, kind="random"),
     # Degree
-    "in_strength": StrategySpec("In-strength", _in_strength),
-    "out_strength": StrategySpec("Out-strength", _out_strength),
+    "in_strength": StrategySpec("In-strength", _in_strength, warm_fn=_in_strength_warm),
+    "out_strength": StrategySpec("Out-strength", _out_strength, warm_fn=_out_strength_warm),
     # Prestige
-    "pagerank": StrategySpec("PageRank", _safe_pagerank),
-    "katz": StrategySpec("Katz centrality", _safe_katz),
-    "hits_hub": StrategySpec("HITS hub", _hits_hub),
-    "hits_authority": StrategySpec("HITS authority", _hits_authority),
+    "pagerank": StrategySpec("PageRank", _safe_pagerank, warm_fn=_pagerank_warm),
+    "katz": StrategySpec("Katz centrality", _safe_katz, warm_fn=_katz_warm),
+    "hits_hub": StrategySpec("HITS hub", _hits_hub, warm_fn=partial(_hits_warm, hubs=True)),
+    "hits_authority": StrategySpec("HITS authority", _hits_authority, warm_fn=partial(_hits_warm, hubs=False)),
     # Reach
     "harmonic": StrategySpec("Harmonic centrality", _harmonic),
     "closeness": StrategySpec("Closeness centrality", _closeness),
@@ -244,12 +396,14 @@ STRATEGY_SPECS: dict[str, StrategySpec] = {
     # Dynamical
     "spreading": StrategySpec("Spreading efficiency (SIR)", _spreading_default),
     # Dynamic variants
-    "in_strength_dyn": StrategySpec("In-strength (dyn)", _in_strength, kind="dynamic"),
-    "out_strength_dyn": StrategySpec("Out-strength (dyn)", _out_strength, kind="dynamic"),
-    "pagerank_dyn": StrategySpec("PageRank (dyn)", _safe_pagerank, kind="dynamic"),
-    "katz_dyn": StrategySpec("Katz (dyn)", _safe_katz, kind="dynamic"),
-    "hits_hub_dyn": StrategySpec("HITS hub (dyn)", _hits_hub, kind="dynamic"),
-    "hits_authority_dyn": StrategySpec("HITS authority (dyn)", _hits_authority, kind="dynamic"),
+    "in_strength_dyn": StrategySpec("In-strength (dyn)", _in_strength, kind="dynamic", warm_fn=_in_strength_warm),
+    "out_strength_dyn": StrategySpec("Out-strength (dyn)", _out_strength, kind="dynamic", warm_fn=_out_strength_warm),
+    "pagerank_dyn": StrategySpec("PageRank (dyn)", _safe_pagerank, kind="dynamic", warm_fn=_pagerank_warm),
+    "katz_dyn": StrategySpec("Katz (dyn)", _safe_katz, kind="dynamic", warm_fn=_katz_warm),
+    "hits_hub_dyn": StrategySpec("HITS hub (dyn)", _hits_hub, kind="dynamic", warm_fn=partial(_hits_warm, hubs=True)),
+    "hits_authority_dyn": StrategySpec(
+        "HITS authority (dyn)", _hits_authority, kind="dynamic", warm_fn=partial(_hits_warm, hubs=False)
+    ),
     "betweenness_dyn": StrategySpec("Betweenness (dyn)", compute_betweenness, kind="dynamic"),
 }
 
@@ -289,6 +443,12 @@ def parse_strategy(name: str) -> tuple[str, str | None]:
     return (canonical, None)
 
 
+def ranks_from_view(name: str) -> bool:
+    """Whether *name* can rank a graph given only as a CSR view (see :func:`removal_order`)."""
+    canonical, _ = parse_strategy(name)
+    return STRATEGY_SPECS[canonical].warm_fn is not None
+
+
 def strategy_label(name: str, partition_key: str | None = None) -> str:
     """Human-readable label, including the partition basis for bridging."""
     base = STRATEGY_SPECS[name].label
@@ -306,6 +466,9 @@ def removal_order(
     *,
     rng: np.random.Generator | None = None,
     partitions: dict[str, dict[Any, Any]] | None = None,
+    betweenness_samples: int | None = None,
+    dyn_batch: float = 1,
+    view: core.CSRGraph | None = None,
 ) -> list[Any]:
     """Compute the node-removal order for *G* under *strategy*.
 
@@ -314,12 +477,23 @@ def removal_order(
 
     ``rng`` is consulted only for ``"random"``.  ``partitions`` (a dict
     ``{strategy_name: {node: community_id}}``) is required only for
-    ``"bridging"`` / ``"bridging(...)"``.
-
-    Worst-case dynamic complexity (|V| = N, |E| = m):
-        ``in_strength_dyn`` / ``out_strength_dyn``   O(N · (N + m))
-        ``pagerank_dyn`` / ``katz_dyn`` / ``hits_*_dyn``   O(N · power-iter)
-        ``betweenness_dyn``                                 O(N² · m)
+    ``"bridging"`` / ``"bridging(...)"``.  ``betweenness_samples`` switches
+    ``betweenness``, ``betweenness_dyn`` and ``bridging`` to the pivot-sampled
+    betweenness estimate (see :func:`network.measures.compute_betweenness`).
+
+    ``dyn_batch`` is used only by the dynamic strategies: they re-rank after
+    every ``dyn_batch`` removals, or, for a value in ``(0, 1)``, after that
+    fraction of the channels of *G* (``0.01`` = every 1%).  ``1`` re-ranks
+    after every removal.
+
+    ``view`` ranks *G* by another CSR view of the same channels, e.g. a null
+    draw that only shuffles the weights of *G*, without building that graph.
+    Only the strategies for which :func:`ranks_from_view` holds accept it.
+
+    Worst-case dynamic complexity (|V| = N, |E| = m, k = removals per batch):
+        ``in_strength_dyn`` / ``out_strength_dyn``   O(N/k · (N + m))
+        ``pagerank_dyn`` / ``katz_dyn`` / ``hits_*_dyn``   O(N/k · power-iter)
+        ``betweenness_dyn``                                 O(N²/k · m)
     """
     canonical, bridging_key = parse_strategy(strategy)
 
@@ -335,12 +509,20 @@ def removal_order(
                 f"bridging strategy needs partition {bridging_key!r} in --community-strategies; "
                 f"available: {sorted((partitions or {}).keys())}"
             )
-        scores = _bridging_with_partition(G, partitions[bridging_key])
+        scores = _bridging_with_partition(G, partitions[bridging_key], betweenness_samples)
         return _sort_by_scores(G, scores, inverse=False)
 
     spec = STRATEGY_SPECS[canonical]
+    if view is not None:
+        if spec.warm_fn is None:
+            raise ValueError(f"strategy {canonical!r} cannot rank from a CSR view")
+        if spec.kind == "dynamic":
+            return _warm_dynamic_order(view, spec.warm_fn, _dyn_batch_size(dyn_batch, view.n), inverse=spec.inverse)
+        return _warm_static_order(view, spec.warm_fn, inverse=spec.inverse)
+    if betweenness_samples and spec.score_fn is compute_betweenness:
+        spec = replace(spec, score_fn=partial(compute_betweenness, samples=betweenness_samples))
     if spec.kind == "dynamic":
-        return _dynamic_order(G, spec)
+        return _dynamic_order(G, spec, _dyn_batch_size(dyn_batch, G.number_of_nodes()))
     if spec.score_fn is None:
         raise ValueError(f"strategy {canonical!r} has no score function and isn't a recognised special case")
     scores = spec.score_fn(G)
@@ -362,10 +544,21 @@ def _sort_by_scores(G: nx.DiGraph, scores: dict[Any, float], *, inverse: bool) -
     return sorted(G.nodes(), key=lambda n: (-scores.get(n, 0.0), n))
 
 
-def _dynamic_order(G: nx.DiGraph, spec: StrategySpec) -> list[Any]:
+def _dyn_batch_size(dyn_batch: float, n: int) -> int:
+    """Removals between two re-rankings of a dynamic strategy on an *n*-node graph (see :func:`removal_order`)."""
+    if dyn_batch <= 0:
+        raise ValueError(f"dyn_batch must be > 0; got {dyn_batch}")
+    if dyn_batch >= 1:
+        return int(dyn_batch)
+    return max(1, math.ceil(dyn_batch * n))
+
+
+def _dynamic_order(G: nx.DiGraph, spec: StrategySpec, batch: int = 1) -> list[Any]:
     score_fn = spec.score_fn
     if score_fn is None:
         raise ValueError(f"dynamic strategy {spec.label!r} has no score function")
+    if spec.warm_fn is not None:
+        return _warm_dynamic_order(core.csr_view(G), spec.warm_fn, batch, inverse=spec.inverse)
     g = G.copy()
     order: list[Any] = []
     while g.number_of_nodes() > 0:
@@ -374,9 +567,41 @@ def _dynamic_order(G: nx.DiGraph, spec: StrategySpec) -> list[Any]:
             order.extend(sorted(g.nodes()))
             break
         if spec.inverse:
-            nid = min(g.nodes(), key=lambda n: (scores.get(n, float("inf")), n))
+            removed = heapq.nsmallest(batch, g.nodes(), key=lambda n: (scores.get(n, float("inf")), n))
         else:
-            nid = min(g.nodes(), key=lambda n: (-scores.get(n, 0.0), n))
-        order.append(nid)
-        g.remove_node(nid)
+            removed = heapq.nsmallest(batch, g.nodes(), key=lambda n: (-scores.get(n, 0.0), n))
+        order.extend(removed)
+        g.remove_nodes_from(removed)
+    return order
+
+
+def _warm_static_order(
+    view: core.CSRGraph,
+    warm_fn: Callable[[_Residual, np.ndarray | None], tuple[np.ndarray, np.ndarray | None]],
+    *,
+    inverse: bool,
+) -> list[Any]:
+    # Node ids are sorted in the CSR view, so ties break by ascending index.
+    scores, _ = warm_fn(_Residual.of(view), None)
+    return [view.node_ids[i] for i in np.lexsort((np.arange(view.n), scores if inverse else -scores)).tolist()]
+
+
+def _warm_dynamic_order(
+    view: core.CSRGraph,
+    warm_fn: Callable[[_Residual, np.ndarray | None], tuple[np.ndarray, np.ndarray | None]],
+    batch: int,
+    *,
+    inverse: bool,
+) -> list[Any]:
+    # Node ids are sorted in the CSR view, so ties break by ascending index.
+    res = _Residual.of(view)
+    ids = res.view.node_ids
+    order: list[Any] = []
+    state = None
+    while (remaining := np.flatnonzero(res.alive)).size:
+        scores, state = warm_fn(res, state)
+        key = scores[remaining] if inverse else -scores[remaining]
+        removed = remaining[np.lexsort((remaining, key))[:batch]]
+        order.extend(ids[i] for i in removed.tolist())
+        res.alive[removed] = 0.0
     return order
@@ -16,6 +16,11 @@ Three families of metrics:
    weighted extension of Schneider et al. 2011 used by Bellingeri,
    Cassi & Vincenzi 2014.
 
+   :func:`adaptive_attack_curve` evaluates the SCC and REACH curves on an
+   adaptive subset of ``q`` only and returns a :class:`CurveEstimate` whose
+   band bounds the exact curve; :func:`r_index_error` and
+   :func:`critical_threshold_error` turn the band into error bounds.
+
 2. **Critical threshold** — :func:`critical_threshold` returns the fraction
    of removed nodes at which ``S(f)`` first drops below ``drop_to`` times its
    initial value.
@@ -37,14 +42,42 @@ References:
         https://doi.org/10.1103/PhysRevLett.87.198701
 """
 
+import bisect
+import itertools
+from dataclasses import dataclass
+from functools import cached_property
 from typing import Any, Literal
 
 import networkx as nx
 import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.csgraph as csgraph
 
 type ResidualMetric = Literal["WCC", "SCC", "REACH"]
 _VALID_METRICS: frozenset[str] = frozenset({"WCC", "SCC", "REACH"})
 
+# Adaptive curves start from this many equal q intervals before refining.
+_ADAPTIVE_INITIAL_INTERVALS = 16
+
+
+@dataclass(frozen=True)
+class CurveEstimate:
+    """Residual-size curve with a pointwise band ``lower[q] ≤ S(q) ≤ upper[q]``.
+
+    :func:`adaptive_attack_curve` evaluates ``S`` on a subset of ``q`` and
+    interpolates ``curve`` linearly in between; since the exact curve never
+    increases, the true values lie between the two neighbouring evaluated
+    points. Exact curves have ``lower == upper == curve``.
+    """
+
+    curve: list[float]
+    lower: list[float]
+    upper: list[float]
+
+    @classmethod
+    def exact(cls, curve: list[float]) -> "CurveEstimate":
+        return cls(curve, curve, curve)
+
 
 def attack_curve(
     G: nx.DiGraph,
@@ -64,6 +97,10 @@ def attack_curve(
     sampling and is allocated lazily (only when ``metric="REACH"`` and
     sampling actually kicks in).
 
+    ``metric="WCC"`` is computed in one pass by reverse percolation (see
+    :func:`_wcc_curve`); the values are the same as recomputing the
+    components after every removal.
+
     Nodes in ``removal_order`` that are not (or no longer) in the graph are
     silently skipped; the returned curve always has length
     ``len(removal_order) + 1``.  ``S`` is always normalised by the original
@@ -77,24 +114,87 @@ def attack_curve(
     if n0 == 0:
         return [0.0]
 
+    if metric == "WCC":
+        return _wcc_curve(G, removal_order, n0)
+
     if metric == "REACH" and rng is None:
         rng = np.random.default_rng()
 
-    g = G.copy()
+    residual = _ResidualGraph.from_graph(G, removal_order)
+    curve: list[float] = []
+    if metric == "SCC":
+        scc = _ResidualSCC(residual.adjacency)
+        curve.append(scc.largest / n0)
+        for i in residual.step_nodes.tolist():
+            if i >= 0:
+                scc.remove(np.array([i]))
+            curve.append(scc.largest / n0)
+        return curve
+
+    alive = np.ones(n0, dtype=bool)
+    curve.append(_reach_size(residual.adjacency, alive, n0, reach_sample, rng))
+    for i in residual.step_nodes.tolist():
+        if i >= 0:
+            alive[i] = False
+        curve.append(_reach_size(residual.adjacency, alive, n0, reach_sample, rng))
+    return curve
 
-    def _step() -> float:
-        if metric == "WCC":
-            return _wcc_size(g, n0)
-        if metric == "SCC":
-            return _scc_size(g, n0)
-        return _reach_size(g, n0, reach_sample, rng)
 
-    curve: list[float] = [_step()]
-    for nid in removal_order:
-        if g.has_node(nid):
-            g.remove_node(nid)
-        curve.append(_step())
-    return curve
+def adaptive_attack_curve(
+    G: nx.DiGraph,
+    removal_order: list[Any],
+    metric: ResidualMetric = "WCC",
+    *,
+    tolerance: float,
+    drop_to: float = 0.05,
+    reach_sample: int | None = 500,
+    rng: np.random.Generator | None = None,
+) -> CurveEstimate:
+    """:func:`attack_curve` evaluated on an adaptive grid of ``q`` values.
+
+    ``S`` is first evaluated at ``q = 0`` and at 16 equally spaced steps.
+    Intervals are then bisected, widest uncertainty first, until the band
+    between neighbouring points bounds ``R`` within ``tolerance``. The
+    interval where ``S`` crosses ``drop_to × S(0)`` is always refined down
+    to single steps, so :func:`critical_threshold` of the result is exact.
+    Use :func:`r_index_error` and :func:`critical_threshold_error` on the
+    returned band to report the bounds.
+
+    SCC evaluations restart from the component labels stored at the nearest
+    evaluated ``q`` below, so every removal is processed about once per
+    refinement round. With sampled ``REACH`` the band bounds the
+    interpolation only, not the sampling noise of each point. ``WCC`` curves
+    are always exact. ``tolerance <= 0`` falls back to :func:`attack_curve`.
+    """
+    if metric not in _VALID_METRICS:
+        raise ValueError(f"metric must be one of {sorted(_VALID_METRICS)}; got {metric!r}")
+    n0 = G.number_of_nodes()
+    if tolerance <= 0 or metric == "WCC" or n0 == 0 or len(removal_order) <= _ADAPTIVE_INITIAL_INTERVALS:
+        return CurveEstimate.exact(attack_curve(G, removal_order, metric, reach_sample=reach_sample, rng=rng))
+
+    residual = _ResidualGraph.from_graph(G, removal_order)
+    if metric == "SCC":
+        checkpoints = {0: _ResidualSCC(residual.adjacency).label}
+        bases = [0]
+
+        def _evaluate(q: int) -> float:
+            base = bases[bisect.bisect_right(bases, q) - 1]
+            scc = _ResidualSCC(residual.adjacency, checkpoints[base])
+            removed = residual.step_nodes[base:q]
+            scc.remove(removed[removed >= 0])
+            checkpoints[q] = scc.label
+            bisect.insort(bases, q)
+            return scc.largest / n0
+
+    else:
+        rng = rng if rng is not None else np.random.default_rng()
+
+        def _evaluate(q: int) -> float:
+            alive = (residual.removed_at == 0) | (residual.removed_at > q)
+            return _reach_size(residual.adjacency, alive, n0, reach_sample, rng)
+
+    values = _adaptive_points(_evaluate, len(removal_order), tolerance, drop_to)
+    return _interpolated_estimate(values, len(removal_order))
 
 
 def r_index(curve: list[float]) -> float:
@@ -127,6 +227,28 @@ def critical_threshold(curve: list[float], drop_to: float = 0.05) -> float | Non
     return None
 
 
+def r_index_error(estimate: CurveEstimate) -> float:
+    """Largest deviation of the true ``R`` from ``r_index(estimate.curve)`` allowed by the band."""
+    r = r_index(estimate.curve)
+    return max(r_index(estimate.upper) - r, r - r_index(estimate.lower), 0.0)
+
+
+def critical_threshold_error(estimate: CurveEstimate, drop_to: float = 0.05) -> float | None:
+    """Largest deviation of the true ``f_c`` from ``critical_threshold(estimate.curve)`` allowed by the band.
+
+    The earliest possible crossing is that of ``lower``, the latest that of
+    ``upper``. Returns ``None`` when one of them never crosses while another
+    does, i.e. when the band cannot bound ``f_c``.
+    """
+    fcs = [critical_threshold(c, drop_to) for c in (estimate.curve, estimate.lower, estimate.upper)]
+    if all(fc is None for fc in fcs):
+        return 0.0
+    if any(fc is None for fc in fcs):
+        return None
+    fc, earliest, latest = fcs
+    return max(fc - earliest, latest - fc, 0.0)
+
+
 def weighted_global_efficiency(
     G: nx.DiGraph,
     *,
@@ -172,34 +294,205 @@ def weighted_global_efficiency(
 # ── private helpers ──────────────────────────────────────────────────────────
 
 
-def _wcc_size(g: nx.DiGraph, n0: int) -> float:
-    if g.number_of_nodes() == 0:
-        return 0.0
-    return max((len(c) for c in nx.weakly_connected_components(g)), default=0) / n0
+def _wcc_curve(G: nx.DiGraph, removal_order: list[Any], n0: int) -> list[float]:
+    """WCC attack curve by reverse percolation (Newman & Ziff 2000).
+
+    Starting from the nodes that survive the whole order, the removed nodes
+    are added back from last to first and merged with their present
+    neighbours in a union-find forest (path halving, union by size). The
+    largest component only grows while adding, so ``S(q)`` for every ``q``
+    comes out of one O((N + E) α(N)) pass instead of one component search
+    per removal.
+    """
+    residual = _ResidualGraph.from_graph(G, removal_order)
+    index, nodes = residual.index, residual.nodes
+    parent = list(range(n0))
+    size = [1] * n0
+    present = [False] * n0
+    largest = 0
+
+    def _find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def _add(i: int) -> None:
+        nonlocal largest
+        present[i] = True
+        root = i
+        for nbr in nx.all_neighbors(G, nodes[i]):
+            j = index[nbr]
+            if not present[j]:
+                continue
+            other = _find(j)
+            if other == root:
+                continue
+            if size[root] < size[other]:
+                root, other = other, root
+            parent[other] = root
+            size[root] += size[other]
+        largest = max(largest, size[root])
+
+    for i in np.flatnonzero(residual.removed_at == 0).tolist():
+        _add(i)
+    step_nodes = residual.step_nodes.tolist()
+    curve = [0.0] * (len(removal_order) + 1)
+    for q in range(len(removal_order), 0, -1):
+        curve[q] = largest / n0
+        if step_nodes[q - 1] >= 0:
+            _add(step_nodes[q - 1])
+    curve[0] = largest / n0
+    return curve
 
 
-def _scc_size(g: nx.DiGraph, n0: int) -> float:
-    if g.number_of_nodes() == 0:
-        return 0.0
-    return max((len(c) for c in nx.strongly_connected_components(g)), default=0) / n0
+@dataclass(frozen=True, eq=False)
+class _ResidualGraph:
+    """Integer view of *G* for an attack: nodes in ``G`` order and the step removing each one.
+
+    ``step_nodes[q - 1]`` is the node removed by step ``q`` (``-1`` when the
+    step names a missing or already removed node) and ``removed_at[i]`` the
+    step removing node ``i`` (``0`` = survives the whole order).
+    """
+
+    graph: nx.DiGraph
+    nodes: list[Any]
+    index: dict[Any, int]
+    step_nodes: np.ndarray
+    removed_at: np.ndarray
+
+    @classmethod
+    def from_graph(cls, G: nx.DiGraph, removal_order: list[Any]) -> "_ResidualGraph":
+        nodes = list(G)
+        index = {node: i for i, node in enumerate(nodes)}
+        step_nodes = np.full(len(removal_order), -1, dtype=np.int64)
+        removed_at = np.zeros(len(nodes), dtype=np.int64)
+        for step, nid in enumerate(removal_order, start=1):
+            i = index.get(nid)
+            if i is not None and not removed_at[i]:
+                removed_at[i] = step
+                step_nodes[step - 1] = i
+        return cls(G, nodes, index, step_nodes, removed_at)
+
+    @cached_property
+    def adjacency(self) -> sp.csr_array:
+        """Unweighted directed adjacency in ``nodes`` order."""
+        return nx.to_scipy_sparse_array(self.graph, nodelist=self.nodes, weight=None, format="csr")
+
+
+class _ResidualSCC:
+    """Strongly connected components of a graph under node deletions.
+
+    Deleting nodes can only split SCCs, never merge them, so :meth:`remove`
+    recomputes only the components that lost a node, with SciPy on the
+    subgraph induced by their surviving members; a deleted singleton costs
+    nothing. A histogram of component sizes keeps ``largest`` up to date in
+    amortised O(1). ``label`` (``-1`` for deleted nodes) is the whole state:
+    passing it back to the constructor resumes from that point.
+    """
+
+    def __init__(self, adjacency: sp.csr_array, label: np.ndarray | None = None) -> None:
+        n = adjacency.shape[0]
+        self.adjacency = adjacency
+        if label is None:
+            count, label = csgraph.connected_components(adjacency, directed=True, connection="strong")
+        else:
+            alive = label >= 0
+            uniques, inverse = np.unique(label[alive], return_inverse=True)
+            count, label = len(uniques), np.full(n, -1, dtype=np.int64)
+            label[alive] = inverse
+        self.label = label.astype(np.int64)
+        # Components only ever split, so there are at most 2n of them over a run.
+        self.sizes = np.zeros(2 * n + 1, dtype=np.int64)
+        self.sizes[:count] = np.bincount(self.label[self.label >= 0], minlength=count)
+        self.next_label = count
+        self.histogram = np.bincount(self.sizes[:count], minlength=n + 1)
+        self.histogram[0] = 0
+        self.largest = int(self.sizes[:count].max()) if count else 0
+
+    def remove(self, nodes: np.ndarray) -> None:
+        """Delete ``nodes`` (already deleted ones are ignored) and split the components they belonged to."""
+        nodes = nodes[self.label[nodes] >= 0]
+        if not nodes.size:
+            return
+        affected = np.unique(self.label[nodes])
+        self.label[nodes] = -1
+        np.subtract.at(self.histogram, self.sizes[affected], 1)
+        self.sizes[affected] = 0
+        members = np.flatnonzero(np.isin(self.label, affected))
+        if members.size:
+            sub = self.adjacency[members][:, members]
+            count, labels = csgraph.connected_components(sub, directed=True, connection="strong")
+            self.label[members] = self.next_label + labels
+            sizes = np.bincount(labels, minlength=count)
+            self.sizes[self.next_label : self.next_label + count] = sizes
+            np.add.at(self.histogram, sizes, 1)
+            self.next_label += count
+        while self.largest and not self.histogram[self.largest]:
+            self.largest -= 1
 
 
 def _reach_size(
-    g: nx.DiGraph,
+    adjacency: sp.csr_array,
+    alive: np.ndarray,
     n0: int,
     sample: int | None,
     rng: np.random.Generator,
 ) -> float:
-    nq = g.number_of_nodes()
+    """Share of ordered pairs ``(s, t)`` of surviving nodes with a directed path ``s → t``.
+
+    Above ``sample`` surviving nodes the count is extrapolated from BFS runs
+    out of ``sample`` sources drawn without replacement, in ``G`` order.
+    """
+    survivors = np.flatnonzero(alive)
+    nq = survivors.size
     if nq == 0 or n0 <= 1:
         return 0.0
-    nodes = list(g.nodes())
+    residual = adjacency[survivors][:, survivors]
     if sample is None or nq <= sample:
-        sources = nodes
+        sources = range(nq)
         scale = 1.0
     else:
-        indices = rng.choice(nq, size=sample, replace=False)
-        sources = [nodes[i] for i in indices]
+        sources = rng.choice(nq, size=sample, replace=False).tolist()
         scale = nq / sample
-    pair_total = sum(len(nx.descendants(g, s)) for s in sources)
+    pair_total = sum(
+        csgraph.breadth_first_order(residual, s, directed=True, return_predecessors=False).size - 1 for s in sources
+    )
     return (pair_total * scale) / (n0 * (n0 - 1))
+
+
+def _adaptive_points(evaluate: Any, n_steps: int, tolerance: float, drop_to: float) -> dict[int, float]:
+    """``{q: S(q)}`` on the adaptive grid of :func:`adaptive_attack_curve`; ``evaluate(q)`` computes one point."""
+    values: dict[int, float] = {}
+
+    def _evaluate_all(qs: set[int]) -> None:
+        for q in sorted(qs):
+            values[q] = evaluate(q)
+
+    _evaluate_all(set(np.linspace(0, n_steps, _ADAPTIVE_INITIAL_INTERVALS + 1).round().astype(int).tolist()))
+    while True:
+        intervals = [(a, b) for a, b in itertools.pairwise(sorted(values)) if b - a > 1]
+        threshold = drop_to * values[0]
+        # Σ over the unevaluated q of the band width, i.e. the spread of R allowed by the grid.
+        widths = [(b - a - 1) * abs(values[a] - values[b]) for a, b in intervals]
+        split: set[int] = set()
+        if widths and sum(widths) / n_steps > tolerance:
+            cutoff = max(widths) / 2
+            split = {(a + b) // 2 for (a, b), width in zip(intervals, widths, strict=True) if width >= cutoff}
+        split |= {(a + b) // 2 for a, b in intervals if values[a] >= threshold > values[b]}
+        if not split:
+            return values
+        _evaluate_all(split)
+
+
+def _interpolated_estimate(values: dict[int, float], n_steps: int) -> CurveEstimate:
+    """Linear interpolation of the evaluated points plus the band spanned by each interval's endpoints."""
+    qs = np.array(sorted(values))
+    vs = np.array([values[q] for q in qs.tolist()])
+    grid = np.arange(n_steps + 1)
+    left = np.searchsorted(qs, grid, side="right") - 1
+    right = np.minimum(left + 1, len(qs) - 1)
+    known = qs[left] == grid
+    lower = np.where(known, vs[left], np.minimum(vs[left], vs[right]))
+    upper = np.where(known, vs[left], np.maximum(vs[left], vs[right]))
+    return CurveEstimate(np.interp(grid, qs, vs).tolist(), lower.tolist(), upper.tolist())
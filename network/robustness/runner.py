@@ -7,9 +7,13 @@
     3. For each enabled attack strategy: build the removal order, generate
        residual-size curves for WCC / SCC / REACH, compute R and f_c.
        ``random`` is averaged over ``n_random_runs`` independent orders.
-    4. For each strategy: optionally run ``n_null`` rewired-weight null
-       simulations and report z-score + mean/std of R *and* of the S(f)
-       curves so the HTML page can shade a null-model band.
+    4. For each strategy: optionally run ``n_null`` null-model simulations
+       (weight shuffling or strength-preserving rewiring, see
+       :mod:`~network.robustness.null_model`) and report z-score +
+       mean/std of R *and* of the S(f) curves so the HTML page can shade a
+       null-model band.  A weight-shuffling draw is a weight array over the
+       backbone's edge index; its curves are computed on the backbone
+       itself, whose topology it shares.
     5. For each available partition: compute intra/inter community
        edge-survival curves alongside each attack strategy.
 
@@ -22,14 +26,21 @@ list in :data:`~network.robustness.attacks.DEFAULT_STRATEGIES`.
 The output is a single JSON-serialisable dict whose shape is documented on
 :func:`run_robustness`; the runner is the only module that knows it.
 
-All stochastic operations share a single ``np.random.Generator`` derived from
-``config.seed`` so the entire payload is reproducible from one integer.
+Every attack curve — one (graph, strategy, replicate) unit, where the graph
+is the backbone or one of its null rewirings and ``random`` has
+``n_random_runs`` replicates — is independent of the others. Each unit, and
+each null rewiring, draws from its own ``np.random.SeedSequence`` spawned from
+``config.seed`` in a fixed order, so the units can run in a process pool and
+the payload is reproducible from one integer whatever the number of workers.
 """
 
+import itertools
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 
+from network import core, parallel
+from network.measures import betweenness_error_bound
 from network.robustness.attacks import (
     ALL_STRATEGIES,
     DEFAULT_STRATEGIES,
@@ -37,18 +48,29 @@ from network.robustness.attacks import (
     STATIC_STRATEGIES,
     STRATEGY_SPECS,
     parse_strategy,
+    ranks_from_view,
     removal_order,
     strategy_label,
 )
 from network.robustness.disparity_filter import disparity_filter
 from network.robustness.metrics import (
+    CurveEstimate,
+    adaptive_attack_curve,
     attack_curve,
     critical_threshold,
+    critical_threshold_error,
     r_index,
+    r_index_error,
     weighted_global_efficiency,
 )
 from network.robustness.modular import modular_robustness_curves
-from network.robustness.null_model import null_distribution, z_score
+from network.robustness.null_model import (
+    NULL_MODEL_CHOICES,
+    NULL_MODEL_WEIGHTS,
+    null_view,
+    rewired_graph,
+    z_score,
+)
 
 import networkx as nx
 import numpy as np
@@ -69,32 +91,64 @@ class RobustnessConfig:
                         uses :data:`~network.robustness.attacks.DEFAULT_STRATEGIES`.
     ``n_random_runs``   independent random orders averaged into the
                         ``"random"`` strategy curve (≥ 1)
-    ``n_null``          number of weight-rewiring null simulations per
-                        strategy; ``0`` disables the null model
+    ``n_null``          number of null-model simulations, each attacked
+                        with every strategy; ``0`` disables the null model
+    ``null_model``      ``"WEIGHTS"`` shuffles the weights over the fixed
+                        topology; ``"STRENGTH"`` rewires the edges at fixed
+                        degrees and reassigns the weights to keep node
+                        strengths (see
+                        :data:`~network.robustness.null_model.NULL_MODEL_CHOICES`)
     ``seed``            single seed driving every stochastic component
     ``reach_sample``    source-sample size for ``"REACH"`` curves on graphs
                         larger than this many nodes
     ``n_rewire_swaps``  per-null-simulation swap budget; ``None`` lets the
-                        null model use its own default of ``10·|E|``
+                        null model use its default (a uniform weight
+                        permutation, or ``10·|E|`` edge-swap attempts)
+    ``betweenness_samples``  pivot count for the sampled betweenness estimate
+                        used by ``betweenness``, ``betweenness_dyn`` and
+                        ``bridging``; ``None`` computes it exactly
+    ``curve_tolerance`` ``0`` evaluates the SCC and REACH curves after every
+                        removal; a positive value evaluates them on an
+                        adaptive grid until the R-index of each curve is
+                        bounded within it (see
+                        :func:`~network.robustness.metrics.adaptive_attack_curve`)
+    ``dyn_batch``       dynamic strategies re-rank after every ``dyn_batch``
+                        removals; a value in ``(0, 1)`` is a fraction of the
+                        backbone's channels instead (see
+                        :func:`~network.robustness.attacks.removal_order`)
     """
 
     alpha: float | None = 0.05
     strategies: list[str] | None = None
     n_random_runs: int = 100
     n_null: int = 20
+    null_model: str = NULL_MODEL_WEIGHTS
     seed: int = 42
     reach_sample: int = 500
     n_rewire_swaps: int | None = field(default=None)
+    betweenness_samples: int | None = None
+    curve_tolerance: float = 0.0
+    dyn_batch: float = 1
 
     def __post_init__(self) -> None:
         if self.n_random_runs < 1:
             raise ValueError(f"n_random_runs must be >= 1; got {self.n_random_runs}")
         if self.n_null < 0:
             raise ValueError(f"n_null must be >= 0; got {self.n_null}")
+        if self.null_model not in NULL_MODEL_CHOICES:
+            raise ValueError(f"null_model must be one of {', '.join(NULL_MODEL_CHOICES)}; got {self.null_model!r}")
         if self.alpha is not None and not (0 <= self.alpha <= 1):
             raise ValueError(f"alpha must be in [0, 1] or None; got {self.alpha}")
         if self.reach_sample <= 0:
             raise ValueError(f"reach_sample must be positive; got {self.reach_sample}")
+        if self.betweenness_samples is not None and self.betweenness_samples < 1:
+            raise ValueError(f"betweenness_samples must be >= 1 or None; got {self.betweenness_samples}")
+        if not 0 <= self.curve_tolerance < 1:
+            raise ValueError(f"curve_tolerance must be in [0, 1); got {self.curve_tolerance}")
+        if not (0 < self.dyn_batch < 1 or (self.dyn_batch >= 1 and float(self.dyn_batch).is_integer())):
+            raise ValueError(
+                f"dyn_batch must be a whole number of removals or a fraction in (0, 1); got {self.dyn_batch}"
+            )
         if self.strategies is not None:
             if not self.strategies:
                 raise ValueError("strategies must contain at least one entry; got an empty list")
@@ -108,6 +162,7 @@ def run_robustness(
     config: RobustnessConfig | None = None,
     *,
     progress: Callable[[str], None] | None = None,
+    jobs: int = 1,
 ) -> dict[str, Any]:
     """Run the full robustness battery on *G* and return a JSON-serialisable payload.
 
@@ -118,15 +173,18 @@ def run_robustness(
     ``"bridging(...)"`` strategy is selected.
 
     *progress* receives a short status label before each major step
-    (``"disparity"``, ``"baseline-efficiency"``, ``"pagerank"``,
-    ``"null/pagerank/3"``, ``"modular/leiden"``, …) so the CLI command can
-    stream live log output.
+    (``"disparity"``, ``"baseline-efficiency"``, ``"null-model"``,
+    ``"pagerank"``, ``"null/pagerank/3"``, ``"modular/leiden"``, …) so the CLI command can
+    stream live log output.  With ``jobs > 1`` the attack curves run in a
+    process pool and the strategy labels are reported as their curves
+    complete; the payload is the same for any ``jobs``.
 
     Payload shape::
 
         {
-          "config":     {alpha, strategies, n_random_runs, n_null, seed,
-                         reach_sample, n_rewire_swaps},
+          "config":     {alpha, strategies, n_random_runs, n_null, null_model, seed,
+                         reach_sample, n_rewire_swaps, betweenness_samples,
+                         betweenness_error_bound, curve_tolerance, dyn_batch},
           "graph":      {n, m, alpha, backbone_n, backbone_m,
                          filtered: bool},
           "efficiency": {"baseline": float},
@@ -136,6 +194,7 @@ def run_robustness(
               "curve_wcc":   [...], "curve_scc":   [...], "curve_reach": [...],
               "r_wcc":   float, "r_scc":   float, "r_reach":   float,
               "fc_wcc":  float|None, "fc_scc":  float|None, "fc_reach":  float|None,
+              "r_wcc_error":  float, …, "fc_wcc_error": float|None, …,
               "null": {
                 "r_wcc":   {"mean": float, "std": float, "z": float},
                 "r_scc":   {"mean": float, "std": float, "z": float},
@@ -154,6 +213,10 @@ def run_robustness(
           } | None,
         }
 
+    ``r_<m>_error`` / ``fc_<m>_error`` bound how far the exact ``R`` and
+    ``f_c`` can be from the reported ones when ``curve_tolerance > 0``
+    (``0.0`` for exact curves; ``None`` when ``f_c`` cannot be bounded).
+
     ``<strategy_key>`` is the canonical strategy token — bare names for
     everything except bridging variants, which use ``"bridging(<basis>)"``
     so multiple bridging strategies (e.g. one per community partition) can
@@ -161,7 +224,7 @@ def run_robustness(
     """
     config = config or RobustnessConfig()
     progress = progress or (lambda _: None)
-    rng = np.random.default_rng(config.seed)
+    backbone_stream, null_stream = np.random.SeedSequence(config.seed).spawn(2)
 
     # 1. Optional disparity-filter backbone
     progress("disparity")
@@ -200,44 +263,79 @@ def run_robustness(
                     f"available partitions: {sorted((partitions or {}).keys())}"
                 )
 
-    # 4. Per-strategy curves on the (possibly filtered) backbone
+    # 4. Null-model draws.  Each one has its own stream; as CSR views they are
+    # compact (weight shuffles even share the backbone's index arrays), so they
+    # are all built up front and shared with the worker pool with the backbone.
+    null_views: list[core.CSRGraph] = []
+    unit_streams = [backbone_stream]
+    if config.n_null > 0:
+        progress("null-model")
+        view = core.csr_view(backbone)
+        for stream in null_stream.spawn(config.n_null):
+            rewire_stream, units_stream = stream.spawn(2)
+            null_views.append(
+                null_view(
+                    view, config.null_model, n_swaps=config.n_rewire_swaps, rng=np.random.default_rng(rewire_stream)
+                )
+            )
+            unit_streams.append(units_stream)
+
+    # 5. Attack curves of every (graph, strategy, replicate) unit.  Graph 0
+    # is the backbone, graph k ≥ 1 the k-th null draw.
+    groups: list[tuple[int, str, int]] = []  # (graph index, payload_key, replicates)
+    tasks: list[tuple[Any, ...]] = []
+    for graph_index, units_stream in enumerate(unit_streams):
+        for (payload_key, _, _), strategy_stream in zip(resolved, units_stream.spawn(len(resolved)), strict=True):
+            n_replicates = config.n_random_runs if payload_key == "random" else 1
+            groups.append((graph_index, payload_key, n_replicates))
+            tasks.extend(
+                (
+                    graph_index,
+                    config.null_model,
+                    payload_key,
+                    replicate_stream,
+                    config.reach_sample,
+                    config.betweenness_samples,
+                    config.curve_tolerance,
+                    config.dyn_batch,
+                )
+                for replicate_stream in strategy_stream.spawn(n_replicates)
+            )
+    results = parallel.ordered_map(_attack_replicate, tasks, jobs, shared=(backbone, null_views, partitions))
+
     strategy_results: dict[str, dict[str, Any]] = {}
     cached_orders: dict[str, list[Any]] = {}
-    for payload_key, canonical, bridging_key in resolved:
-        progress(payload_key)
-        first_order, mean_curves = _compute_strategy_curves(
-            backbone, payload_key, config.n_random_runs, config.reach_sample, rng, partitions
-        )
-        cached_orders[payload_key] = first_order
-        strategy_results[payload_key] = {
-            "label": strategy_label(canonical, bridging_key),
-            **{f"curve_{m}": mean_curves[m] for m in _METRICS},
-            **{f"r_{m}": r_index(mean_curves[m]) for m in _METRICS},
-            **{f"fc_{m}": critical_threshold(mean_curves[m]) for m in _METRICS},
-            "null": None,
-        }
+    null_rs: dict[str, dict[str, list[float]]] = {
+        payload_key: {m: [] for m in _METRICS} for payload_key, _, _ in resolved
+    }
+    null_curves: dict[str, dict[str, list[list[float]]]] = {
+        payload_key: {m: [] for m in _METRICS} for payload_key, _, _ in resolved
+    }
+    labels = {payload_key: strategy_label(canonical, bridging_key) for payload_key, canonical, bridging_key in resolved}
+    for graph_index, payload_key, n_replicates in groups:
+        progress(payload_key if graph_index == 0 else f"null/{payload_key}/{graph_index}")
+        replicates = list(itertools.islice(results, n_replicates))
+        mean_curves = {m: _mean_estimate([estimates[m] for _, estimates in replicates]) for m in _METRICS}
+        if graph_index == 0:
+            # The modular-curve pass reuses the first order instead of recomputing it.
+            cached_orders[payload_key] = replicates[0][0]
+            strategy_results[payload_key] = {
+                "label": labels[payload_key],
+                **{f"curve_{m}": mean_curves[m].curve for m in _METRICS},
+                **{f"r_{m}": r_index(mean_curves[m].curve) for m in _METRICS},
+                **{f"fc_{m}": critical_threshold(mean_curves[m].curve) for m in _METRICS},
+                **{f"r_{m}_error": r_index_error(mean_curves[m]) for m in _METRICS},
+                **{f"fc_{m}_error": critical_threshold_error(mean_curves[m]) for m in _METRICS},
+                "null": None,
+            }
+        else:
+            for m in _METRICS:
+                curve = mean_curves[m].curve
+                null_curves[payload_key][m].append(curve)
+                null_rs[payload_key][m].append(r_index(curve))
+    _release_null_graph()
 
-    # 5. Null-model simulations
     if config.n_null > 0:
-        null_rs: dict[str, dict[str, list[float]]] = {
-            payload_key: {m: [] for m in _METRICS} for payload_key, _, _ in resolved
-        }
-        null_curves: dict[str, dict[str, list[list[float]]]] = {
-            payload_key: {m: [] for m in _METRICS} for payload_key, _, _ in resolved
-        }
-        for k, null_g in enumerate(
-            null_distribution(backbone, n_simulations=config.n_null, rng=rng, n_swaps=config.n_rewire_swaps),
-            start=1,
-        ):
-            for payload_key, _canonical, _bk in resolved:
-                progress(f"null/{payload_key}/{k}")
-                _, mean_curves_null = _compute_strategy_curves(
-                    null_g, payload_key, config.n_random_runs, config.reach_sample, rng, partitions
-                )
-                for m in _METRICS:
-                    curve = mean_curves_null[m]
-                    null_curves[payload_key][m].append(curve)
-                    null_rs[payload_key][m].append(r_index(curve))
         for payload_key, _canonical, _bk in resolved:
             null_data: dict[str, Any] = {}
             for m in _METRICS:
@@ -266,9 +364,16 @@ def run_robustness(
             "strategies": [pk for pk, _, _ in resolved],
             "n_random_runs": config.n_random_runs,
             "n_null": config.n_null,
+            "null_model": config.null_model,
             "seed": config.seed,
             "reach_sample": config.reach_sample,
             "n_rewire_swaps": config.n_rewire_swaps,
+            "betweenness_samples": config.betweenness_samples,
+            # Bound for the first-pass ranking on the full backbone; residual
+            # graphs of the dynamic strategies are smaller and tighter.
+            "betweenness_error_bound": betweenness_error_bound(backbone.number_of_nodes(), config.betweenness_samples),
+            "curve_tolerance": config.curve_tolerance,
+            "dyn_batch": config.dyn_batch,
         },
         "graph": {
             "n": G.number_of_nodes(),
@@ -287,35 +392,93 @@ def run_robustness(
 # ── private helpers ──────────────────────────────────────────────────────────
 
 
-def _compute_strategy_curves(
-    g: nx.DiGraph,
+def _attack_replicate(
+    graph_index: int,
+    null_model: str,
     strategy_token: str,
-    n_random_runs: int,
+    stream: np.random.SeedSequence,
     reach_sample: int,
-    rng: np.random.Generator,
-    partitions: dict[str, dict[Any, Any]] | None,
-) -> tuple[list[Any], dict[str, list[float]]]:
-    """Return ``(first_order, {metric: mean_curve})`` for *strategy_token* on *g*.
-
-    For ``"random"`` the curves are means over ``n_random_runs`` independent
-    orderings; for every other strategy the order is deterministic and the
-    curve is a single trace.  ``first_order`` is returned for the modular-
-    curve pass so it does not need to recompute the order.
+    betweenness_samples: int | None,
+    curve_tolerance: float,
+    dyn_batch: float,
+) -> tuple[list[Any], dict[str, CurveEstimate]]:
+    """Return ``(order, {metric: curve})`` for one replicate of *strategy_token*.
+
+    Runs as a :func:`network.parallel.ordered_map` task: the shared value is
+    ``(backbone, null_views, partitions)``; *graph_index* 0 attacks the
+    backbone and ``k ≥ 1`` the ``k``-th null draw.  *stream* seeds the
+    generator behind the ``"random"`` order and the ``"REACH"`` source
+    sampling, so the result depends only on the arguments.
+
+    A weight-shuffling draw differs from the backbone only in its weights,
+    which only the rankings read: ``"random"`` orders and all the curves use
+    the backbone as is.  The strategies with an array scorer rank from the
+    draw's CSR view directly; for the others a NetworkX copy with the null
+    weights is built.  A strength-preserving draw has its own edges, so its
+    graph is built for every unit.  Consecutive units of the same draw
+    reuse the graph built for it.
     """
-    if strategy_token == "random":
-        orders = [removal_order(g, "random", rng=rng) for _ in range(n_random_runs)]
-    else:
-        orders = [removal_order(g, strategy_token, rng=rng, partitions=partitions)]
-
-    curves_per_metric: dict[str, list[list[float]]] = {m: [] for m in _METRICS}
-    for order in orders:
-        for m in _METRICS:
-            kwargs: dict[str, Any] = {}
-            if m == "reach":
-                kwargs = {"reach_sample": reach_sample, "rng": rng}
-            curves_per_metric[m].append(attack_curve(g, order, _METRIC_KEYS[m], **kwargs))
-
-    return orders[0], {m: _mean_curve(curves_per_metric[m]) for m in _METRICS}
+    g, null_views, partitions = parallel.shared_value()
+    rng = np.random.default_rng(stream)
+    ranked = g
+    ranked_view = None
+    if graph_index > 0:
+        view = null_views[graph_index - 1]
+        if null_model != NULL_MODEL_WEIGHTS:
+            g = ranked = _null_graph(g, view)
+        elif ranks_from_view(strategy_token):
+            ranked_view = view
+        elif strategy_token != "random":
+            ranked = _null_graph(g, view)
+    order = removal_order(
+        ranked,
+        strategy_token,
+        rng=rng,
+        partitions=partitions,
+        betweenness_samples=betweenness_samples,
+        dyn_batch=dyn_batch,
+        view=ranked_view,
+    )
+    estimates: dict[str, CurveEstimate] = {}
+    for m in _METRICS:
+        kwargs: dict[str, Any] = {}
+        if m == "reach":
+            kwargs = {"reach_sample": reach_sample, "rng": rng}
+        if curve_tolerance > 0:
+            estimates[m] = adaptive_attack_curve(g, order, _METRIC_KEYS[m], tolerance=curve_tolerance, **kwargs)
+        else:
+            estimates[m] = CurveEstimate.exact(attack_curve(g, order, _METRIC_KEYS[m], **kwargs))
+    return order, estimates
+
+
+# Last strength-preserving null graph built by this process, as (draw, graph).
+_last_null_graph: tuple[core.CSRGraph, nx.DiGraph] | None = None
+
+
+def _null_graph(backbone: nx.DiGraph, view: core.CSRGraph) -> nx.DiGraph:
+    """``rewired_graph(backbone, view)``, reused while the units of one null draw follow each other."""
+    global _last_null_graph
+    if _last_null_graph is None or _last_null_graph[0] is not view:
+        _last_null_graph = (view, rewired_graph(backbone, view))
+    return _last_null_graph[1]
+
+
+def _release_null_graph() -> None:
+    global _last_null_graph
+    _last_null_graph = None
+
+
+def _mean_estimate(estimates: list[CurveEstimate]) -> CurveEstimate:
+    """Element-wise mean of the curves and of the bands of *estimates*.
+
+    ``"random"`` averages its ``n_random_runs`` replicates this way; every
+    other strategy has a single replicate.
+    """
+    return CurveEstimate(
+        _mean_curve([e.curve for e in estimates]),
+        _mean_curve([e.lower for e in estimates]),
+        _mean_curve([e.upper for e in estimates]),
+    )
 
 
 def _mean_curve(curves: list[list[float]]) -> list[float]:
@@ -591,7 +591,7 @@ def _robustness_sheet_name(prefix: str, suffix: str) -> str:
 
 def _fill_robustness_summary(wb: Any, payload: dict, suffix: str) -> None:
     ws = wb.create_sheet(title=_robustness_sheet_name("Summary", suffix))
-    headers = ["Strategy", "Metric", "R", "R_null_mean", "R_null_std", "z", "f_c"]
+    headers = ["Strategy", "Metric", "R", "R_null_mean", "R_null_std", "z", "f_c", "R_error", "f_c_error"]
     ws.append(headers)
     for cell in ws[1]:
         cell.font = Font(bold=True)
@@ -609,6 +609,8 @@ def _fill_robustness_summary(wb: Any, payload: dict, suffix: str) -> None:
                     null_m.get("std"),
                     null_m.get("z"),
                     strat.get(f"fc_{m}"),
+                    strat.get(f"r_{m}_error"),
+                    strat.get(f"fc_{m}_error"),
                 ]
             )
 
@@ -1,12 +1,15 @@
 import datetime
 import json
+import math
 import os
 import tempfile
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 from django.test import TestCase, override_settings
+from django.utils import timezone
 
+from network import core
 from network.community import (
     COMMUNITY_ALGORITHMS,
     apply_edge_colors,
@@ -35,8 +38,8 @@ from network.exporter import (
     reposition_isolated_nodes,
     write_graph_files,
 )
-from network.graph_builder import build_graph
-from network.layout import compute_layout
+from network.graph_builder import _recency_decay, build_graph, merge_edge_counts, yearly_edge_counts
+from network.layout import _landmark_distances, _laplacian_features, _shortest_path_matrix, compute_layout
 from network.measures import (
     apply_amplification_factor,
     apply_base_node_measures,
@@ -57,11 +60,12 @@ from network.measures import (
     apply_spreading_efficiency,
     compute_betweenness,
 )
-from webapp.models import Channel, Message, Organization
+from webapp.models import Channel, ChannelEdgeDaily, Message, Organization
 from webapp.utils.colors import parse_color
 
 import networkx as nx
 import numpy as np
+import scipy.sparse as sp
 
 # ---------------------------------------------------------------------------
 # community.py — normalize_community_map
@@ -474,6 +478,11 @@ class BuildGraphTests(TestCase):
         self.ch1 = Channel.objects.create(telegram_id=1, organization=self.org, title="Channel 1")
         self.ch2 = Channel.objects.create(telegram_id=2, organization=self.org, title="Channel 2")
 
+    def _build_graph(self, **kwargs: Any) -> Any:
+        """Materialise ChannelEdgeDaily from the messages created by the test, then build."""
+        ChannelEdgeDaily.objects.rebuild()
+        return build_graph(**kwargs)
+
     def _create_forward(self) -> Message:
         """Create a message in ch2 forwarded from ch1 and refresh degrees."""
         msg = Message.objects.create(telegram_id=1, channel=self.ch2, forwarded_from=self.ch1)
@@ -483,22 +492,22 @@ class BuildGraphTests(TestCase):
 
     def test_raises_value_error_when_no_edges(self) -> None:
         with self.assertRaises(ValueError):
-            build_graph()
+            self._build_graph()
 
     def test_builds_graph_with_forwarded_message_edges(self) -> None:
         self._create_forward()
-        graph, channel_dict, edge_list, channel_qs = build_graph()
+        graph, channel_dict, edge_list, channel_qs = self._build_graph()
         self.assertGreater(len(edge_list), 0)
 
     def test_both_channels_appear_in_channel_dict(self) -> None:
         self._create_forward()
-        _, channel_dict, _, _ = build_graph()
+        _, channel_dict, _, _ = self._build_graph()
         self.assertIn(str(self.ch1.pk), channel_dict)
         self.assertIn(str(self.ch2.pk), channel_dict)
 
     def test_edge_weight_normalized_to_max_10(self) -> None:
         self._create_forward()
-        graph, _, edge_list, _ = build_graph()
+        graph, _, edge_list, _ = self._build_graph()
         for _u, _v, data in graph.edges(data=True):
             self.assertLessEqual(data["weight"], 10.0)
             self.assertGreater(data["weight"], 0)
@@ -506,21 +515,21 @@ class BuildGraphTests(TestCase):
     @override_settings(REVERSED_EDGES=False)
     def test_reversed_edges_false_gives_source_to_target_direction(self) -> None:
         self._create_forward()
-        graph, _, _, _ = build_graph()
+        graph, _, _, _ = self._build_graph()
         # ch1 is source of forwards, ch2 is destination → edge ch1→ch2
         self.assertIn((str(self.ch1.pk), str(self.ch2.pk)), graph.edges())
 
     @override_settings(REVERSED_EDGES=True)
     def test_reversed_edges_true_flips_direction(self) -> None:
         self._create_forward()
-        graph, _, _, _ = build_graph()
+        graph, _, _, _ = self._build_graph()
         # With REVERSED_EDGES, direction is flipped: ch2→ch1
         self.assertIn((str(self.ch2.pk), str(self.ch1.pk)), graph.edges())
 
     def test_builds_graph_with_reference_edges(self) -> None:
         msg = Message.objects.create(telegram_id=1, channel=self.ch2)
         msg.references.add(self.ch1)
-        graph, _, edge_list, _ = build_graph()
+        graph, _, edge_list, _ = self._build_graph()
         self.assertGreater(len(edge_list), 0)
 
     def test_draw_dead_leaves_includes_channels_with_in_degree(self) -> None:
@@ -532,18 +541,18 @@ class BuildGraphTests(TestCase):
         self.assertGreater(ch3.in_degree or 0, 0)
         # Create a ch1↔ch2 edge so graph is valid
         self._create_forward()
-        _, channel_dict_dl, _, _ = build_graph(draw_dead_leaves=True)
+        _, channel_dict_dl, _, _ = self._build_graph(draw_dead_leaves=True)
         self.assertIn(str(ch3.pk), channel_dict_dl)
 
     def test_draw_dead_leaves_false_excludes_out_of_target(self) -> None:
         ch3 = Channel.objects.create(telegram_id=3, organization=None, title="Dead Leaf")
         self._create_forward()
-        _, channel_dict, _, _ = build_graph(draw_dead_leaves=False)
+        _, channel_dict, _, _ = self._build_graph(draw_dead_leaves=False)
         self.assertNotIn(str(ch3.pk), channel_dict)
 
     def test_returns_queryset_of_channels(self) -> None:
         self._create_forward()
-        _, _, _, channel_qs = build_graph()
+        _, _, _, channel_qs = self._build_graph()
         self.assertIn(self.ch1, channel_qs)
         self.assertIn(self.ch2, channel_qs)
 
@@ -556,12 +565,12 @@ class BuildGraphTests(TestCase):
     def test_startdate_excludes_messages_before_date(self) -> None:
         self._create_forward_on_date(datetime.datetime(2023, 1, 15, tzinfo=datetime.timezone.utc))
         with self.assertRaises(ValueError):
-            build_graph(start_date=datetime.date(2023, 2, 1))
+            self._build_graph(start_date=datetime.date(2023, 2, 1))
 
     def test_enddate_excludes_messages_after_date(self) -> None:
         self._create_forward_on_date(datetime.datetime(2023, 3, 1, tzinfo=datetime.timezone.utc))
         with self.assertRaises(ValueError):
-            build_graph(end_date=datetime.date(2023, 2, 28))
+            self._build_graph(end_date=datetime.date(2023, 2, 28))
 
     def test_date_range_includes_matching_messages(self) -> None:
         self._create_forward_on_date(datetime.datetime(2023, 6, 15, tzinfo=datetime.timezone.utc))
@@ -569,7 +578,7 @@ class BuildGraphTests(TestCase):
         Message.objects.create(
             telegram_id=100, channel=self.ch1, date=datetime.datetime(2023, 6, 10, tzinfo=datetime.timezone.utc)
         )
-        graph, _, edge_list, _ = build_graph(
+        graph, _, edge_list, _ = self._build_graph(
             start_date=datetime.date(2023, 6, 1),
             end_date=datetime.date(2023, 6, 30),
         )
@@ -593,7 +602,7 @@ class BuildGraphTests(TestCase):
         )
         self.ch1.save()
         ch3.save()
-        _, channel_dict, _, channel_qs = build_graph(start_date=datetime.date(2023, 1, 1))
+        _, channel_dict, _, channel_qs = self._build_graph(start_date=datetime.date(2023, 1, 1))
         self.assertNotIn(str(self.ch2.pk), channel_dict)
         self.assertNotIn(self.ch2, channel_qs)
 
@@ -603,12 +612,114 @@ class BuildGraphTests(TestCase):
         Message.objects.create(
             telegram_id=100, channel=self.ch1, date=datetime.datetime(2023, 6, 10, tzinfo=datetime.timezone.utc)
         )
-        _, _, _, channel_qs = build_graph(
+        _, _, _, channel_qs = self._build_graph(
             start_date=datetime.date(2023, 6, 1),
             end_date=datetime.date(2023, 6, 30),
         )
         self.assertIn(self.ch2, channel_qs)
 
+    def test_out_of_target_after_cuts_later_edges(self) -> None:
+        self._create_forward_on_date(datetime.datetime(2023, 6, 15, tzinfo=datetime.timezone.utc))
+        Channel.objects.filter(pk=self.ch2.pk).update(out_of_target_after=datetime.date(2023, 6, 14))
+        with self.assertRaises(ValueError):
+            self._build_graph()
+
+    def test_partial_messages_uses_message_counts_from_edge_table(self) -> None:
+        self._create_forward_on_date(datetime.datetime(2023, 6, 15, tzinfo=datetime.timezone.utc))
+        Message.objects.create(
+            telegram_id=100, channel=self.ch2, date=datetime.datetime(2023, 6, 16, tzinfo=datetime.timezone.utc)
+        )
+        _, _, edge_list, _ = self._build_graph(edge_weight_strategy="PARTIAL_MESSAGES")
+        self.assertEqual(len(edge_list), 1)
+        self.assertAlmostEqual(edge_list[0][2], 0.5)
+
+    def _create_yearly_history(self) -> None:
+        ch3 = Channel.objects.create(telegram_id=3, organization=self.org, title="Channel 3")
+        for i, (channel, source, year) in enumerate(
+            ((self.ch2, self.ch1, 2022), (self.ch2, self.ch1, 2023), (ch3, self.ch2, 2023), (self.ch1, ch3, 2024))
+        ):
+            Message.objects.create(
+                telegram_id=300 + i,
+                channel=channel,
+                forwarded_from=source,
+                date=datetime.datetime(year, 5, 1, tzinfo=datetime.timezone.utc),
+            )
+        mention = Message.objects.create(
+            telegram_id=400, channel=ch3, date=datetime.datetime(2023, 7, 1, tzinfo=datetime.timezone.utc)
+        )
+        mention.references.add(self.ch1)
+        ChannelEdgeDaily.objects.rebuild()
+
+    def test_yearly_edge_counts_match_per_year_build(self) -> None:
+        self._create_yearly_history()
+        counts_by_year = yearly_edge_counts()
+        self.assertEqual(sorted(counts_by_year), [2022, 2023, 2024])
+        for year in (2022, 2023, 2024):
+            window = {"start_date": datetime.date(year, 1, 1), "end_date": datetime.date(year, 12, 31)}
+            try:
+                _, direct_dict, direct_edges, _ = build_graph(**window)
+            except ValueError:
+                # e.g. 2022: the forward source posted nothing that year, so it is dropped.
+                with self.assertRaises(ValueError):
+                    build_graph(edge_counts=counts_by_year[year], **window)
+                continue
+            _, sliced_dict, sliced_edges, _ = build_graph(edge_counts=counts_by_year[year], **window)
+            self.assertEqual(set(sliced_dict), set(direct_dict))
+            self.assertEqual(sorted(sliced_edges), sorted(direct_edges))
+
+    def test_merged_yearly_counts_match_full_range_build(self) -> None:
+        self._create_yearly_history()
+        merged = merge_edge_counts(yearly_edge_counts(recency_weights=365))
+        _, _, direct_edges, _ = build_graph(recency_weights=365)
+        _, _, merged_edges, _ = build_graph(recency_weights=365, edge_counts=merged)
+        direct = {(e[0], e[1]): e[2:] for e in direct_edges}
+        for edge in merged_edges:
+            for got, expected in zip(edge[2:], direct[(edge[0], edge[1])], strict=True):
+                self.assertAlmostEqual(got, expected)
+        self.assertEqual(len(merged_edges), len(direct_edges))
+
+    @override_settings(REVERSED_EDGES=False)
+    def test_recency_weights_match_per_message_decay(self) -> None:
+        today = timezone.localdate()
+        dates = [
+            datetime.datetime.combine(
+                today - datetime.timedelta(days=days), datetime.time(hour), tzinfo=datetime.timezone.utc
+            )
+            for days, hour in ((2, 9), (40, 8), (40, 23), (400, 0))
+        ]
+        for i, date in enumerate(dates):
+            Message.objects.create(telegram_id=200 + i, channel=self.ch2, forwarded_from=self.ch1, date=date)
+        mention = Message.objects.create(telegram_id=300, channel=self.ch2, date=dates[3])
+        mention.references.add(self.ch1)
+        graph, _, _, _ = self._build_graph(recency_weights=30, edge_weight_strategy="TOTAL")
+        edge = graph.edges[str(self.ch1.pk), str(self.ch2.pk)]
+        self.assertAlmostEqual(edge["weight_forwards"], sum(_recency_decay(d, today, 30) for d in dates))
+        self.assertAlmostEqual(edge["weight_mentions"], _recency_decay(dates[3], today, 30))
+
+    @override_settings(REVERSED_EDGES=False, TIME_ZONE="America/New_York")
+    def test_recency_weights_age_in_local_days(self) -> None:
+        # 02:00 UTC is still the previous calendar day in New York: the message
+        # is bucketed, and its age counted, by that local day.
+        today = timezone.localdate()
+        local_day = today - datetime.timedelta(days=40)
+        date = datetime.datetime.combine(
+            local_day + datetime.timedelta(days=1), datetime.time(2), tzinfo=datetime.timezone.utc
+        )
+        Message.objects.create(telegram_id=200, channel=self.ch2, forwarded_from=self.ch1, date=date)
+        graph, _, _, _ = self._build_graph(recency_weights=30, edge_weight_strategy="TOTAL")
+        self.assertEqual(ChannelEdgeDaily.objects.get(kind=ChannelEdgeDaily.FORWARD).day, local_day)
+        edge = graph.edges[str(self.ch1.pk), str(self.ch2.pk)]
+        self.assertAlmostEqual(edge["weight_forwards"], math.exp(-10 / 30))
+
+    def test_recency_weights_partial_references_share_decay(self) -> None:
+        old = datetime.datetime(2020, 1, 1, 12, tzinfo=datetime.timezone.utc)
+        Message.objects.create(telegram_id=200, channel=self.ch2, forwarded_from=self.ch1, date=old)
+        Message.objects.create(telegram_id=201, channel=self.ch2, date=old)
+        _, _, edge_list, _ = self._build_graph(recency_weights=30, edge_weight_strategy="PARTIAL_REFERENCES")
+        # Numerator and denominator decay identically, so the only referencing message yields 1.0.
+        self.assertEqual(len(edge_list), 1)
+        self.assertAlmostEqual(edge_list[0][2], 1.0)
+
 
 # ---------------------------------------------------------------------------
 # exporter.py — build_graph_data
@@ -1003,6 +1114,305 @@ class ComputeLayoutTests(TestCase):
         self.assertIn("solo", positions)
 
 
+class ForceAtlas2ThreeDTests(TestCase):
+    def setUp(self) -> None:
+        graph = nx.gnm_random_graph(60, 180, seed=5, directed=True)
+        self.graph = nx.relabel_nodes(graph, {i: f"n{i}" for i in graph})
+        rng = np.random.default_rng(0)
+        self.initial = {node: tuple(rng.random(3) * 100) for node in self.graph}
+
+    def test_3d_uses_barnes_hut_with_2d_theta(self) -> None:
+        from network.layout import _build_forceatlas2
+
+        fa2_3d, fa2_2d = _build_forceatlas2(dim=3), _build_forceatlas2(dim=2)
+        self.assertTrue(fa2_3d.barnesHutOptimize)
+        self.assertEqual(fa2_3d.barnesHutTheta, fa2_2d.barnesHutTheta)
+
+    def test_same_initial_positions_give_same_layout(self) -> None:
+        from network.layout import forceatlas2_positions_3d
+
+        first = forceatlas2_positions_3d(self.graph, self.initial, iterations=30)
+        second = forceatlas2_positions_3d(self.graph, self.initial, iterations=30)
+        self.assertEqual(first, second)
+        self.assertEqual(set(first), set(self.graph.nodes()))
+        self.assertTrue(all(len(pos) == 3 for pos in first.values()))
+
+
+class SeedPositionsTests(TestCase):
+    def setUp(self) -> None:
+        # Two linked stars plus a separate ring: many leaves share a distance profile.
+        graph = nx.DiGraph()
+        graph.add_edges_from(("h0", f"a{i}") for i in range(12))
+        graph.add_edges_from(("h1", f"b{i}") for i in range(12))
+        graph.add_edge("a0", "b0")
+        nx.add_cycle(graph, [f"r{i}" for i in range(8)])
+        self.graph = graph
+
+    def test_auto_switches_from_kamada_kawai_above_threshold(self) -> None:
+        from network import layout
+
+        self.assertEqual(layout.resolve_layout_seed("auto", 10), layout.LAYOUT_SEED_KAMADA_KAWAI)
+        self.assertEqual(layout.resolve_layout_seed(None, 5000), layout.LAYOUT_SEED_PIVOT_MDS)
+        self.assertEqual(layout.resolve_layout_seed("SPECTRAL", 5000), layout.LAYOUT_SEED_SPECTRAL)
+        with self.assertRaises(ValueError):
+            layout.resolve_layout_seed("RANDOM", 10)
+
+    def test_fast_seeds_place_every_node_apart_and_repeat(self) -> None:
+        from network import layout
+
+        for method in (layout.LAYOUT_SEED_PIVOT_MDS, layout.LAYOUT_SEED_SPECTRAL):
+            for dim in (2, 3):
+                with self.subTest(method=method, dim=dim):
+                    positions = layout.seed_positions(self.graph, method, dim)
+                    self.assertEqual(list(positions), list(self.graph.nodes()))
+                    coords = np.array(list(positions.values()))
+                    self.assertEqual(coords.shape, (self.graph.number_of_nodes(), dim))
+                    self.assertEqual(len({tuple(row) for row in coords.tolist()}), len(coords))
+                    self.assertLessEqual(np.abs(coords).max(), 1.01)
+                    self.assertEqual(positions, layout.seed_positions(self.graph, method, dim))
+
+    def test_pivot_mds_keeps_components_apart(self) -> None:
+        from network import layout
+
+        positions = layout.seed_positions(self.graph, layout.LAYOUT_SEED_PIVOT_MDS)
+        ring = np.array([positions[f"r{i}"] for i in range(8)])
+        stars = np.array([pos for node, pos in positions.items() if not node.startswith("r")])
+        gap = np.linalg.norm(ring.mean(axis=0) - stars.mean(axis=0))
+        self.assertGreater(gap, np.linalg.norm(ring - ring.mean(axis=0), axis=1).max())
+
+    def test_compute_layout_uses_selected_seed(self) -> None:
+        from network import layout
+
+        with patch.object(layout, "kamada_kawai_positions") as kk:
+            positions = layout.compute_layout(self.graph, iterations=5, seed=layout.LAYOUT_SEED_PIVOT_MDS)
+        kk.assert_not_called()
+        self.assertEqual(set(positions), set(self.graph.nodes()))
+
+
+class MultilevelLayoutTests(TestCase):
+    def setUp(self) -> None:
+        graph = nx.gnm_random_graph(150, 300, seed=3, directed=True)
+        self.graph = nx.relabel_nodes(graph, {i: f"n{i}" for i in graph})
+        self.graph.add_node("iso")
+
+    def test_coarsen_collapses_stars_and_pairs_paths(self) -> None:
+        from network.layout import _coarsen
+
+        # Star 0–{1,2,3}, path 4–5–6–7, isolated 8.
+        edges = [(0, 1), (0, 2), (0, 3), (4, 5), (5, 6), (6, 7)]
+        rows = [u for u, v in edges] + [v for u, v in edges]
+        cols = [v for u, v in edges] + [u for u, v in edges]
+        adjacency = sp.csr_array((np.ones(len(rows)), (rows, cols)), shape=(9, 9))
+        group, count = _coarsen(adjacency)
+        self.assertEqual(count, 4)
+        self.assertEqual(len(set(group[:4].tolist())), 1)
+        self.assertEqual(group[4], group[5])
+        self.assertEqual(group[6], group[7])
+        self.assertNotIn(group[8], group[:8].tolist())
+
+    def test_positions_cover_every_node_in_2d_and_3d(self) -> None:
+        from network import layout
+
+        for fn, dim in ((layout.multilevel_positions_2d, 2), (layout.multilevel_positions_3d, 3)):
+            with self.subTest(dim=dim), patch.object(layout, "_coarsen", wraps=layout._coarsen) as coarsen:
+                positions = fn(self.graph)
+                coarsen.assert_called()
+                self.assertEqual(list(positions), list(self.graph.nodes()))
+                coords = np.array(list(positions.values()))
+                self.assertEqual(coords.shape, (self.graph.number_of_nodes(), dim))
+                self.assertTrue(np.isfinite(coords).all())
+                self.assertEqual(len({tuple(row) for row in coords.tolist()}), len(coords))
+
+    def test_layout_is_deterministic(self) -> None:
+        from network.layout import multilevel_positions_2d
+
+        self.assertEqual(multilevel_positions_2d(self.graph), multilevel_positions_2d(self.graph))
+
+    def test_empty_and_tiny_graphs(self) -> None:
+        from network.layout import multilevel_positions_2d
+
+        self.assertEqual(multilevel_positions_2d(nx.DiGraph()), {})
+        graph = nx.DiGraph([("a", "b")])
+        self.assertEqual(set(multilevel_positions_2d(graph)), {"a", "b"})
+
+
+class WarmStartLayoutTests(TestCase):
+    def setUp(self) -> None:
+        self.graph = nx.DiGraph()
+        self.graph.add_edges_from([("1", "2"), ("2", "3"), ("3", "1"), ("3", "4"), ("5", "6")])
+        self.reference = {"1": (0.0, 0.0), "2": (100.0, 0.0), "3": (50.0, 80.0)}
+
+    def test_kamada_kawai_only_runs_on_new_nodes(self) -> None:
+        from network import layout
+
+        with patch.object(layout, "kamada_kawai_positions", wraps=layout.kamada_kawai_positions) as kk:
+            initial = layout.seed_from_reference(self.graph, self.reference)
+        self.assertEqual(set(kk.call_args.args[0].nodes()), {"4", "5", "6"})
+        self.assertEqual(list(initial), list(self.graph.nodes()))
+        for node, pos in self.reference.items():
+            self.assertEqual(initial[node], pos)
+        # A new node with a placed neighbour starts next to it.
+        self.assertLess(np.hypot(*np.subtract(initial["4"], self.reference["3"])), 50.0)
+        self.assertNotEqual(initial["5"], initial["6"])
+
+    def test_reference_must_cover_half_the_nodes(self) -> None:
+        from network.layout import warm_start_reference
+
+        self.assertIs(warm_start_reference(self.graph, self.reference), self.reference)
+        self.assertIsNone(warm_start_reference(self.graph, {"1": (0.0, 0.0), "2": (1.0, 1.0)}))
+        self.assertIsNone(warm_start_reference(self.graph, None))
+
+    def test_warm_start_runs_reduced_iterations(self) -> None:
+        from io import StringIO
+
+        from network.management.commands.structural_analysis import Command
+
+        out = StringIO()
+        with patch(f"{_EXPORT_CMD}.layout.forceatlas2_positions", side_effect=lambda g, pos, it: pos) as fa2:
+            positions, _ = Command(stdout=out)._compute_layout(
+                self.graph, True, False, 800, "HORIZONTAL", self.reference, None, warm_start=True
+            )
+        self.assertEqual(fa2.call_args.args[2], 200)
+        self.assertIn("(3 new nodes)", out.getvalue())
+        self.assertIn("200 iterations, warm start", out.getvalue())
+        self.assertEqual(set(positions), set(self.graph.nodes()))
+
+    def test_multilevel_algorithm_skips_full_forceatlas2(self) -> None:
+        from io import StringIO
+
+        from network import layout
+        from network.management.commands.structural_analysis import Command
+
+        with (
+            patch(f"{_EXPORT_CMD}.layout.forceatlas2_positions", side_effect=lambda g, pos, it: pos) as fa2,
+            patch(f"{_EXPORT_CMD}.layout.multilevel_positions_2d", wraps=layout.multilevel_positions_2d) as ml,
+        ):
+            positions, _ = Command(stdout=StringIO())._compute_layout(
+                self.graph, True, False, 800, "HORIZONTAL", algorithm=layout.LAYOUT_ALGORITHM_MULTILEVEL
+            )
+            ml.assert_called_once()
+            fa2.assert_not_called()
+            self.assertEqual(set(positions), set(self.graph.nodes()))
+
+            # Seeded from a reference, the multilevel layout only refines it.
+            Command(stdout=StringIO())._compute_layout(
+                self.graph, True, False, 800, "HORIZONTAL", self.reference, algorithm=layout.LAYOUT_ALGORITHM_MULTILEVEL
+            )
+            ml.assert_called_once()
+            self.assertEqual(fa2.call_args.args[2], layout.MULTILEVEL_REFINE_ITERATIONS)
+
+    def test_warm_start_needs_an_explicit_name(self) -> None:
+        from network.management.commands.structural_analysis import Command
+
+        def resolve(*argv: str) -> Any:
+            command = Command()
+            return command._resolve_options(
+                vars(command.create_parser("manage.py", "structural_analysis").parse_args(argv))
+            )
+
+        self.assertFalse(resolve("--warm-start-layout").warm_start_layout)
+        self.assertTrue(resolve("--warm-start-layout", "--name", "daily").warm_start_layout)
+
+    def test_multilevel_algorithm_takes_over_the_fa2_extra_layout(self) -> None:
+        from network.management.commands.structural_analysis import Command
+
+        command = Command()
+        argv = ["--layout-algorithm", "multilevel", "--2dlayouts", "FA2,MULTILEVEL,CIRCULAR", "--3dlayouts", "FA2"]
+        opts = command._resolve_options(
+            vars(command.create_parser("manage.py", "structural_analysis").parse_args(argv))
+        )
+        self.assertEqual(opts.layout_algorithm, "MULTILEVEL")
+        self.assertEqual(opts.extra_layout_names, ["MULTILEVEL", "CIRCULAR"])
+        self.assertEqual(opts.extra_layout_names_3d, ["MULTILEVEL"])
+
+
+# ---------------------------------------------------------------------------
+# layout.py — _laplacian_features
+# ---------------------------------------------------------------------------
+
+
+class LaplacianFeaturesTests(TestCase):
+    def _dense_features(self, graph: nx.DiGraph, k: int) -> np.ndarray:
+        nodes = list(graph.nodes())
+        adjacency = nx.to_numpy_array(graph.to_undirected(), nodelist=nodes, weight="weight")
+        d_inv_sqrt = np.diag(1.0 / np.sqrt(adjacency.sum(axis=1)))
+        _values, vectors = np.linalg.eigh(np.eye(len(nodes)) - d_inv_sqrt @ adjacency @ d_inv_sqrt)
+        return vectors[:, 1 : k + 1]
+
+    def _assert_same_span(self, a: np.ndarray, b: np.ndarray) -> None:
+        # Eigenvectors are only defined up to sign and rotation within an eigenspace.
+        cosines = np.linalg.svd(np.linalg.qr(a)[0].T @ np.linalg.qr(b)[0], compute_uv=False)
+        np.testing.assert_allclose(cosines, 1.0, atol=1e-6)
+
+    def setUp(self) -> None:
+        graph = nx.gnm_random_graph(120, 600, seed=3, directed=True)
+        self.graph = nx.relabel_nodes(graph, {i: f"n{i}" for i in graph})
+        for u, v in self.graph.edges():
+            self.graph[u][v]["weight"] = 1.0 + (int(u[1:]) + int(v[1:])) % 3
+
+    def test_rows_follow_graph_node_order(self) -> None:
+        nodes, features = _laplacian_features(self.graph, k=4)
+        self.assertEqual(nodes, list(self.graph.nodes()))
+        self.assertEqual(features.shape, (120, 4))
+
+    def test_dense_path_matches_full_eigendecomposition(self) -> None:
+        _nodes, features = _laplacian_features(self.graph, k=4)
+        self._assert_same_span(features, self._dense_features(self.graph, 4))
+
+    def test_sparse_solver_matches_full_eigendecomposition(self) -> None:
+        with patch("network.layout._SPARSE_EIGEN_MIN_NODES", 0):
+            _nodes, features = _laplacian_features(self.graph, k=4)
+        self._assert_same_span(features, self._dense_features(self.graph, 4))
+
+    def test_lobpcg_fallback_matches_full_eigendecomposition(self) -> None:
+        import scipy.sparse.linalg as spla
+
+        no_convergence = spla.ArpackNoConvergence("no convergence", np.empty(0), np.empty((0, 0)))
+        with (
+            patch("network.layout._SPARSE_EIGEN_MIN_NODES", 0),
+            patch("network.layout.spla.eigsh", side_effect=no_convergence),
+        ):
+            _nodes, features = _laplacian_features(self.graph, k=4)
+        self._assert_same_span(features, self._dense_features(self.graph, 4))
+
+
+# ---------------------------------------------------------------------------
+# layout.py — _shortest_path_matrix / _landmark_distances
+# ---------------------------------------------------------------------------
+
+
+class HopDistanceTests(TestCase):
+    def setUp(self) -> None:
+        # A path a-b-c-d plus a hub h, a separate pair x→y and an isolated node.
+        self.graph = nx.DiGraph()
+        self.graph.add_edges_from(
+            [("a", "b"), ("c", "b"), ("c", "d"), ("h", "a"), ("h", "b"), ("h", "c"), ("h", "d"), ("x", "y")]
+        )
+        self.graph.add_node("iso")
+
+    def test_all_pairs_matches_networkx(self) -> None:
+        nodes, dist = _shortest_path_matrix(self.graph)
+        self.assertEqual(nodes, list(self.graph.nodes()))
+        n = len(nodes)
+        lengths = dict(nx.all_pairs_shortest_path_length(self.graph.to_undirected()))
+        for i, u in enumerate(nodes):
+            for j, v in enumerate(nodes):
+                self.assertEqual(dist[i, j], lengths[u].get(v, n))
+
+    def test_landmarks_start_at_hub_then_cover_other_components(self) -> None:
+        nodes, all_pairs = _shortest_path_matrix(self.graph)
+        _nodes, landmarks = _landmark_distances(self.graph, 3)
+        self.assertEqual(landmarks.shape, (len(nodes), 3))
+        np.testing.assert_array_equal(landmarks[:, 0], all_pairs[:, nodes.index("h")])
+        # Every later landmark is unreachable from the earlier ones; ties go to the smallest id.
+        np.testing.assert_array_equal(landmarks[:, 1], all_pairs[:, nodes.index("iso")])
+        np.testing.assert_array_equal(landmarks[:, 2], all_pairs[:, nodes.index("x")])
+
+    def test_landmark_count_capped_at_node_count(self) -> None:
+        _nodes, landmarks = _landmark_distances(self.graph, 50)
+        self.assertEqual(landmarks.shape, (self.graph.number_of_nodes(), self.graph.number_of_nodes()))
+
+
 # ---------------------------------------------------------------------------
 # community.py — detect_infomap
 # ---------------------------------------------------------------------------
@@ -1058,6 +1468,69 @@ class DetectInfomapTests(TestCase):
         self.assertIn("isolated", community_map)
 
 
+# ---------------------------------------------------------------------------
+# community.py — detect_infomap_memory
+# ---------------------------------------------------------------------------
+
+
+class DetectInfomapMemoryTests(TestCase):
+    def setUp(self) -> None:
+        # a→b, c→b, b→d: b has two arrival states and one out-edge.
+        self.graph = nx.DiGraph()
+        self.graph.add_weighted_edges_from([("a", "b", 1.0), ("c", "b", 2.0), ("b", "d", 3.0)])
+        self.graph.add_node("iso")
+
+    def _network(self, max_trigrams: int | None) -> tuple[list, list, set]:
+        from network.community import _memory_state_network
+
+        view = core.csr_view(self.graph)
+        state_ids, state_nodes, sources, targets, weights = _memory_state_network(view, max_trigrams)
+        states = [(int(s), view.node_ids[p]) for s, p in zip(state_ids, state_nodes, strict=True)]
+        links = {(int(u), int(v), float(w)) for u, v, w in zip(sources, targets, weights, strict=True)}
+        return view, states, links
+
+    def test_states_are_edge_ids_plus_entry_states(self) -> None:
+        view, states, links = self._network(None)
+        m, n = view.m, view.n
+        eid = {
+            (view.node_ids[u], view.node_ids[v]): e
+            for e, (u, v) in enumerate(zip(view.edge_sources, view.out_idx, strict=True))
+        }
+        entry = {node_id: m + n + view.index[node_id] for node_id in ("a", "c")}
+        self.assertEqual(
+            sorted(states),
+            sorted(
+                [(eid["a", "b"], "b"), (eid["c", "b"], "b"), (eid["b", "d"], "d"), (entry["a"], "a"), (entry["c"], "c")]
+            ),
+        )
+        self.assertEqual(
+            links,
+            {
+                (entry["a"], eid["a", "b"], 1.0),
+                (entry["c"], eid["c", "b"], 2.0),
+                (eid["a", "b"], eid["b", "d"], 3.0),
+                (eid["c", "b"], eid["b", "d"], 3.0),
+            },
+        )
+
+    def test_hub_above_cap_gets_one_lumped_state(self) -> None:
+        view, states, links = self._network(1)
+        hub_state = view.m + view.index["b"]
+        self.assertEqual([s for s, node_id in states if node_id == "b"], [hub_state])
+        # Both arrivals feed the lumped state, which links once to b→d: 3 links instead of 4.
+        self.assertEqual(len(links), 3)
+        self.assertEqual({v for u, v, _w in links if u == hub_state}, {s for s, node_id in states if node_id == "d"})
+
+    def test_every_node_assigned(self) -> None:
+        from network.community import detect_infomap_memory
+
+        for cap in (None, 1):
+            with self.subTest(cap=cap):
+                community_map, palette = detect_infomap_memory(self.graph, "vaporwave", max_trigrams=cap)
+                self.assertEqual(set(community_map), set(self.graph.nodes()))
+                self.assertEqual(set(palette), set(community_map.values()))
+
+
 # ---------------------------------------------------------------------------
 # community.py — detect_leiden
 # ---------------------------------------------------------------------------
@@ -1112,6 +1585,63 @@ class DetectLeidenTests(TestCase):
         self.assertEqual(community_map["iso1"], community_map["iso2"])
 
 
+# ---------------------------------------------------------------------------
+# community.py — detect_mcl
+# ---------------------------------------------------------------------------
+
+
+class DetectMclTests(TestCase):
+    @patch("network.community.palette_colors", return_value=["#ff0000", "#00ff00", "#0000ff"])
+    def test_separates_dense_groups_and_isolates(self, _mock: MagicMock) -> None:
+        from network.community import detect_mcl
+
+        graph = nx.DiGraph()
+        for group in (["a", "b", "c"], ["d", "e", "f"]):
+            graph.add_weighted_edges_from((u, v, 5.0) for u in group for v in group if u != v)
+        graph.add_weighted_edges_from([("c", "d", 0.1)])
+        graph.add_node("iso")
+        community_map, palette = detect_mcl(graph, "SomePalette", 2.0)
+        self.assertEqual(community_map["a"], community_map["b"])
+        self.assertEqual(community_map["d"], community_map["f"])
+        self.assertNotEqual(community_map["a"], community_map["d"])
+        self.assertNotIn(community_map["iso"], {community_map["a"], community_map["d"]})
+        self.assertEqual(set(palette), set(community_map.values()))
+
+    def test_prune_keeps_column_maximum_and_caps_entries(self) -> None:
+        from network.community import _mcl_normalize_prune
+
+        block = sp.csc_array(np.array([[0.0005, 0.5], [0.0004, 0.3], [0.0001, 0.2]]))
+        data, rows, cols = _mcl_normalize_prune(block, 0.6, 2)
+        # Column 0 is normalised to [0.5, 0.4, 0.1]: only its maximum clears the threshold.
+        # Column 1 has no entry above 0.6 either, so again only the maximum survives.
+        self.assertEqual(sorted(zip(cols.tolist(), rows.tolist(), strict=True)), [(0, 0), (1, 0)])
+        data, rows, cols = _mcl_normalize_prune(block, 0.0, 2)
+        self.assertEqual(sorted(zip(cols.tolist(), rows.tolist(), strict=True)), [(0, 0), (0, 1), (1, 0), (1, 1)])
+        np.testing.assert_allclose(sorted(data.tolist()), [0.3, 0.4, 0.5, 0.5])
+
+    def test_sparse_mcl_matches_dense_reference(self) -> None:
+        from network.community import _mcl
+
+        graph = nx.gnp_random_graph(60, 0.06, seed=1, directed=True)
+        matrix = nx.to_numpy_array(graph, nodelist=range(60))
+        # Dense MCL with the same defaults: self-loops, expansion 2, prune at 0.001 keeping the column max.
+        dense = matrix.copy()
+        np.fill_diagonal(dense, 1.0)
+        dense /= dense.sum(axis=0)
+        for _ in range(100):
+            last = dense
+            dense = np.linalg.matrix_power(dense, 2) ** 2.0
+            dense /= dense.sum(axis=0)
+            pruned = np.where(dense >= 0.001, dense, 0.0)
+            top = dense.argmax(axis=0)
+            pruned[top, np.arange(60)] = dense[top, np.arange(60)]
+            dense = pruned
+            if np.allclose(dense, last):
+                break
+        expected = sorted({tuple(np.flatnonzero(dense[a]).tolist()) for a in np.flatnonzero(np.diag(dense))})
+        self.assertEqual(_mcl(sp.csr_array(matrix), 2.0), expected)
+
+
 # ---------------------------------------------------------------------------
 # community.py — detect() dispatcher
 # ---------------------------------------------------------------------------
@@ -1634,6 +2164,34 @@ class ComputeBetweennessTests(TestCase):
         self.assertGreater(result["b"], result["a"])
         self.assertGreater(result["b"], result["c"])
 
+    def test_samples_at_or_above_node_count_is_exact(self) -> None:
+        self.assertEqual(compute_betweenness(self.graph, samples=3), compute_betweenness(self.graph))
+
+    def test_sampled_estimate_is_reproducible_and_within_bound(self) -> None:
+        from network.measures import betweenness_error_bound
+
+        graph = nx.gnp_random_graph(60, 0.08, seed=3, directed=True)
+        exact = compute_betweenness(graph)
+        sampled = compute_betweenness(graph, samples=30)
+        self.assertEqual(sampled, compute_betweenness(graph, samples=30))
+        bound = betweenness_error_bound(60, 30)
+        self.assertLess(max(abs(sampled[v] - exact[v]) for v in graph), bound)
+
+    def test_error_bound_shrinks_with_samples_and_vanishes_when_exact(self) -> None:
+        from network.measures import betweenness_error_bound
+
+        self.assertGreater(betweenness_error_bound(1000, 50), betweenness_error_bound(1000, 200))
+        self.assertEqual(betweenness_error_bound(1000, 1000), 0.0)
+
+    def test_sampling_report(self) -> None:
+        from network.measures import betweenness_sampling_report
+
+        self.assertIsNone(betweenness_sampling_report(100, 0))
+        self.assertIsNone(betweenness_sampling_report(100, 100))
+        report = betweenness_sampling_report(100, 20)
+        self.assertEqual((report["samples"], report["nodes"], report["confidence"]), (20, 100, 0.9))
+        self.assertGreater(report["error_bound"], 0.0)
+
 
 class ApplyBetweennessTests(TestCase):
     def setUp(self) -> None:
@@ -2035,6 +2593,78 @@ class ApplySpreadingEfficiencyTests(TestCase):
             self.assertGreaterEqual(node["spreading_efficiency"], 0.0)
             self.assertLessEqual(node["spreading_efficiency"], 1.0)
 
+    def test_certain_transmission_reaches_all_descendants(self) -> None:
+        # Weight 1 edges always transmit before the seed can recover
+        apply_spreading_efficiency(self.graph_data, self.graph, runs=10)
+        values = {node["id"]: node["spreading_efficiency"] for node in self.graph_data["nodes"]}
+        self.assertEqual(values, {"1": 1.0, "2": 0.5, "3": 0.0})
+
+    def test_same_seed_reproduces_results(self) -> None:
+        graph = nx.gnp_random_graph(40, 0.1, seed=5, directed=True)
+        nx.set_edge_attributes(graph, 0.4, "weight")
+        first: dict = {"nodes": [{"id": n} for n in graph.nodes()]}
+        second: dict = {"nodes": [{"id": n} for n in graph.nodes()]}
+        apply_spreading_efficiency(first, graph, runs=20)
+        apply_spreading_efficiency(second, graph, runs=20)
+        self.assertEqual(first, second)
+
+
+class SIRNetworkTests(TestCase):
+    def test_run_marks_each_infected_pair_once(self) -> None:
+        from network.measures._spreading import SIRNetwork
+
+        graph = nx.gnp_random_graph(30, 0.2, seed=2, directed=True)
+        nx.set_edge_attributes(graph, 0.5, "weight")
+        network = SIRNetwork.from_graph(graph)
+        reached = network.run(network.index[0], 25, np.random.default_rng(0))
+        self.assertEqual(len(reached), len(set(reached.tolist())))
+        # Every run contains its seed
+        self.assertEqual(set((reached[reached % 30 == network.index[0]] // 30).tolist()), set(range(25)))
+
+    def test_zero_weight_edges_never_transmit(self) -> None:
+        from network.measures._spreading import SIRNetwork
+
+        network = SIRNetwork.from_adjacency({1: [(2, 0.0)], 2: [(3, 1.0)]}, {1, 2, 3})
+        counts = network.infection_counts(network.index[1], 50, np.random.default_rng(0))
+        self.assertEqual(counts.tolist(), [50, 0, 0])
+
+    def test_from_adjacency_drops_edges_outside_nodes(self) -> None:
+        from network.measures._spreading import SIRNetwork
+
+        network = SIRNetwork.from_adjacency({10: [(20, 2.0), (99, 1.0)], 99: [(10, 1.0)]}, [20, 10])
+        self.assertEqual(network.node_ids, [10, 20])
+        self.assertEqual(network.out_ptr.tolist(), [0, 1, 1])
+        self.assertEqual(network.prob.tolist(), [1.0])
+
+    def test_scores_do_not_depend_on_jobs(self) -> None:
+        from network.measures._spreading import spreading_scores
+
+        graph = nx.gnp_random_graph(25, 0.15, seed=4, directed=True)
+        nx.set_edge_attributes(graph, 0.5, "weight")
+        serial = spreading_scores(graph, 30, seed=7)
+        self.assertEqual(spreading_scores(graph, 30, seed=7, jobs=3), serial)
+        self.assertNotEqual(spreading_scores(graph, 30, seed=8), serial)
+
+    def test_node_value_depends_only_on_its_own_stream(self) -> None:
+        from network.measures._spreading import SIRNetwork, spreading_scores
+
+        graph = nx.gnp_random_graph(20, 0.2, seed=9, directed=True)
+        nx.set_edge_attributes(graph, 0.5, "weight")
+        scores = spreading_scores(graph, 15, seed=3)
+        network = SIRNetwork.from_graph(graph)
+        stream = np.random.SeedSequence(3).spawn(20)[5]
+        size = network.mean_outbreak(network.index[5], 15, np.random.default_rng(stream))
+        self.assertEqual(scores[5], (size - 1) / 19)
+
+    def test_majority_reach_uses_channel_pks(self) -> None:
+        from network.measures._spreading import SIRNetwork
+        from network.vacancy_analysis import _majority_reach
+
+        network = SIRNetwork.from_adjacency({1: [(2, 1.0)], 2: [(3, 1.0)], 3: []}, {1, 2, 3, 4})
+        rng = np.random.default_rng(0)
+        self.assertEqual(_majority_reach(network, 1, 20, rng), frozenset({2, 3}))
+        self.assertEqual(_majority_reach(network, 5, 20, rng), frozenset())
+
 
 # ---------------------------------------------------------------------------
 # measures/_content.py — apply_amplification_factor
@@ -2460,6 +3090,24 @@ class AttackCurveTests(TestCase):
         curve = attack_curve(g, ["L1", "L2", "L3", "L4", "C"], "WCC")
         self.assertEqual(curve, [1.0, 0.8, 0.6, 0.4, 0.2, 0.0])
 
+    def test_wcc_curve_matches_recomputing_components_after_each_removal(self) -> None:
+        # Reverse percolation must reproduce the step-by-step definition exactly,
+        # including self-loops, repeated and unknown nodes, and partial orders.
+        from network.robustness import attack_curve
+
+        rng = np.random.default_rng(3)
+        for trial in range(20):
+            g = nx.gnp_random_graph(30, 0.06, seed=trial, directed=True)
+            g.add_edge(0, 0)
+            order = [*rng.permutation(30)[:25].tolist(), 7, "missing"]
+            residual, expected = g.copy(), []
+            for nid in [None, *order]:
+                if nid is not None and residual.has_node(nid):
+                    residual.remove_node(nid)
+                sizes = [len(c) for c in nx.weakly_connected_components(residual)]
+                expected.append(max(sizes, default=0) / 30)
+            self.assertEqual(attack_curve(g, order, "WCC"), expected)
+
     def test_scc_curve_on_directed_cycle(self) -> None:
         # A → B → C → A: one SCC of size 3, then only singletons after any removal.
         from network.robustness import attack_curve
@@ -2592,6 +3240,60 @@ class RIndexAndThresholdTests(TestCase):
         self.assertIsNone(critical_threshold([0.0], 0.05))
 
 
+class AdaptiveAttackCurveTests(TestCase):
+    def _graph(self) -> nx.DiGraph:
+        return nx.gnp_random_graph(300, 0.012, seed=3, directed=True)
+
+    def test_scc_band_contains_exact_curve(self) -> None:
+        from network.robustness import adaptive_attack_curve, attack_curve
+
+        g = self._graph()
+        order = sorted(g.nodes(), key=lambda n: -g.degree(n))
+        exact = attack_curve(g, order, "SCC")
+        estimate = adaptive_attack_curve(g, order, "SCC", tolerance=0.01)
+        self.assertEqual(len(estimate.curve), len(exact))
+        for s, lo, hi in zip(exact, estimate.lower, estimate.upper, strict=True):
+            self.assertLessEqual(lo - 1e-12, s)
+            self.assertLessEqual(s, hi + 1e-12)
+
+    def test_r_error_within_tolerance_and_bounds_exact_value(self) -> None:
+        from network.robustness import adaptive_attack_curve, attack_curve, r_index, r_index_error
+
+        g = self._graph()
+        order = list(g.nodes())
+        exact = r_index(attack_curve(g, order, "SCC"))
+        estimate = adaptive_attack_curve(g, order, "SCC", tolerance=0.01)
+        error = r_index_error(estimate)
+        self.assertLessEqual(error, 0.01)
+        self.assertLessEqual(abs(r_index(estimate.curve) - exact), error + 1e-12)
+
+    def test_critical_threshold_error_bounds_exact_value(self) -> None:
+        from network.robustness import (
+            adaptive_attack_curve,
+            attack_curve,
+            critical_threshold,
+            critical_threshold_error,
+        )
+
+        g = self._graph()
+        order = list(g.nodes())
+        exact = critical_threshold(attack_curve(g, order, "SCC"), 0.05)
+        estimate = adaptive_attack_curve(g, order, "SCC", tolerance=0.01)
+        error = critical_threshold_error(estimate, 0.05)
+        self.assertIsNotNone(error)
+        self.assertLessEqual(abs(critical_threshold(estimate.curve, 0.05) - exact), error + 1e-12)
+
+    def test_zero_tolerance_returns_exact_curve(self) -> None:
+        from network.robustness import adaptive_attack_curve, attack_curve, r_index_error
+
+        g = nx.gnp_random_graph(40, 0.1, seed=1, directed=True)
+        order = list(g.nodes())
+        estimate = adaptive_attack_curve(g, order, "REACH", tolerance=0.0, reach_sample=None)
+        self.assertEqual(estimate.curve, attack_curve(g, order, "REACH", reach_sample=None))
+        self.assertEqual(estimate.lower, estimate.upper)
+        self.assertEqual(r_index_error(estimate), 0.0)
+
+
 class WeightedGlobalEfficiencyTests(TestCase):
     def test_returns_zero_for_acyclic_graph(self) -> None:
         # A → B has no two-node SCC, so efficiency is 0.
@@ -2653,6 +3355,16 @@ class RemovalOrderTests(TestCase):
         # The default set is the original 5 (preserves backwards-compatible behaviour)
         self.assertEqual(DEFAULT_STRATEGIES, ["random", "in_strength", "out_strength", "pagerank", "betweenness"])
 
+    def test_sampled_betweenness_order_is_deterministic(self) -> None:
+        from network.robustness import removal_order
+
+        g = nx.gnp_random_graph(30, 0.15, seed=7, directed=True)
+        for strategy in ("betweenness", "betweenness_dyn"):
+            with self.subTest(strategy=strategy):
+                o1 = removal_order(g, strategy, betweenness_samples=10)
+                self.assertEqual(sorted(o1), sorted(g.nodes()))
+                self.assertEqual(o1, removal_order(g, strategy, betweenness_samples=10))
+
     def test_random_returns_permutation_of_nodes(self) -> None:
         from network.robustness import removal_order
 
@@ -2809,6 +3521,66 @@ class RemovalOrderTests(TestCase):
                 order = removal_order(g, strat)
                 self.assertEqual(sorted(order), sorted(g.nodes()))
 
+    def test_warm_started_dynamic_orders_match_networkx_reranking(self) -> None:
+        from network.robustness.attacks import STRATEGY_SPECS, removal_order
+
+        g = nx.gnp_random_graph(25, 0.15, seed=42, directed=True)
+        rng = np.random.default_rng(42)
+        for u, v in g.edges():
+            g.edges[u, v]["weight"] = float(rng.uniform(0.5, 5.0))
+        for strat in (
+            "in_strength_dyn",
+            "out_strength_dyn",
+            "pagerank_dyn",
+            "katz_dyn",
+            "hits_hub_dyn",
+            "hits_authority_dyn",
+        ):
+            with self.subTest(strategy=strat):
+                score_fn = STRATEGY_SPECS[strat].score_fn
+                residual, expected = g.copy(), []
+                while residual.number_of_nodes():
+                    scores = score_fn(residual)
+                    expected.append(min(residual.nodes(), key=lambda n, s=scores: (-s.get(n, 0.0), n)))
+                    residual.remove_node(expected[-1])
+                self.assertEqual(removal_order(g, strat), expected)
+
+    def test_ranking_from_a_weight_shuffled_view_matches_its_graph(self) -> None:
+        from network import core
+        from network.robustness import ranks_from_view, removal_order, rewired_graph, rewired_view
+
+        g = nx.gnp_random_graph(25, 0.15, seed=42, directed=True)
+        rng = np.random.default_rng(42)
+        for u, v in g.edges():
+            g.edges[u, v]["weight"] = float(rng.uniform(0.5, 5.0))
+        view = rewired_view(core.csr_view(g), rng=rng)
+        null_graph = rewired_graph(g, view)
+        for strat in ("in_strength", "out_strength", "pagerank", "katz", "hits_hub", "hits_authority", "pagerank_dyn"):
+            with self.subTest(strategy=strat):
+                self.assertTrue(ranks_from_view(strat))
+                self.assertEqual(removal_order(g, strat, view=view), removal_order(null_graph, strat))
+        self.assertFalse(ranks_from_view("betweenness"))
+        with self.assertRaises(ValueError):
+            removal_order(g, "betweenness", view=view)
+
+    def test_dyn_batch_covering_the_graph_gives_the_static_order(self) -> None:
+        from network.robustness import removal_order
+
+        g = nx.gnp_random_graph(12, 0.3, seed=42, directed=True)
+        for strat in ("pagerank", "betweenness", "hits_authority"):
+            with self.subTest(strategy=strat):
+                static = removal_order(g, strat)
+                self.assertEqual(removal_order(g, f"{strat}_dyn", dyn_batch=12), static)
+                # A fraction of the channels: 0.5 → the top 6 of the first ranking go first.
+                self.assertEqual(removal_order(g, f"{strat}_dyn", dyn_batch=0.5)[:6], static[:6])
+
+    def test_dyn_batch_must_be_positive(self) -> None:
+        from network.robustness import removal_order
+
+        g = nx.gnp_random_graph(5, 0.5, seed=42, directed=True)
+        with self.assertRaises(ValueError):
+            removal_order(g, "pagerank_dyn", dyn_batch=0)
+
     def test_burt_constraint_sorts_ascending(self) -> None:
         # A bridge node between two cliques has low constraint (~0); clique-internal
         # nodes have higher constraint.  Ascending sort puts the bridge first.
@@ -2953,6 +3725,129 @@ class RewireWeightsTests(TestCase):
         self.assertEqual(h2.number_of_nodes(), 0)
 
 
+class RewiredViewTests(TestCase):
+    def _view(self) -> Any:
+        from network import core
+
+        g = nx.gnp_random_graph(30, 0.15, seed=42, directed=True)
+        rng = np.random.default_rng(42)
+        for u, v in g.edges():
+            g.edges[u, v]["weight"] = float(rng.uniform(0.5, 5.0))
+        return core.csr_view(g)
+
+    def test_shares_edge_index_and_permutes_weights(self) -> None:
+        from network.robustness import rewired_view
+
+        view = self._view()
+        null = rewired_view(view, rng=np.random.default_rng(0))
+        self.assertIs(null.out_ptr, view.out_ptr)
+        self.assertIs(null.out_idx, view.out_idx)
+        self.assertEqual(sorted(null.weight.tolist()), sorted(view.weight.tolist()))
+        self.assertGreater(int((null.weight != view.weight).sum()), view.m // 2)
+
+    def test_reproducible_and_leaves_input_unchanged(self) -> None:
+        from network.robustness import rewired_view
+
+        view = self._view()
+        before = view.weight.copy()
+        w1 = rewired_view(view, rng=np.random.default_rng(7)).weight
+        w2 = rewired_view(view, rng=np.random.default_rng(7)).weight
+        np.testing.assert_array_equal(w1, w2)
+        np.testing.assert_array_equal(view.weight, before)
+
+    def test_n_swaps_zero_keeps_weights(self) -> None:
+        from network.robustness import rewired_view
+
+        view = self._view()
+        null = rewired_view(view, n_swaps=0, rng=np.random.default_rng(0))
+        np.testing.assert_array_equal(null.weight, view.weight)
+
+    def test_rewired_graph_carries_view_weights(self) -> None:
+        from network import core
+        from network.robustness import rewired_graph, rewired_view
+
+        g = nx.gnp_random_graph(30, 0.15, seed=42, directed=True)
+        nx.set_edge_attributes(g, {e: float(k) for k, e in enumerate(g.edges())}, "weight")
+        null = rewired_view(core.csr_view(g), rng=np.random.default_rng(0))
+        h = rewired_graph(g, null)
+        self.assertEqual(list(h.edges()), list(g.edges()))
+        expected = core.CSRGraph.from_networkx(h)
+        np.testing.assert_array_equal(expected.weight, null.weight)
+        self.assertEqual(g.edges[next(iter(g.edges()))]["weight"], 0.0)
+
+
+class StrengthViewTests(TestCase):
+    def _view(self, n: int = 60, p: float = 0.1) -> Any:
+        from network import core
+
+        g = nx.gnp_random_graph(n, p, seed=42, directed=True)
+        rng = np.random.default_rng(42)
+        for u, v in g.edges():
+            g.edges[u, v]["weight"] = float(rng.lognormal(0.0, 1.0))
+        return core.csr_view(g)
+
+    def test_preserves_degrees_and_weight_multiset(self) -> None:
+        from network.robustness import strength_view
+
+        view = self._view()
+        null = strength_view(view, rng=np.random.default_rng(0))
+        np.testing.assert_array_equal(null.out_degree(), view.out_degree())
+        np.testing.assert_array_equal(null.in_degree(), view.in_degree())
+        self.assertEqual(sorted(null.weight.tolist()), sorted(view.weight.tolist()))
+        self.assertEqual(null.node_ids, view.node_ids)
+
+    def test_result_is_a_simple_rewired_graph(self) -> None:
+        from network.robustness import strength_view
+
+        view = self._view()
+        null = strength_view(view, rng=np.random.default_rng(0))
+        src = null.edge_sources
+        self.assertFalse(np.any(src == null.out_idx))
+        pairs = set(zip(src.tolist(), null.out_idx.tolist(), strict=True))
+        self.assertEqual(len(pairs), null.m)
+        original = set(zip(view.edge_sources.tolist(), view.out_idx.tolist(), strict=True))
+        self.assertGreater(len(pairs - original), view.m // 2)
+
+    def test_strengths_closer_than_weight_shuffling(self) -> None:
+        from network.robustness import rewired_view, strength_view
+
+        view = self._view(n=200, p=0.05)
+        observed = np.bincount(view.edge_sources, view.weight, minlength=view.n)
+
+        def error(null: Any) -> float:
+            out = np.bincount(null.edge_sources, null.weight, minlength=null.n)
+            return float(np.abs(out - observed).sum())
+
+        rng = np.random.default_rng(0)
+        self.assertLess(error(strength_view(view, rng=rng)), error(rewired_view(view, rng=rng)))
+
+    def test_reproducible_and_dispatched_by_null_view(self) -> None:
+        from network.robustness import null_view, strength_view
+
+        view = self._view()
+        a = strength_view(view, rng=np.random.default_rng(3))
+        b = null_view(view, "STRENGTH", rng=np.random.default_rng(3))
+        np.testing.assert_array_equal(a.out_idx, b.out_idx)
+        np.testing.assert_array_equal(a.weight, b.weight)
+        with self.assertRaises(ValueError):
+            null_view(view, "CONFIGURATION", rng=np.random.default_rng(0))
+
+    def test_rewired_graph_follows_rewired_topology(self) -> None:
+        from network import core
+        from network.robustness import rewired_graph, strength_view
+
+        g = nx.gnp_random_graph(30, 0.15, seed=42, directed=True)
+        nx.set_edge_attributes(g, {e: float(k + 1) for k, e in enumerate(g.edges())}, "weight")
+        g.nodes[0]["label"] = "zero"
+        null = strength_view(core.csr_view(g), rng=np.random.default_rng(0))
+        h = rewired_graph(g, null)
+        self.assertEqual(list(h.nodes()), list(g.nodes()))
+        self.assertEqual(h.nodes[0]["label"], "zero")
+        rebuilt = core.CSRGraph.from_networkx(h)
+        np.testing.assert_array_equal(rebuilt.out_idx, null.out_idx)
+        np.testing.assert_array_equal(rebuilt.weight, null.weight)
+
+
 class NullDistributionTests(TestCase):
     def test_yields_requested_number_of_graphs(self) -> None:
         from network.robustness import null_distribution
@@ -3197,6 +4092,16 @@ class RobustnessRunnerTests(TestCase):
             RobustnessConfig(alpha=1.5)
         with self.assertRaises(ValueError):
             RobustnessConfig(reach_sample=0)
+        with self.assertRaises(ValueError):
+            RobustnessConfig(betweenness_samples=0)
+        with self.assertRaises(ValueError):
+            RobustnessConfig(curve_tolerance=1.0)
+        with self.assertRaises(ValueError):
+            RobustnessConfig(null_model="CONFIGURATION")
+        with self.assertRaises(ValueError):
+            RobustnessConfig(dyn_batch=0)
+        with self.assertRaises(ValueError):
+            RobustnessConfig(dyn_batch=2.5)
 
     def test_config_rejects_empty_strategies_list(self) -> None:
         from network.robustness import RobustnessConfig
@@ -3254,6 +4159,25 @@ class RobustnessRunnerTests(TestCase):
                 self.assertIn(f"fc_{m}", payload)
             self.assertIsNone(payload["null"])  # n_null=0
 
+    def test_exact_curves_report_zero_error(self) -> None:
+        from network.robustness import run_robustness
+
+        out = run_robustness(self._toy_graph(), config=self._fast_cfg(strategies=["in_strength"]))
+        self.assertEqual(out["config"]["curve_tolerance"], 0.0)
+        payload = out["strategies"]["in_strength"]
+        for m in ("wcc", "scc", "reach"):
+            self.assertEqual(payload[f"r_{m}_error"], 0.0)
+
+    def test_curve_tolerance_reports_errors_within_tolerance(self) -> None:
+        from network.robustness import run_robustness
+
+        g = nx.gnp_random_graph(200, 0.02, seed=5, directed=True)
+        out = run_robustness(g, config=self._fast_cfg(strategies=["in_strength"], curve_tolerance=0.02))
+        payload = out["strategies"]["in_strength"]
+        self.assertEqual(len(payload["curve_scc"]), out["graph"]["backbone_n"] + 1)
+        for m in ("scc", "reach"):
+            self.assertLessEqual(payload[f"r_{m}_error"], 0.02)
+
     def test_curve_length_matches_backbone_node_count_plus_one(self) -> None:
         from network.robustness import run_robustness
 
@@ -3376,6 +4300,35 @@ class RobustnessRunnerTests(TestCase):
                     out2["strategies"][s]["null"][f"r_{m}"]["z"],
                 )
 
+    def test_payload_does_not_depend_on_jobs(self) -> None:
+        from network.robustness import run_robustness
+
+        g = self._toy_graph(n=15)
+        partitions = {"hand": {n: n % 3 for n in g.nodes()}}
+        cfg = self._fast_cfg(n_null=2, strategies=["random", "pagerank", "bridging(hand)"])
+        serial = run_robustness(g, partitions=partitions, config=cfg)
+        self.assertEqual(run_robustness(g, partitions=partitions, config=cfg, jobs=3), serial)
+
+    def test_dyn_batch_recorded_and_applied(self) -> None:
+        from network.robustness import attack_curve, removal_order, run_robustness
+
+        g = self._toy_graph()
+        out = run_robustness(g, config=self._fast_cfg(strategies=["pagerank_dyn"], dyn_batch=0.25))
+        self.assertEqual(out["config"]["dyn_batch"], 0.25)
+        order = removal_order(g, "pagerank_dyn", dyn_batch=0.25)
+        self.assertEqual(out["strategies"]["pagerank_dyn"]["curve_wcc"], attack_curve(g, order, "WCC"))
+
+    def test_strength_null_model_runs_and_does_not_depend_on_jobs(self) -> None:
+        from network.robustness import run_robustness
+
+        g = self._toy_graph(n=15)
+        cfg = self._fast_cfg(n_null=2, null_model="STRENGTH", strategies=["random", "pagerank", "harmonic"])
+        serial = run_robustness(g, config=cfg)
+        self.assertEqual(serial["config"]["null_model"], "STRENGTH")
+        # Harmonic only reads the topology, which this null rewires: its null R values differ.
+        self.assertGreater(serial["strategies"]["harmonic"]["null"]["r_wcc"]["std"], 0.0)
+        self.assertEqual(run_robustness(g, config=cfg, jobs=3), serial)
+
     # -- progress callback ----------------------------------------------------
 
     def test_progress_callback_receives_expected_labels(self) -> None:
@@ -3591,3 +4544,432 @@ class ResolveIterationsTests(TestCase):
         from network.layout import resolve_iterations
 
         self.assertEqual(resolve_iterations("3X", num_nodes=200), 600)
+
+
+# ---------------------------------------------------------------------------
+# network.parallel.ordered_map
+# ---------------------------------------------------------------------------
+
+
+def _power_with_pid(base: int, exponent: int) -> tuple[int, int]:
+    return base**exponent, os.getpid()
+
+
+class OrderedMapTests(TestCase):
+    """Results come back in submission order whatever the worker count."""
+
+    def test_serial_runs_inline(self) -> None:
+        from network.parallel import ordered_map
+
+        results = list(ordered_map(_power_with_pid, [(2, 3), (3, 2)], jobs=1))
+        self.assertEqual([value for value, _ in results], [8, 9])
+        self.assertTrue(all(pid == os.getpid() for _, pid in results))
+
+    def test_pool_preserves_submission_order(self) -> None:
+        from network.parallel import ordered_map
+
+        tasks = [(n, 2) for n in range(12)]
+        results = list(ordered_map(_power_with_pid, tasks, jobs=3))
+        self.assertEqual([value for value, _ in results], [n * n for n in range(12)])
+        self.assertTrue(all(pid != os.getpid() for _, pid in results))
+
+    def test_empty_task_list(self) -> None:
+        from network.parallel import ordered_map
+
+        self.assertEqual(list(ordered_map(_power_with_pid, [], jobs=4)), [])
+
+    def test_year_worker_returns_buffered_output(self) -> None:
+        from network.management.commands.structural_analysis import Command, _run_year_export_in_worker
+
+        def fake_export(self: Any, year: int, root_target: str, options: dict, *args: Any, **kwargs: Any) -> dict:
+            self.stdout.write(f"  {year} … done")
+            return {"year": year, "edge_counts": kwargs["edge_counts"]}
+
+        with patch.object(Command, "_run_year_export", fake_export):
+            entry, output = _run_year_export_in_worker(2021, "/tmp/x", {}, (), {"MESSAGES": {1: 3}}, {})
+        self.assertEqual(entry, {"year": 2021, "edge_counts": {"MESSAGES": {1: 3}}})
+        self.assertIn("2021 … done", output)
+
+
+# ---------------------------------------------------------------------------
+# network.measures.run_measure_steps / structural_analysis._compute_measures
+# ---------------------------------------------------------------------------
+
+
+class RunMeasureStepsTests(TestCase):
+    """Scheduled measures match direct application and keep a fixed order."""
+
+    def setUp(self) -> None:
+        self.graph = nx.DiGraph()
+        self.graph.add_weighted_edges_from(
+            [
+                ("a", "b", 0.5),
+                ("b", "a", 0.3),
+                ("b", "bridge", 0.4),
+                ("bridge", "c", 0.6),
+                ("c", "d", 0.2),
+                ("d", "c", 0.9),
+            ]
+        )
+        for node_id, comm in [("a", "X"), ("b", "X"), ("bridge", "Y"), ("c", "Y"), ("d", "Y")]:
+            self.graph.nodes[node_id]["data"] = {"communities": {"louvain": comm}}
+
+    def _graph_data(self) -> dict:
+        return {"nodes": [{"id": n} for n in ["a", "b", "bridge", "c", "d"]], "edges": []}
+
+    def test_matches_direct_application(self) -> None:
+        from network import measures as network_measures
+        from network.measures import merge_node_values, run_measure_steps
+
+        steps = [
+            ("apply_pagerank", {}),
+            ("apply_betweenness_centrality", {}),
+            ("apply_spreading_efficiency", {"runs": 5}),
+        ]
+        expected = self._graph_data()
+        expected_labels = []
+        for fn_name, kwargs in steps:
+            expected_labels += getattr(network_measures, fn_name)(expected, self.graph, **kwargs)
+
+        for jobs in (1, 2):
+            graph_data = self._graph_data()
+            labels = []
+            for step_labels, values in run_measure_steps(self.graph, graph_data, steps, jobs):
+                merge_node_values(graph_data, values)
+                labels += step_labels
+            self.assertEqual(labels, expected_labels)
+            self.assertEqual(graph_data, expected)
+
+    def _compute(
+        self, selected: set[str], bridging_token: str | None, jobs: int, result_cache: Any = None
+    ) -> tuple[list, dict, str]:
+        from io import StringIO
+
+        from network.management.commands.structural_analysis import Command
+
+        graph_data = self._graph_data()
+        out = StringIO()
+        with (
+            patch(f"{_EXPORT_CMD}.exporter.find_main_component", return_value=set(self.graph)),
+            patch(f"{_EXPORT_CMD}.measures.apply_base_node_measures", return_value=[]),
+        ):
+            labels = Command(stdout=out)._compute_measures(
+                self.graph,
+                graph_data,
+                {},
+                selected,
+                bridging_token,
+                None,
+                None,
+                False,
+                False,
+                5,
+                30,
+                jobs,
+                result_cache=result_cache,
+            )
+        return labels, graph_data, out.getvalue()
+
+    def test_betweenness_computed_once_for_bridging(self) -> None:
+        from network.measures import _centrality
+
+        with patch.object(_centrality, "compute_betweenness", wraps=_centrality.compute_betweenness) as spy:
+            labels, graph_data, _out = self._compute({"BETWEENNESS", "PAGERANK"}, "BRIDGING(LOUVAIN)", jobs=1)
+        spy.assert_called_once()
+        self.assertEqual([k for k, _ in labels], ["pagerank", "betweenness", "bridging_centrality"])
+        node_map = {n["id"]: n for n in graph_data["nodes"]}
+        self.assertGreater(node_map["bridge"]["bridging_centrality"], node_map["a"]["bridging_centrality"])
+
+    def test_bridging_alone_does_not_export_betweenness(self) -> None:
+        labels, graph_data, _out = self._compute({"PAGERANK"}, "BRIDGING(LOUVAIN)", jobs=1)
+        self.assertEqual([k for k, _ in labels], ["pagerank", "bridging_centrality"])
+        self.assertTrue(all("betweenness" not in node for node in graph_data["nodes"]))
+
+    def test_output_independent_of_jobs(self) -> None:
+        # HITS is left out: its SVD starts from a random vector, so it is not bit-stable even serially.
+        selected = {"PAGERANK", "BETWEENNESS", "HARMONICCENTRALITY", "SPREADING", "BURTCONSTRAINT"}
+        serial = self._compute(selected, "BRIDGING(LOUVAIN)", jobs=1)
+        pooled = self._compute(selected, "BRIDGING(LOUVAIN)", jobs=3)
+        self.assertEqual(serial, pooled)
+        self.assertEqual(
+            [k for k, _ in serial[0]],
+            [
+                "pagerank",
+                "betweenness",
+                "harmonic_centrality",
+                "burt_constraint",
+                "spreading_efficiency",
+                "bridging_centrality",
+            ],
+        )
+
+    def test_spreading_starts_after_measure_pool_is_drained(self) -> None:
+        from network import measures as network_measures
+
+        run_measure_steps = network_measures.run_measure_steps
+        open_batches: list[list[str]] = []
+        overlapping: list[list[str]] = []
+
+        def tracked(graph, graph_data, steps, jobs=1):
+            names = [fn for fn, _kwargs in steps]
+            overlapping.extend(open_batches)
+            open_batches.append(names)
+            yield from run_measure_steps(graph, graph_data, steps, jobs)
+            open_batches.remove(names)
+
+        with patch(f"{_EXPORT_CMD}.measures.run_measure_steps", side_effect=tracked):
+            labels, _graph_data, _out = self._compute({"PAGERANK", "SPREADING", "HITSHUB"}, None, jobs=2)
+        self.assertEqual(overlapping, [])
+        self.assertEqual([k for k, _ in labels], ["pagerank", "spreading_efficiency", "hits_hub"])
+
+    def test_rerun_reads_graph_measures_from_cache(self) -> None:
+        from network.cache import ResultCache
+        from network.measures import _centrality
+
+        selected = {"PAGERANK", "BETWEENNESS", "SPREADING"}
+        with tempfile.TemporaryDirectory() as tmp:
+            first = self._compute(selected, "BRIDGING(LOUVAIN)", 1, ResultCache.for_graph(self.graph, tmp, 10))
+            with patch.object(_centrality, "compute_betweenness") as spy:
+                second = self._compute(selected, "BRIDGING(LOUVAIN)", 1, ResultCache.for_graph(self.graph, tmp, 10))
+        spy.assert_not_called()
+        self.assertEqual(first[:2], second[:2])
+        self.assertNotIn("cached", first[2])
+        self.assertEqual(second[2].count("cached"), 3)
+
+
+class ComputeCommunitiesCacheTests(TestCase):
+    def setUp(self) -> None:
+        self.graph = nx.DiGraph()
+        self.graph.add_weighted_edges_from([("1", "2", 1.0), ("2", "3", 1.0), ("3", "1", 1.0), ("4", "5", 2.0)])
+        self.options = {
+            "community_palette": "vaporwave",
+            "community_palette_reversed": False,
+            "leiden_coarse_resolution": 0.01,
+            "leiden_fine_resolution": 0.05,
+            "mcl_inflation": 2.0,
+        }
+
+    def _run(self, result_cache: Any, options: dict) -> tuple[dict, str]:
+        from io import StringIO
+
+        from network.management.commands.structural_analysis import Command
+
+        out = StringIO()
+        with (
+            patch(f"{_EXPORT_CMD}.community.apply_to_graph"),
+            patch(f"{_EXPORT_CMD}.community.apply_edge_colors"),
+        ):
+            results = Command(stdout=out)._compute_communities(
+                self.graph, {}, [], ["WEAKCC", "MCL"], options, result_cache
+            )
+        return results, out.getvalue()
+
+    def test_cached_partition_gets_the_current_palette(self) -> None:
+        from network.cache import ResultCache
+
+        with tempfile.TemporaryDirectory() as tmp:
+            first, first_out = self._run(ResultCache.for_graph(self.graph, tmp, 10), self.options)
+            recolored = {**self.options, "community_palette_reversed": True}
+            with patch(f"{_EXPORT_CMD}.community.detect") as detect:
+                second, second_out = self._run(ResultCache.for_graph(self.graph, tmp, 10), recolored)
+            detect.assert_not_called()
+            self.assertNotIn("(cached)", first_out)
+            self.assertEqual(second_out.count("(cached)"), 2)
+            for strategy in ("WEAKCC", "MCL"):
+                self.assertEqual(first[strategy][0], second[strategy][0])
+                expected_palette = build_community_palette(first[strategy][0], "vaporwave", reverse=True)
+                self.assertEqual(second[strategy][1], expected_palette)
+            # A different MCL inflation is a different entry.
+            _, third_out = self._run(ResultCache.for_graph(self.graph, tmp, 10), {**self.options, "mcl_inflation": 3})
+            self.assertEqual(third_out.count("(cached)"), 1)
+
+
+class DetectAllTests(TestCase):
+    def test_partitions_and_order_do_not_depend_on_jobs(self) -> None:
+        from types import SimpleNamespace
+
+        from network.community import detect_all
+
+        graph = nx.relabel_nodes(nx.gnp_random_graph(40, 0.08, seed=11, directed=True), str)
+        nx.set_edge_attributes(graph, 1.5, "weight")
+        organization = SimpleNamespace(color="#112233")
+        channel_dict = {
+            node_id: {"channel": SimpleNamespace(organization_id=1, organization=organization)} for node_id in graph
+        }
+        strategies = ["LEIDEN", "ORGANIZATION", "LOUVAIN", "INFOMAP", "WEAKCC", "MCL", "KCORE"]
+
+        def run(jobs: int) -> list:
+            results = detect_all(strategies, "vaporwave", graph, channel_dict, jobs=jobs, mcl_inflation=2.0)
+            return [(list(cmap.items()), list(palette.items())) for cmap, palette in results]
+
+        serial = run(1)
+        self.assertEqual(len(serial), len(strategies))
+        self.assertEqual(serial[1][0], [(node_id, 1) for node_id in graph])
+        self.assertEqual(run(3), serial)
+
+    def test_unknown_strategy_raises(self) -> None:
+        from network.community import detect_all
+
+        with self.assertRaises(ValueError):
+            list(detect_all(["NOPE"], "vaporwave", nx.DiGraph(), {}))
+
+
+# ---------------------------------------------------------------------------
+# network.cache.ResultCache
+# ---------------------------------------------------------------------------
+
+
+class ResultCacheTests(TestCase):
+    def setUp(self) -> None:
+        self.graph = nx.DiGraph()
+        self.graph.add_weighted_edges_from([("1", "2", 1.0), ("2", "3", 0.5)])
+
+    def test_fingerprint_tracks_edges_weights_and_node_order(self) -> None:
+        from network.cache import graph_fingerprint
+
+        base = graph_fingerprint(self.graph)
+        self.assertEqual(base, graph_fingerprint(self.graph.copy()))
+        reweighted = self.graph.copy()
+        reweighted["2"]["3"]["weight"] = 0.6
+        self.assertNotEqual(base, graph_fingerprint(reweighted))
+        reordered = nx.DiGraph()
+        reordered.add_nodes_from(["3", "2", "1"])
+        reordered.add_weighted_edges_from([("1", "2", 1.0), ("2", "3", 0.5)])
+        self.assertNotEqual(base, graph_fingerprint(reordered))
+
+    def test_round_trip_and_parameter_keys(self) -> None:
+        from network.cache import ResultCache
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ResultCache.for_graph(self.graph, tmp, 1)
+            self.assertIsNone(cache.get("measure", ["apply_pagerank", {}]))
+            cache.put("measure", ["apply_pagerank", {}], {"1": 0.5})
+            self.assertEqual(cache.get("measure", ["apply_pagerank", {}]), {"1": 0.5})
+            self.assertIsNone(cache.get("measure", ["apply_spreading_efficiency", {"runs": 5}]))
+
+    def test_disabled_cache_writes_nothing(self) -> None:
+        from network.cache import ResultCache
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ResultCache.for_graph(self.graph, tmp, 0)
+            cache.put("measure", ["apply_pagerank", {}], {"1": 0.5})
+            self.assertIsNone(cache.get("measure", ["apply_pagerank", {}]))
+            self.assertEqual(os.listdir(tmp), [])
+
+    def test_evicts_least_recently_used_entries_beyond_budget(self) -> None:
+        from network.cache import ResultCache
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ResultCache(tmp, 0, "fp")
+            cache.max_bytes = 10**9
+            blob = b"x" * 4000
+            for i, name in enumerate(("a", "b", "c")):
+                cache.put("measure", name, blob)
+                os.utime(cache._path("measure", name), (1000 + i, 1000 + i))
+            cache.get("measure", "a")  # refreshes "a", leaving "b" least recently used
+            cache.max_bytes = 9000
+            cache.evict()
+            self.assertIsNone(cache.get("measure", "b"))
+            self.assertEqual(cache.get("measure", "a"), blob)
+            self.assertEqual(cache.get("measure", "c"), blob)
+
+    def test_unreadable_entry_is_a_miss(self) -> None:
+        from network.cache import ResultCache
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ResultCache.for_graph(self.graph, tmp, 1)
+            cache._path("measure", "x").write_bytes(b"not a pickle")
+            with self.assertLogs("network.cache", level="WARNING"):
+                self.assertIsNone(cache.get("measure", "x"))
+
+
+class LayoutStoreTests(TestCase):
+    def test_round_trip_keeps_previous_3d_positions(self) -> None:
+        from network.cache import LayoutStore
+
+        with tempfile.TemporaryDirectory() as tmp:
+            store = LayoutStore(tmp)
+            self.assertEqual(store.load("weekly"), (None, None))
+            store.save("weekly", {"1": (1.0, 2.0)}, {"1": (1.0, 2.0, 3.0)})
+            store.save("weekly", {"1": (4.0, 5.0), "2": (6.0, 7.0)}, None)
+            self.assertEqual(store.load("weekly"), ({"1": (4.0, 5.0), "2": (6.0, 7.0)}, {"1": (1.0, 2.0, 3.0)}))
+            self.assertEqual(store.load("other"), (None, None))
+
+    def test_unreadable_layout_is_ignored(self) -> None:
+        from network.cache import LayoutStore
+
+        with tempfile.TemporaryDirectory() as tmp:
+            store = LayoutStore(tmp)
+            store._path("weekly").write_text("{not json")
+            with self.assertLogs("network.cache", level="WARNING"):
+                self.assertEqual(store.load("weekly"), (None, None))
+
+
+# ---------------------------------------------------------------------------
+# network.core.CSRGraph / csr_view
+# ---------------------------------------------------------------------------
+
+
+class CSRGraphTests(TestCase):
+    def setUp(self) -> None:
+        self.graph = nx.DiGraph()
+        self.graph.add_nodes_from(["30", "4", "100", "7"])
+        self.graph.add_weighted_edges_from(
+            [("30", "4", 2.0), ("4", "30", 5.0), ("100", "4", 1.5), ("7", "100", 0.5), ("30", "100", 3.0)]
+        )
+
+    def test_csr_arrays(self) -> None:
+        from network.core import CSRGraph
+
+        view = CSRGraph.from_networkx(self.graph)
+        self.assertEqual(view.node_ids, ["100", "30", "4", "7"])
+        self.assertEqual((view.n, view.m), (4, 5))
+        self.assertEqual(view.out_ptr.tolist(), [0, 1, 3, 4, 5])
+        self.assertEqual(view.out_idx.tolist(), [2, 0, 2, 1, 0])
+        self.assertEqual(view.weight.tolist(), [1.5, 3.0, 2.0, 5.0, 0.5])
+        self.assertEqual(view.predecessors(0).tolist(), [1, 3])
+        self.assertEqual(view.in_degree().tolist(), [2, 1, 2, 0])
+        # in_eid points every in-edge back to its CSR edge id.
+        self.assertTrue(np.array_equal(view.edge_sources[view.in_eid], view.in_idx))
+
+    def test_scipy_adapter_matches_networkx(self) -> None:
+        from network.core import CSRGraph
+
+        view = CSRGraph.from_networkx(self.graph)
+        expected = nx.to_scipy_sparse_array(self.graph, nodelist=view.node_ids, weight="weight").toarray()
+        self.assertTrue(np.array_equal(view.to_scipy().toarray(), expected))
+
+    def test_undirected_igraph_matches_networkx_symmetrisation(self) -> None:
+        from network.core import CSRGraph
+
+        view = CSRGraph.from_networkx(self.graph)
+        ig_graph, weights = view.to_igraph(directed=False)
+        got = {
+            frozenset((view.node_ids[e.source], view.node_ids[e.target])): w
+            for e, w in zip(ig_graph.es, weights, strict=True)
+        }
+        undirected = self.graph.to_undirected()
+        expected = {frozenset((u, v)): d["weight"] for u, v, d in undirected.edges(data=True)}
+        self.assertEqual(got, expected)
+        self.assertFalse(ig_graph.is_directed())
+
+    def test_networkx_round_trip(self) -> None:
+        from network.core import CSRGraph
+
+        rebuilt = CSRGraph.from_networkx(self.graph).to_networkx()
+        self.assertEqual(set(rebuilt.nodes()), set(self.graph.nodes()))
+        self.assertEqual(
+            {(u, v): w for u, v, w in rebuilt.edges(data="weight")},
+            {(u, v): w for u, v, w in self.graph.edges(data="weight")},
+        )
+
+    def test_csr_view_cached_until_topology_changes(self) -> None:
+        from network.core import csr_view
+
+        view = csr_view(self.graph)
+        self.assertIs(csr_view(self.graph), view)
+        self.assertIsNot(csr_view(self.graph.copy()), view)
+        self.graph.add_edge("7", "30", weight=1.0)
+        refreshed = csr_view(self.graph)
+        self.assertIsNot(refreshed, view)
+        self.assertEqual(refreshed.m, 6)
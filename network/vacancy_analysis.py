@@ -10,6 +10,7 @@ from typing import Any, Callable
 
 from django.db.models import Count, Max, Min
 
+from network.measures._spreading import SIRNetwork
 from webapp.models import Channel, ChannelVacancy, Message
 
 import networkx as nx
@@ -37,7 +38,6 @@ MEASURE_LABELS: dict[str, str] = {
     "TEMPORAL": "Temporal Adoption",
 }
 
-_SIR_GAMMA = 0.3
 _SIR_REACH_THRESHOLD = 0.25  # fraction of runs a node must be infected to count as "reached"
 
 
@@ -66,40 +66,6 @@ def _cosine(a: set, b: set) -> float:
 # ── SIR for Cascade Overlap ───────────────────────────────────────────────────
 
 
-def _run_sir_pks(
-    adj: dict[int, list[tuple[int, float]]],
-    all_nodes: set[int],
-    seed: int,
-    rng: np.random.Generator,
-) -> set[int]:
-    """Single SIR run keyed by channel PKs. Returns the set of ever-infected nodes."""
-    susceptible = all_nodes - {seed}
-    infected = {seed}
-    ever: set[int] = {seed}
-
-    while infected:
-        infected_list = list(infected)
-        newly_recovered = {
-            n for n, r in zip(infected_list, rng.random(len(infected_list)) < _SIR_GAMMA, strict=True) if r
-        }
-        newly_infected: set[int] = set()
-        for node in infected_list:
-            neighbors = adj.get(node, [])
-            if not neighbors:
-                continue
-            succs = [s for s, _ in neighbors]
-            weights = np.array([w for _, w in neighbors])
-            hits = rng.random(len(succs)) < weights
-            for succ, hit in zip(succs, hits, strict=True):
-                if hit and succ in susceptible:
-                    newly_infected.add(succ)
-        susceptible -= newly_infected
-        infected = (infected | newly_infected) - newly_recovered
-        ever |= newly_infected
-
-    return ever
-
-
 def _build_spread_adj(
     channel_pks: list[int],
     date_from: datetime.datetime,
@@ -139,21 +105,17 @@ def _build_spread_adj(
 
 
 def _majority_reach(
-    adj: dict[int, list[tuple[int, float]]],
-    all_nodes: set[int],
+    network: SIRNetwork,
     seed: int,
     runs: int,
     rng: np.random.Generator,
 ) -> frozenset[int]:
     """Run SIR `runs` times from seed; return nodes infected in ≥ threshold fraction of runs."""
-    if seed not in all_nodes:
+    if seed not in network.index:
         return frozenset()
-    counts: dict[int, int] = defaultdict(int)
-    for _ in range(runs):
-        for n in _run_sir_pks(adj, all_nodes, seed, rng):
-            counts[n] += 1
+    counts = network.infection_counts(network.index[seed], runs, rng)
     min_count = max(1, int(runs * _SIR_REACH_THRESHOLD))
-    return frozenset(n for n, c in counts.items() if c >= min_count and n != seed)
+    return frozenset(network.node_ids[i] for i in np.flatnonzero(counts >= min_count) if network.node_ids[i] != seed)
 
 
 # ── Per-algorithm scorers ─────────────────────────────────────────────────────
@@ -288,13 +250,14 @@ def _scores_cascade(
     after_channels = [pk for pk in all_channel_pks if pk != vacancy_pk]
     after_adj, after_nodes = _build_spread_adj(after_channels, closure_dt, after_end)
 
-    v_reach = _majority_reach(before_adj, before_nodes, vacancy_pk, sir_runs, rng)
+    v_reach = _majority_reach(SIRNetwork.from_adjacency(before_adj, before_nodes), vacancy_pk, sir_runs, rng)
     if not v_reach:
         return dict.fromkeys(candidate_pks, 0.0)
 
+    after_network = SIRNetwork.from_adjacency(after_adj, after_nodes)
     scores: dict[int, float] = {}
     for cid in candidate_pks:
-        c_reach = _majority_reach(after_adj, after_nodes, cid, sir_runs, rng)
+        c_reach = _majority_reach(after_network, cid, sir_runs, rng)
         intersection = len(v_reach & c_reach)
         union = len(v_reach | c_reach)
         scores[cid] = round(intersection / union, 3) if union else 0.0
@@ -595,7 +595,10 @@ class BuildArgsExportNetworkTests(TestCase):
         # No robustness strategy ticked ⇒ --no-robustness trails; ``community_palette_reversed``
         # is a ``bool_explicit`` spec so an explicit --no-community-palette-reversed slips in
         # whenever the form omits the checkbox.
-        args = _build_args("structural_analysis", FakePost({"export_name": "baseline", "include_mentions": "on"}))
+        args = _build_args(
+            "structural_analysis",
+            FakePost({"export_name": "baseline", "include_mentions": "on", "warm_start_layout": "on"}),
+        )
         self.assertEqual(args, ["--name", "baseline", "--no-community-palette-reversed", "--no-robustness"])
 
     def test_boolean_output_flags(self):
@@ -650,7 +653,15 @@ class BuildArgsExportNetworkTests(TestCase):
     def test_empty_strings_not_added(self):
         # All value-kind fields blank ⇒ only the implicit --no-community-palette-reversed
         # (from the bool_explicit spec) and --no-robustness survive.
-        post = FakePost({"export_name": "", "fa2_iterations": "", "startdate": "", "include_mentions": "on"})
+        post = FakePost(
+            {
+                "export_name": "",
+                "fa2_iterations": "",
+                "startdate": "",
+                "include_mentions": "on",
+                "warm_start_layout": "on",
+            }
+        )
         self.assertEqual(
             _build_args("structural_analysis", post),
             ["--no-community-palette-reversed", "--no-robustness"],
@@ -774,8 +785,11 @@ class BuildArgsStructuralRobustnessTests(TestCase):
                 "robustness_alpha": "0.1",
                 "robustness_runs": "50",
                 "robustness_null": "10",
+                "robustness_null_model": "STRENGTH",
                 "robustness_seed": "7",
                 "robustness_sample": "200",
+                "robustness_curve_tolerance": "0.005",
+                "robustness_dyn_batch": "0.01",
             }
         )
         args = _build_args("structural_analysis", post)
@@ -784,8 +798,11 @@ class BuildArgsStructuralRobustnessTests(TestCase):
             ("--robustness-alpha", "0.1"),
             ("--robustness-runs", "50"),
             ("--robustness-null", "10"),
+            ("--robustness-null-model", "STRENGTH"),
             ("--robustness-seed", "7"),
             ("--robustness-sample", "200"),
+            ("--robustness-curve-tolerance", "0.005"),
+            ("--robustness-dyn-batch", "0.01"),
         ):
             self.assertIn(flag, args)
             self.assertEqual(args[args.index(flag) + 1], value)
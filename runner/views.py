@@ -11,6 +11,7 @@ from django.views import View
 
 from network import (
     community as net_community,
+    layout as net_layout,
     measures as net_measures,
     robustness as net_robustness,
     vacancy_analysis,
@@ -113,8 +114,14 @@ class OperationsView(View):
             "SA_INCLUDE_PRIVATE": settings.SA_INCLUDE_PRIVATE,
             # SA numeric params
             "SA_FA2_ITERATIONS": settings.SA_FA2_ITERATIONS,
+            "SA_LAYOUT_SEED": settings.SA_LAYOUT_SEED,
+            "SA_LAYOUT_ALGORITHM": settings.SA_LAYOUT_ALGORITHM,
             "SA_SPREADING_RUNS": settings.SA_SPREADING_RUNS,
+            "SA_BETWEENNESS_SAMPLES": settings.SA_BETWEENNESS_SAMPLES,
             "SA_DIFFUSION_WINDOW": settings.SA_DIFFUSION_WINDOW,
+            "SA_JOBS": settings.SA_JOBS,
+            "SA_CACHE_SIZE_MB": settings.SA_CACHE_SIZE_MB,
+            "SA_WARM_START_LAYOUT": settings.SA_WARM_START_LAYOUT,
             "SA_LEIDEN_COARSE_RESOLUTION": settings.SA_LEIDEN_COARSE_RESOLUTION,
             "SA_LEIDEN_FINE_RESOLUTION": settings.SA_LEIDEN_FINE_RESOLUTION,
             "SA_MCL_INFLATION": settings.SA_MCL_INFLATION,
@@ -131,6 +138,9 @@ class OperationsView(View):
             "SA_ROBUSTNESS_NULL": settings.SA_ROBUSTNESS_NULL,
             "SA_ROBUSTNESS_SEED": settings.SA_ROBUSTNESS_SEED,
             "SA_ROBUSTNESS_SAMPLE": settings.SA_ROBUSTNESS_SAMPLE,
+            "SA_ROBUSTNESS_CURVE_TOLERANCE": settings.SA_ROBUSTNESS_CURVE_TOLERANCE,
+            "SA_ROBUSTNESS_DYN_BATCH": settings.SA_ROBUSTNESS_DYN_BATCH,
+            "SA_ROBUSTNESS_NULL_MODEL": settings.SA_ROBUSTNESS_NULL_MODEL,
             # SA string params
             "SA_EDGE_WEIGHT_STRATEGY": settings.SA_EDGE_WEIGHT_STRATEGY,
             # SA expanded sets for checkbox groups
@@ -165,6 +175,9 @@ class OperationsView(View):
                     key=lambda kv: kv[1],
                 ),
                 "palette_names": palette_utils.list_palette_names(),
+                "layout_seed_choices": [(net_layout.LAYOUT_SEED_AUTO, "Auto"), *net_layout.LAYOUT_SEED_LABELS.items()],
+                "layout_algorithm_choices": list(net_layout.LAYOUT_ALGORITHM_LABELS.items()),
+                "robustness_null_model_choices": list(net_robustness.NULL_MODEL_LABELS.items()),
                 "ad": ad,
             },
         )
@@ -515,6 +528,8 @@ TASK_ARG_SPECS: dict[str, list[tuple]] = {
         ("csv_unique", "layouts_2d", "--2dlayouts"),
         ("csv_unique", "layouts_3d", "--3dlayouts"),
         ("value", "fa2_iterations", "--fa2-iterations"),
+        ("value", "layout_seed", "--layout-seed"),
+        ("value", "layout_algorithm", "--layout-algorithm"),
         ("value", "startdate", "--startdate"),
         ("value", "enddate", "--enddate"),
         ("flag", "draw_dead_leaves", "--draw-dead-leaves"),
@@ -534,7 +549,11 @@ TASK_ARG_SPECS: dict[str, list[tuple]] = {
         ("value", "edge_weight_strategy", "--edge-weight-strategy"),
         ("value", "recency_weights", "--recency-weights"),
         ("value", "spreading_runs", "--spreading-runs"),
+        ("value", "betweenness_samples", "--betweenness-samples"),
         ("value", "diffusion_window", "--diffusion-window"),
+        ("value", "jobs", "--jobs"),
+        ("value", "cache_size_mb", "--cache-size-mb"),
+        ("inverted_flag", "warm_start_layout", "--no-warm-start-layout"),
         ("flag", "consensus_matrix", "--consensus-matrix"),
         ("flag", "structural_similarity", "--structural-similarity"),
         ("value", "community_distribution_threshold", "--community-distribution-threshold"),
@@ -555,8 +574,11 @@ TASK_ARG_SPECS: dict[str, list[tuple]] = {
         ("robustness_strategies", "--robustness-strategies"),
         ("value", "robustness_runs", "--robustness-runs"),
         ("value", "robustness_null", "--robustness-null"),
+        ("value", "robustness_null_model", "--robustness-null-model"),
         ("value", "robustness_seed", "--robustness-seed"),
         ("value", "robustness_sample", "--robustness-sample"),
+        ("value", "robustness_curve_tolerance", "--robustness-curve-tolerance"),
+        ("value", "robustness_dyn_batch", "--robustness-dyn-batch"),
     ],
     "compare_analysis": [
         ("positional", "project_dir"),
@@ -641,12 +663,18 @@ TASK_DEFAULT_SPECS: dict[str, list[tuple]] = {
         ("include_lost", "scope.include_lost", "bool"),
         ("include_private", "scope.include_private", "bool"),
         ("fa2_iterations", "computation.fa2_iterations", "fa2_iterations"),
+        ("layout_seed", "computation.layout_seed", "value"),
+        ("layout_algorithm", "computation.layout_algorithm", "value"),
         ("community_distribution_threshold", "computation.community_distribution_threshold", "int"),
         ("leiden_coarse_resolution", "computation.leiden_coarse_resolution", "float"),
         ("leiden_fine_resolution", "computation.leiden_fine_resolution", "float"),
         ("mcl_inflation", "computation.mcl_inflation", "float"),
         ("spreading_runs", "computation.spreading_runs", "int"),
+        ("betweenness_samples", "computation.betweenness_samples", "int"),
         ("diffusion_window", "computation.diffusion_window", "int"),
+        ("jobs", "computation.jobs", "int"),
+        ("cache_size_mb", "computation.cache_size_mb", "int"),
+        ("warm_start_layout", "computation.warm_start_layout", "bool"),
         ("layouts_2d", "layouts.two_d", "list"),
         ("layouts_3d", "layouts.three_d", "list"),
         ("measures", "measures.selected", "list"),
@@ -662,8 +690,11 @@ TASK_DEFAULT_SPECS: dict[str, list[tuple]] = {
         ("robustness_strategies", "robustness.strategies", "list_with_enabled"),
         ("robustness_runs", "robustness.runs", "int"),
         ("robustness_null", "robustness.null", "int"),
+        ("robustness_null_model", "robustness.null_model", "value"),
         ("robustness_seed", "robustness.seed", "int"),
         ("robustness_sample", "robustness.sample", "int"),
+        ("robustness_curve_tolerance", "robustness.curve_tolerance", "float"),
+        ("robustness_dyn_batch", "robustness.dyn_batch", "float"),
     ],
 }
 
@@ -37,6 +37,7 @@ from django.db.models.query import QuerySet
 
 from webapp.models import (
     Channel,
+    ChannelEdgeDaily,
     Message,
     MessageAudio,
     MessageOtherMedia,
@@ -148,6 +149,8 @@ def purge(*, dry_run: bool = False) -> PurgeReport:
         )
 
     with transaction.atomic():
+        # The purge is per channel, so every edge row of a purged channel goes stale.
+        ChannelEdgeDaily.objects.filter(channel_id__in=qs.values("channel_id")).delete()
         deleted_total, deleted_by_type = qs.delete()
     deleted_media_rows = sum(
         count for label, count in deleted_by_type.items() if label.startswith("webapp.Message") and "Media" in label
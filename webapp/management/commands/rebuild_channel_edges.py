@@ -0,0 +1,40 @@
+"""Recompute the ``ChannelEdgeDaily`` table from the ``Message`` table.
+
+``structural_analysis`` builds its graphs from ``ChannelEdgeDaily`` — per-day
+forward / mention / message counts — instead of scanning every message. The
+crawler keeps the table up to date as it stores messages; run this command
+after editing messages by any other path (backoffice, manual SQL, restored
+database dumps) or whenever the counts are suspected to be stale.
+
+Usage:
+    python manage.py rebuild_channel_edges
+    python manage.py rebuild_channel_edges --channel 123 --channel 456
+"""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from webapp.models import ChannelEdgeDaily
+
+
+class Command(BaseCommand):
+    help = "Recompute the per-day channel edge counts used by structural_analysis from the message table."
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--channel",
+            action="append",
+            type=int,
+            default=[],
+            metavar="PK",
+            help="Only rebuild the rows of this channel (database id). Repeatable. Default: the whole table.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        channel_ids: list[int] = options["channel"]
+        if channel_ids:
+            written = sum(ChannelEdgeDaily.objects.refresh(channel_id) for channel_id in channel_ids)
+        else:
+            written = ChannelEdgeDaily.objects.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Channel edge table rebuilt: {written:,} rows written."))
@@ -0,0 +1,103 @@
+# Generated by Django 6.0.5 on 2026-10-18 12:08
+
+from itertools import batched
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Exists, F, OuterRef, Q
+from django.db.models.functions import TruncDate
+
+
+def backfill_channel_edges(apps, schema_editor):
+    Message = apps.get_model("webapp", "Message")
+    ChannelEdgeDaily = apps.get_model("webapp", "ChannelEdgeDaily")
+    references_through = Message.references.through
+    alive = Message.objects.filter(is_lost=False).annotate(day=TruncDate("date"))
+    forwarding = alive.filter(forwarded_from_id__isnull=False)
+    citing = alive.filter(
+        Q(forwarded_from_id__isnull=False) | Q(Exists(references_through.objects.filter(message=OuterRef("pk"))))
+    )
+
+    def rows():
+        for kind, qs in (("MESSAGES", alive), ("FORWARDING", forwarding), ("CITING", citing)):
+            for channel_id, day, total in (
+                qs.values("channel_id", "day").annotate(total=Count("pk")).values_list("channel_id", "day", "total")
+            ):
+                yield ChannelEdgeDaily(channel_id=channel_id, day=day, kind=kind, count=total)
+        for channel_id, cited_id, day, total in (
+            forwarding.values("channel_id", "forwarded_from_id", "day")
+            .annotate(total=Count("pk"))
+            .values_list("channel_id", "forwarded_from_id", "day", "total")
+        ):
+            yield ChannelEdgeDaily(
+                channel_id=channel_id, cited_channel_id=cited_id, day=day, kind="FORWARD", count=total
+            )
+        for channel_id, cited_id, day, total in (
+            references_through.objects.filter(message__is_lost=False)
+            .exclude(message__forwarded_from=F("channel"))
+            .annotate(day=TruncDate("message__date"))
+            .values("message__channel_id", "channel_id", "day")
+            .annotate(total=Count("pk"))
+            .values_list("message__channel_id", "channel_id", "day", "total")
+        ):
+            yield ChannelEdgeDaily(
+                channel_id=channel_id, cited_channel_id=cited_id, day=day, kind="MENTION", count=total
+            )
+
+    for batch in batched(rows(), 5000):
+        ChannelEdgeDaily.objects.bulk_create(batch)
+
+
+def clear_channel_edges(apps, schema_editor):
+    apps.get_model("webapp", "ChannelEdgeDaily").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("webapp", "0042_replace_in_target_override_with_to_inspect"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChannelEdgeDaily",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("day", models.DateField(null=True)),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[
+                            ("MESSAGES", "Messages posted"),
+                            ("FORWARDING", "Messages forwarded from any channel"),
+                            ("CITING", "Messages forwarding or mentioning any channel"),
+                            ("FORWARD", "Forwards from the cited channel"),
+                            ("MENTION", "Mentions of the cited channel"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("count", models.PositiveIntegerField()),
+                (
+                    "channel",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="+", to="webapp.channel"
+                    ),
+                ),
+                (
+                    "cited_channel",
+                    models.ForeignKey(
+                        null=True, on_delete=django.db.models.deletion.CASCADE, related_name="+", to="webapp.channel"
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [models.Index(fields=["kind", "channel", "day"], name="webapp_edge_kind_chan_day_idx")],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("channel", "cited_channel", "day", "kind"), name="webapp_edge_daily_key"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_channel_edges, clear_channel_edges),
+    ]
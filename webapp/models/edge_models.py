@@ -0,0 +1,149 @@
+import datetime
+from collections.abc import Iterable, Iterator
+from itertools import batched
+
+from django.db import models, transaction
+from django.db.models import Count, Exists, F, OuterRef, Q
+from django.db.models.functions import TruncDate
+
+from webapp.models.telegram_models import Channel, Message
+
+_BULK_BATCH_SIZE = 5000
+
+
+class ChannelEdgeDailyManager(models.Manager["ChannelEdgeDaily"]):
+    def _aggregate(self, message_q: Q, reference_q: Q) -> Iterator["ChannelEdgeDaily"]:
+        """Yield unsaved rows aggregating the messages matched by ``message_q``.
+
+        ``reference_q`` is the same scope expressed through the
+        ``Message.references`` through-table (``message__`` prefixed paths).
+        """
+        references_through = Message.references.through
+        alive = Message.objects.alive().filter(message_q).annotate(day=TruncDate("date"))
+        has_reference_subq = references_through.objects.filter(message=OuterRef("pk"))
+        per_channel = (
+            (ChannelEdgeDaily.MESSAGES, alive),
+            (ChannelEdgeDaily.FORWARDING, alive.filter(forwarded_from_id__isnull=False)),
+            (
+                ChannelEdgeDaily.CITING,
+                alive.filter(Q(forwarded_from_id__isnull=False) | Q(Exists(has_reference_subq))),
+            ),
+        )
+        for kind, qs in per_channel:
+            for channel_id, day, total in (
+                qs.values("channel_id", "day").annotate(total=Count("pk")).values_list("channel_id", "day", "total")
+            ):
+                yield ChannelEdgeDaily(channel_id=channel_id, day=day, kind=kind, count=total)
+
+        for channel_id, cited_id, day, total in (
+            alive.filter(forwarded_from_id__isnull=False)
+            .values("channel_id", "forwarded_from_id", "day")
+            .annotate(total=Count("pk"))
+            .values_list("channel_id", "forwarded_from_id", "day", "total")
+        ):
+            yield ChannelEdgeDaily(
+                channel_id=channel_id, cited_channel_id=cited_id, day=day, kind=ChannelEdgeDaily.FORWARD, count=total
+            )
+
+        for channel_id, cited_id, day, total in (
+            references_through.objects.filter(reference_q, message__is_lost=False)
+            .exclude(message__forwarded_from=F("channel"))
+            .annotate(day=TruncDate("message__date"))
+            .values("message__channel_id", "channel_id", "day")
+            .annotate(total=Count("pk"))
+            .values_list("message__channel_id", "channel_id", "day", "total")
+        ):
+            yield ChannelEdgeDaily(
+                channel_id=channel_id, cited_channel_id=cited_id, day=day, kind=ChannelEdgeDaily.MENTION, count=total
+            )
+
+    def _write(self, rows: Iterable["ChannelEdgeDaily"]) -> int:
+        written = 0
+        for batch in batched(rows, _BULK_BATCH_SIZE):
+            self.bulk_create(batch)
+            written += len(batch)
+        return written
+
+    def rebuild(self) -> int:
+        """Recompute the whole table from ``Message`` and return the number of rows written."""
+        with transaction.atomic():
+            self.all().delete()
+            return self._write(self._aggregate(Q(), Q()))
+
+    def refresh(self, channel_id: int, days: Iterable[datetime.date | None] | None = None) -> int:
+        """Recompute the rows of one channel, optionally restricted to ``days``.
+
+        ``days`` are local calendar days (the same ones ``date__date`` lookups
+        use); ``None`` inside it stands for messages without a date. Passing
+        ``days=None`` refreshes every day of the channel. Returns the number of
+        rows written.
+        """
+        message_q = Q(channel_id=channel_id)
+        reference_q = Q(message__channel_id=channel_id)
+        rows_q = Q(channel_id=channel_id)
+        if days is not None:
+            day_set = set(days)
+            if not day_set:
+                return 0
+            dated = [d for d in day_set if d is not None]
+            message_day_q = Q(date__date__in=dated)
+            reference_day_q = Q(message__date__date__in=dated)
+            rows_day_q = Q(day__in=dated)
+            if None in day_set:
+                message_day_q |= Q(date__isnull=True)
+                reference_day_q |= Q(message__date__isnull=True)
+                rows_day_q |= Q(day__isnull=True)
+            message_q &= message_day_q
+            reference_q &= reference_day_q
+            rows_q &= rows_day_q
+        with transaction.atomic():
+            self.filter(rows_q).delete()
+            return self._write(self._aggregate(message_q, reference_q))
+
+
+class ChannelEdgeDaily(models.Model):
+    """Per-day message and citation counts materialised from ``Message``.
+
+    ``build_graph`` reads this table instead of scanning every message. Rows
+    of kind ``FORWARD`` / ``MENTION`` count the messages ``channel`` posted on
+    ``day`` that forward from / mention ``cited_channel``; the remaining kinds
+    leave ``cited_channel`` empty and count per-channel totals used as edge
+    weight denominators. ``day`` is the local (``TIME_ZONE``) calendar day of
+    the message, so ``day`` filters behave like the ``date__date`` lookups on
+    ``Message``; recency weighting counts message ages in the same local days.
+
+    Lost messages are excluded. The crawler keeps the table current through
+    ``refresh``; ``manage.py rebuild_channel_edges`` recomputes it from scratch.
+    """
+
+    MESSAGES = "MESSAGES"
+    FORWARDING = "FORWARDING"
+    CITING = "CITING"
+    FORWARD = "FORWARD"
+    MENTION = "MENTION"
+    KIND_CHOICES: tuple[tuple[str, str], ...] = (
+        (MESSAGES, "Messages posted"),
+        (FORWARDING, "Messages forwarded from any channel"),
+        (CITING, "Messages forwarding or mentioning any channel"),
+        (FORWARD, "Forwards from the cited channel"),
+        (MENTION, "Mentions of the cited channel"),
+    )
+
+    channel = models.ForeignKey(Channel, on_delete=models.CASCADE, related_name="+")
+    cited_channel = models.ForeignKey(Channel, on_delete=models.CASCADE, null=True, related_name="+")
+    day = models.DateField(null=True)
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    count = models.PositiveIntegerField()
+
+    objects = ChannelEdgeDailyManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["channel", "cited_channel", "day", "kind"], name="webapp_edge_daily_key"),
+        ]
+        indexes = [
+            models.Index(fields=["kind", "channel", "day"], name="webapp_edge_kind_chan_day_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.kind} {self.channel_id}→{self.cited_channel_id} on {self.day}: {self.count}"
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import datetime
+from io import StringIO
 
 from django.core.paginator import InvalidPage
 from django.test import TestCase
@@ -10,7 +11,7 @@ from django.urls import reverse
 
 from network.graph_builder import channel_network_data
 from webapp.managers import ChannelManager, ChannelQuerySet
-from webapp.models import Channel, Message, Organization
+from webapp.models import Channel, ChannelEdgeDaily, Message, Organization
 from webapp.paginator import DiggPage, DiggPaginator, SoftPaginator
 from webapp.utils.colors import (
     DEFAULT_FALLBACK_COLOR,
@@ -373,6 +374,86 @@ class MessageManagerTests(TestCase):
         self.assertEqual(qs.count(), 1)
 
 
+# ─── ChannelEdgeDaily ──────────────────────────────────────────────────────────
+
+
+class ChannelEdgeDailyTests(TestCase):
+    def setUp(self) -> None:
+        org = Organization.objects.create(name="In target", is_in_target=True)
+        self.ch1 = Channel.objects.create(telegram_id=1, title="Ch1", organization=org)
+        self.ch2 = Channel.objects.create(telegram_id=2, title="Ch2", organization=org)
+        self.day1 = datetime.datetime(2024, 3, 1, 10, tzinfo=datetime.timezone.utc)
+        self.day2 = datetime.datetime(2024, 3, 2, 10, tzinfo=datetime.timezone.utc)
+
+    def _counts(self) -> dict[tuple, int]:
+        return {
+            (row.kind, row.channel_id, row.cited_channel_id, row.day): row.count
+            for row in ChannelEdgeDaily.objects.all()
+        }
+
+    def test_rebuild_counts_each_kind_per_day(self) -> None:
+        Message.objects.create(telegram_id=1, channel=self.ch2, forwarded_from=self.ch1, date=self.day1)
+        Message.objects.create(telegram_id=2, channel=self.ch2, forwarded_from=self.ch1, date=self.day1)
+        mention = Message.objects.create(telegram_id=3, channel=self.ch2, date=self.day2)
+        mention.references.add(self.ch1)
+        Message.objects.create(telegram_id=4, channel=self.ch2, date=self.day2)
+        Message.objects.create(telegram_id=5, channel=self.ch2, forwarded_from=self.ch1, date=self.day2, is_lost=True)
+
+        ChannelEdgeDaily.objects.rebuild()
+
+        d1, d2 = self.day1.date(), self.day2.date()
+        ch1, ch2 = self.ch1.pk, self.ch2.pk
+        self.assertEqual(
+            self._counts(),
+            {
+                ("MESSAGES", ch2, None, d1): 2,
+                ("MESSAGES", ch2, None, d2): 2,
+                ("FORWARDING", ch2, None, d1): 2,
+                ("CITING", ch2, None, d1): 2,
+                ("CITING", ch2, None, d2): 1,
+                ("FORWARD", ch2, ch1, d1): 2,
+                ("MENTION", ch2, ch1, d2): 1,
+            },
+        )
+
+    def test_mention_of_forward_source_not_counted(self) -> None:
+        msg = Message.objects.create(telegram_id=1, channel=self.ch2, forwarded_from=self.ch1, date=self.day1)
+        msg.references.add(self.ch1)
+        ChannelEdgeDaily.objects.rebuild()
+        self.assertFalse(ChannelEdgeDaily.objects.filter(kind=ChannelEdgeDaily.MENTION).exists())
+
+    def test_refresh_only_touches_requested_days(self) -> None:
+        Message.objects.create(telegram_id=1, channel=self.ch2, forwarded_from=self.ch1, date=self.day1)
+        ChannelEdgeDaily.objects.rebuild()
+        Message.objects.create(telegram_id=2, channel=self.ch2, forwarded_from=self.ch1, date=self.day1)
+        Message.objects.create(telegram_id=3, channel=self.ch2, forwarded_from=self.ch1, date=self.day2)
+
+        ChannelEdgeDaily.objects.refresh(self.ch2.pk, {self.day1.date()})
+
+        counts = self._counts()
+        self.assertEqual(counts[("FORWARD", self.ch2.pk, self.ch1.pk, self.day1.date())], 2)
+        self.assertNotIn(("FORWARD", self.ch2.pk, self.ch1.pk, self.day2.date()), counts)
+
+    def test_refresh_drops_rows_of_lost_messages(self) -> None:
+        msg = Message.objects.create(telegram_id=1, channel=self.ch2, forwarded_from=self.ch1, date=self.day1)
+        ChannelEdgeDaily.objects.rebuild()
+        Message.objects.filter(pk=msg.pk).update(is_lost=True)
+
+        ChannelEdgeDaily.objects.refresh(self.ch2.pk)
+
+        self.assertFalse(ChannelEdgeDaily.objects.exists())
+
+    def test_rebuild_command_replaces_stale_rows(self) -> None:
+        from django.core.management import call_command
+
+        ChannelEdgeDaily.objects.create(channel=self.ch1, day=self.day1.date(), kind="MESSAGES", count=99)
+        Message.objects.create(telegram_id=1, channel=self.ch2, date=self.day1)
+
+        call_command("rebuild_channel_edges", stdout=StringIO())
+
+        self.assertEqual(self._counts(), {("MESSAGES", self.ch2.pk, None, self.day1.date()): 1})
+
+
 # ─── Channel model ─────────────────────────────────────────────────────────────
 
 
@@ -1023,6 +1104,14 @@ class PurgeOutOfTargetTests(TestCase):
         self.assertEqual(report.candidate_media_files, 1)
         self.assertEqual(report.deleted_messages, 0)
 
+    def test_edge_rows_of_purged_channels_removed(self) -> None:
+        ChannelEdgeDaily.objects.rebuild()
+        self._run_purge()
+        remaining = set(ChannelEdgeDaily.objects.values_list("channel_id", flat=True))
+        self.assertNotIn(self.purgeable.pk, remaining)
+        self.assertNotIn(self.mention_target.pk, remaining)
+        self.assertIn(self.healthy.pk, remaining)
+
     def test_marked_in_target_kept_even_when_lost_or_private_or_wrong_type(self) -> None:
         """Bug 1 fix: lost/private/wrong-type channels still keep their messages."""
         self._run_purge()
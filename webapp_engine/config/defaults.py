@@ -92,12 +92,18 @@ STRUCTURAL_DEFAULTS: dict = {
     },
     "computation": {
         "fa2_iterations": "7x",
+        "layout_seed": "AUTO",
+        "layout_algorithm": "FA2",
         "community_distribution_threshold": 10,
         "leiden_coarse_resolution": 0.01,
         "leiden_fine_resolution": 0.05,
         "mcl_inflation": 2.0,
         "spreading_runs": 200,
+        "betweenness_samples": 0,
         "diffusion_window": 30,
+        "jobs": 1,
+        "cache_size_mb": 1024,
+        "warm_start_layout": True,
     },
     "layouts": {
         "two_d": ["FA2"],
@@ -126,7 +132,10 @@ STRUCTURAL_DEFAULTS: dict = {
         "strategies": ["RANDOM", "IN_STRENGTH", "OUT_STRENGTH", "PAGERANK", "BETWEENNESS"],
         "runs": 100,
         "null": 20,
+        "null_model": "WEIGHTS",
         "seed": 42,
         "sample": 500,
+        "curve_tolerance": 0.0,
+        "dyn_batch": 1,
     },
 }
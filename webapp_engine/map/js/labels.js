@@ -22,6 +22,7 @@ export function strategy_label(key) {
 // Short labels shown in info-bar chips — kept terse so chips stay compact.
 export var LAYOUT_LABELS = {
     fa2:             'FA2',
+    multilevel:      'Multilevel FA2',
     circular:        'Circular',
     kamada_kawai:    'Kamada-Kawai',
     community_shell: 'Community shells',
@@ -36,6 +37,7 @@ export var LAYOUT_LABELS = {
 // the dropdown only renders entries listed in window.EXTRA_LAYOUTS / EXTRA_LAYOUTS_3D.
 export var LAYOUT_LONG_LABELS = {
     fa2:             'Force Atlas 2',
+    multilevel:      'Multilevel Force Atlas 2',
     circular:        'Circular',
     kamada_kawai:    'Kamada-Kawai',
     community_shell: 'Community shells',
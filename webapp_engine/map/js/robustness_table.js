@@ -108,6 +108,12 @@ function _fmtFc(fc) {
     return fc === null || fc === undefined ? "—" : fc.toFixed(3);
 }
 
+// "± e" suffix for values read off an adaptive-grid curve (curve_tolerance > 0).
+function _fmtError(err, dp) {
+    if (err === null) return " ± ?";
+    return err ? " ± " + err.toFixed(dp) : "";
+}
+
 function _orderedStrategies(payload) {
     var present = new Set(Object.keys(payload.strategies || {}));
     var ordered = [];
@@ -137,9 +143,18 @@ function _renderHeaderSummary(payload) {
         g.n + " nodes / " + g.m + " edges",
         g.filtered ? "backbone " + g.backbone_n + "/" + g.backbone_m + " edges (α=" + c.alpha + ")" : "no disparity filter",
         Object.keys(payload.strategies || {}).length + " strategies",
-        c.n_null > 0 ? c.n_null + " null simulations" : "no null model",
+        c.n_null > 0
+            ? c.n_null + (c.null_model === "STRENGTH" ? " strength-preserving" : " weight-shuffling") + " null simulations"
+            : "no null model",
         "seed=" + c.seed,
     ];
+    if (c.curve_tolerance > 0) {
+        parts.push("SCC/REACH curves on an adaptive grid (R tolerance " + c.curve_tolerance + ")");
+    }
+    if (c.dyn_batch && c.dyn_batch !== 1) {
+        parts.push("dynamic strategies re-ranked every " +
+            (c.dyn_batch < 1 ? (c.dyn_batch * 100) + "% of the channels" : c.dyn_batch + " removals"));
+    }
     if (payload.efficiency && payload.efficiency.baseline !== undefined) {
         parts.push("baseline efficiency=" + _fmt(payload.efficiency.baseline, 3));
     }
@@ -178,14 +193,14 @@ function _renderSummaryTable(payload) {
             var cells = [
                 "<td>" + _labelOf(payload, s) + "</td>",
                 "<td><code>" + _METRIC_LABEL[m] + "</code></td>",
-                "<td class=\"text-end\">" + _fmt(r) + "</td>",
+                "<td class=\"text-end\">" + _fmt(r) + _fmtError(p["r_" + m + "_error"], 4) + "</td>",
             ];
             if (hasNull) {
                 cells.push("<td class=\"text-end\">" + _fmt(nullM.mean) + "</td>");
                 cells.push("<td class=\"text-end\">" + _fmt(nullM.std) + "</td>");
                 cells.push("<td class=\"text-end\">" + _fmtZ(nullM.z) + "</td>");
             }
-            cells.push("<td class=\"text-end\">" + _fmtFc(fc) + "</td>");
+            cells.push("<td class=\"text-end\">" + _fmtFc(fc) + _fmtError(p["fc_" + m + "_error"], 3) + "</td>");
             rows.push("<tr>" + cells.join("") + "</tr>");
         });
     });
@@ -374,6 +374,8 @@ SA_OUTPUT_CSV = _structural.outputs.csv
 SA_SEO = _structural.outputs.seo
 SA_VERTICAL_LAYOUT = _structural.outputs.vertical_layout
 SA_FA2_ITERATIONS = _structural.computation.fa2_iterations
+SA_LAYOUT_SEED = _structural.computation.layout_seed
+SA_LAYOUT_ALGORITHM = _structural.computation.layout_algorithm
 SA_LAYOUTS_2D = ",".join(_structural.layouts.two_d)
 SA_LAYOUTS_3D = ",".join(_structural.layouts.three_d)
 SA_MEASURES = ",".join(_structural.measures.selected)
@@ -385,7 +387,15 @@ SA_INCLUDE_SELF_REFERENCES = _structural.edges.include_self_references
 SA_EDGE_WEIGHT_STRATEGY = _structural.edges.weight_strategy
 SA_RECENCY_WEIGHTS = optional_int(_structural.edges.recency_weights)
 SA_SPREADING_RUNS = _structural.computation.spreading_runs
+SA_BETWEENNESS_SAMPLES = _structural.computation.betweenness_samples
 SA_DIFFUSION_WINDOW = _structural.computation.diffusion_window
+SA_JOBS = _structural.computation.jobs
+# Test runs never touch the on-disk result cache unless a test enables it.
+SA_CACHE_SIZE_MB = 0 if _RUNNING_TESTS else _structural.computation.cache_size_mb
+SA_CACHE_DIR = BASE_DIR / "tmp" / "structural-cache"
+# Likewise, test runs always lay out from scratch.
+SA_WARM_START_LAYOUT = False if _RUNNING_TESTS else _structural.computation.warm_start_layout
+SA_LAYOUT_CACHE_DIR = BASE_DIR / "tmp" / "layout-cache"
 SA_DRAW_DEAD_LEAVES = _structural.outputs.draw_dead_leaves
 SA_STRUCTURAL_SIMILARITY = _structural.outputs.structural_similarity
 SA_CONSENSUS_MATRIX = _structural.outputs.consensus_matrix
@@ -408,6 +418,9 @@ SA_ROBUSTNESS_RUNS = _structural.robustness.runs
 SA_ROBUSTNESS_NULL = _structural.robustness.null
 SA_ROBUSTNESS_SEED = _structural.robustness.seed
 SA_ROBUSTNESS_SAMPLE = _structural.robustness.sample
+SA_ROBUSTNESS_CURVE_TOLERANCE = _structural.robustness.curve_tolerance
+SA_ROBUSTNESS_DYN_BATCH = _structural.robustness.dyn_batch
+SA_ROBUSTNESS_NULL_MODEL = _structural.robustness.null_model
 
 # ── System constants (.system — managed by project, do not edit) ─────────────
 